@@ -2,12 +2,22 @@
 
 import sys
 
+# Imports for choosing between the user interface and the service
+import argparse
+import asyncio
+
 # Import for initializing the window of the user interface
 from tkinter import Tk
 
 # Import used classes
 from classes.matrix import Matrix
+from classes.box_filter import BoxFilter
+from classes.recursive_gaussian_filter import RecursiveGaussianFilter
 from classes.user_interface import UserInterface
+from classes.edge_detection_service import EdgeDetectionService
+from classes.service_settings import ServiceSettings
+from classes.backend_registry import BACKENDS, BackendRegistry
+from classes.memory_planner import MemoryPlanner
 
 # Dictionary for the different filters
 DIFFERENTIAL_FILTERS: dict[str, Matrix] = {
@@ -23,11 +33,82 @@ DIFFERENTIAL_FILTERS: dict[str, Matrix] = {
                         [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
                         [-3.0, -13.0, -30.0, -40.0, -30.0, -13.0, -3.0],
                         [-3.0, -11.0, -26.0, -34.0, -26.0, -11.0, -3.0],
-                        [-1.0, -4.0, -9.0, -13.0, -9.0, -4.0, -1.0]])
+                        [-1.0, -4.0, -9.0, -13.0, -9.0, -4.0, -1.0]]),
+    'prewitt_15': BoxFilter.prewitt(15),
+    'gaussian_2': RecursiveGaussianFilter(2.0)
 }
 
 def main() -> int:
     """Execute the project."""
+    parser = argparse.ArgumentParser(description="Edge detection with differential "
+                                                 "filters.")
+    parser.add_argument("--serve", action="store_true",
+                        help="run the local edge detection service instead of the "
+                             "user interface")
+    parser.add_argument("--host", default="127.0.0.1", help="host of the service")
+    parser.add_argument("--port", type=int, default=8080, help="port of the service")
+    parser.add_argument("--socket", default=None,
+                        help="Unix socket of the service instead of host and port")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="number of worker processes of the service")
+    parser.add_argument("--batch-size", type=int, default=8,
+                        help="maximum number of images per batch of the service")
+    parser.add_argument("--check-backends", action="store_true",
+                        help="check all backends against the reference backend on "
+                             "all filters and exit")
+    parser.add_argument("--plan", metavar="IMAGE", default=None,
+                        help="differentiate an image tile by tile within the memory "
+                             "budget and report the peak memory")
+    parser.add_argument("--memory-budget", type=float, default=256.0,
+                        help="memory budget of --plan in MiB")
+    parser.add_argument("--output", default=None,
+                        help="directory the edge maps of --plan are written to")
+    arguments = parser.parse_args()
+
+    if arguments.plan is not None:
+        # Differentiate the image with all filters within the memory budget
+        planner = MemoryPlanner(int(arguments.memory_budget * (1 << 20)))
+
+        try:
+            planner.run(arguments.plan, DIFFERENTIAL_FILTERS, arguments.output)
+        except MemoryError as error:
+            print(f"Memory budget too small: {error}")
+            return 1
+
+        for key, value in planner.get_report().items():
+            print(f"{key}: {value}")
+
+        return 0 if planner.get_report()['within_budget'] else 1
+
+    if arguments.check_backends:
+        # Compare every available backend with the reference backend
+        conforming: bool = True
+
+        for backend in BACKENDS.get_available():
+            deviation: float = BACKENDS.check_conformance(
+                backend, list(DIFFERENTIAL_FILTERS.values()))
+            conforming = conforming and deviation <= BackendRegistry.TOLERANCE
+            print(f"{backend.get_name()}: deviation {deviation:.3g}, "
+                  f"calibration {BACKENDS.calibrate(backend) * 1000:.3f} ms")
+
+        print(f"selected: {BACKENDS.select().get_name()}")
+
+        return 0 if conforming else 1
+
+    if arguments.serve:
+        # Run the service until it is interrupted
+        service = EdgeDetectionService(
+            DIFFERENTIAL_FILTERS, ServiceSettings(arguments.workers,
+                                                  arguments.batch_size))
+
+        try:
+            asyncio.run(service.serve(arguments.host, arguments.port,
+                                      arguments.socket))
+        except KeyboardInterrupt:
+            pass
+
+        return 0
+
     # Initialize the window
     window = Tk()
 
@@ -0,0 +1,293 @@
+"""File containing the ArrayBackend class."""
+
+# Imports for storing the gray values compactly
+from array import array
+from itertools import chain
+
+# Imports for calculating the absolute values
+import math
+from typing import Callable
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.compute_backend import ComputeBackend
+
+class ArrayBackend(ComputeBackend):
+    """
+    A class representing the backend based on the array module of Python.
+
+    The gray values and results are stored as contiguous float64 arrays, exposed
+    as two-dimensional memoryviews. The filter is applied by adding up shifted
+    rows, one per non-zero value of the filter, so that no objects are created per
+    position. It only uses the standard library.
+
+    Methods
+    -------
+    create_plane
+        Convert the gray values into a two-dimensional memoryview.
+    create_view
+        Expose a flat array as a two-dimensional memoryview.
+    unpack_view
+        Return the flat array and the shape behind a memoryview.
+    get_weights
+        Return the non-zero values of a filter with their offsets to the centre.
+    get_shifted_row
+        Return the values of a row shifted by a number of columns.
+    correlate
+        Apply a filter centred on all positions of a region.
+    magnitude
+        Calculate the absolute value of the gradients of both directions.
+    to_list
+        Convert a memoryview into nested lists.
+
+    Notes
+    -----
+    The memoryviews support the buffer protocol, so that NumPy can use the results
+    without copying them.
+
+    """
+
+    def __init__(self) -> None:
+        """Construct one ArrayBackend object."""
+        super().__init__("array")
+
+    def create_plane(self, gray_matrix: Matrix) -> memoryview:
+        """
+        Convert the gray values into a two-dimensional memoryview.
+
+        Parameters
+        ----------
+        gray_matrix: Matrix
+            Gray values of the image.
+
+        Returns
+        -------
+        memoryview
+            Gray values of the image.
+
+        """
+        return ArrayBackend.create_view(
+            array("d", chain.from_iterable(gray_matrix.get_values())),
+            (gray_matrix.get_number_of_rows(), gray_matrix.get_number_of_columns()))
+
+    @staticmethod
+    def create_view(values: array, shape: tuple[int, int]) -> memoryview:
+        """
+        Expose a flat array as a two-dimensional memoryview.
+
+        Parameters
+        ----------
+        values: array
+            Values in row-major order.
+        shape: tuple[int, int]
+            Number of rows and columns.
+
+        Returns
+        -------
+        memoryview
+            Two-dimensional view on the values, one-dimensional if there are none.
+
+        """
+        # Memoryviews without values cannot be cast into two dimensions
+        if not values:
+            return memoryview(values)
+
+        return memoryview(values).cast("B").cast("d", list(shape))
+
+    @staticmethod
+    def unpack_view(view: object, name: str) -> tuple[array, tuple[int, int]]:
+        """
+        Return the flat array and the shape behind a memoryview.
+
+        Parameters
+        ----------
+        view: object
+            Memoryview created by create_view.
+        name: str
+            Name of the view used in the error message.
+
+        Returns
+        -------
+        tuple[array, tuple[int, int]]
+            Values in row-major order and the number of rows and columns. Views
+            without values have the shape (0, 0).
+
+        Raises
+        ------
+        TypeError
+            If the view is not a memoryview on an array.
+
+        """
+        if not (isinstance(view, memoryview) and isinstance(view.obj, array)):
+            raise TypeError(f"{name} must be a memoryview on an array.")
+
+        if view.ndim != 2 or view.shape is None:
+            return view.obj, (0, 0)
+
+        return view.obj, (view.shape[0], view.shape[1])
+
+    @staticmethod
+    def get_weights(differential_filter: Matrix) -> list[tuple[int, int, float]]:
+        """
+        Return the non-zero values of a filter with their offsets to the centre.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Filter with an odd number of rows and columns.
+
+        Returns
+        -------
+        list[tuple[int, int, float]]
+            Row offset, column offset and value of each non-zero value in
+            row-major order.
+
+        """
+        half: tuple[int, int] = (differential_filter.get_number_of_rows() // 2,
+                                 differential_filter.get_number_of_columns() // 2)
+
+        return [(row - half[0], col - half[1], value)
+                for row, filter_row in enumerate(differential_filter.get_values())
+                for col, value in enumerate(filter_row) if value != 0]
+
+    @staticmethod
+    def get_shifted_row(values: array, start: int, first: int, width: int,
+                        cols: int) -> array:
+        """
+        Return the values of a row shifted by a number of columns.
+
+        Parameters
+        ----------
+        values: array
+            Values in row-major order.
+        start: int
+            Index of the first value of the row.
+        first: int
+            Column of the first returned value. Columns before the first one
+            continue at the opposite border.
+        width: int
+            Number of returned values.
+        cols: int
+            Number of columns of a row.
+
+        Returns
+        -------
+        array
+            Values of the columns from the first one on.
+
+        """
+        if first >= 0:
+            return values[start + first:start + first + width]
+
+        if first + width > 0:
+            return (values[start + cols + first:start + cols]
+                    + values[start:start + first + width])
+
+        return array("d", (values[start + (first + col) % cols]
+                           for col in range(width)))
+
+    def correlate(self, plane: object, differential_filter: Matrix,
+                  region: tuple[int, int, int, int]) -> memoryview:
+        """
+        Apply a filter centred on all positions of a region.
+
+        Parameters
+        ----------
+        plane: object
+            Gray values as a two-dimensional memoryview.
+        differential_filter: Matrix
+            Applied filter with an odd number of rows and columns.
+        region: tuple[int, int, int, int]
+            Region of positions in the format of (first row, row after the last,
+            first column, column after the last).
+
+        Returns
+        -------
+        memoryview
+            Sum of the gray values multiplied with the filter at each position.
+
+        Notes
+        -----
+        The values of the filter are added in the same order as by the reference
+        backend, so that the results are identical.
+
+        """
+        values, (rows, cols) = ArrayBackend.unpack_view(plane, "Plane")
+        shape: tuple[int, int] = (max(region[1] - region[0], 0),
+                                  max(region[3] - region[2], 0))
+        weights: list[tuple[int, int, float]] = ArrayBackend.get_weights(
+            differential_filter)
+        result: array = array("d", bytes(8 * shape[0] * shape[1]))
+
+        for row_count in range(shape[0]):
+            sums: list[float] = [0.0] * shape[1]
+
+            for row_offset, col_offset, value in weights:
+                # Rows before the first one continue at the opposite border
+                sums = [total + value * gray for total, gray in zip(
+                    sums, ArrayBackend.get_shifted_row(
+                        values, ((region[0] + row_count + row_offset) % rows) * cols,
+                        region[2] + col_offset, shape[1], cols))]
+
+            result[row_count * shape[1]:(row_count + 1) * shape[1]] = array("d", sums)
+
+        return ArrayBackend.create_view(result, shape)
+
+    def magnitude(self, gradient_x: object, gradient_y: object,
+                  mode: str = "l2") -> memoryview:
+        """
+        Calculate the absolute value of the gradients of both directions.
+
+        Parameters
+        ----------
+        gradient_x: object
+            Gradients in the x direction as a two-dimensional memoryview.
+        gradient_y: object
+            Gradients in the y direction as a two-dimensional memoryview.
+        mode: str
+            Mode of the absolute value. The default value is 'l2'.
+
+        Returns
+        -------
+        memoryview
+            Absolute value of the gradients of both directions.
+
+        """
+        values_x, shape = ArrayBackend.unpack_view(gradient_x, "Gradients")
+        values_y, _ = ArrayBackend.unpack_view(gradient_y, "Gradients")
+
+        ComputeBackend.check_mode(mode)
+
+        # Absolute value at one position in the respective mode
+        calculate: Callable[[float, float], float] = {
+            "l2": lambda value_x, value_y: math.sqrt(value_x * value_x
+                                                     + value_y * value_y),
+            "l1": lambda value_x, value_y: abs(value_x) + abs(value_y),
+            "max": lambda value_x, value_y: max(abs(value_x), abs(value_y)),
+            "alpha_max_beta_min": lambda value_x, value_y: (
+                ComputeBackend.ALPHA * max(abs(value_x), abs(value_y))
+                + ComputeBackend.BETA * min(abs(value_x), abs(value_y)))
+        }[mode]
+
+        result: array = array("d", map(calculate, values_x, values_y))
+
+        return ArrayBackend.create_view(result, shape)
+
+    def to_list(self, result: object) -> list[list[float]]:
+        """
+        Convert a memoryview into nested lists.
+
+        Parameters
+        ----------
+        result: object
+            Result of correlate or magnitude.
+
+        Returns
+        -------
+        list[list[float]]
+            Values of the result.
+
+        """
+        values, (rows, cols) = ArrayBackend.unpack_view(result, "Result")
+
+        return [values[row * cols:(row + 1) * cols].tolist() for row in range(rows)]
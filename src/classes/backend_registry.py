@@ -0,0 +1,359 @@
+"""File containing the BackendRegistry class and the registered backends."""
+
+# Import for overriding the backend with an environment variable
+import os
+
+# Import for timing the backends during the calibration
+import time
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.compute_backend import ComputeBackend
+from classes.reference_backend import ReferenceBackend
+from classes.numpy_backend import NumpyBackend
+from classes.array_backend import ArrayBackend
+
+class BackendRegistry:
+    """
+    A class representing the registry of the backends calculating the gradients.
+
+    Attributes
+    ----------
+    backends: dict[str, ComputeBackend]
+        Registered backends by their names.
+    selected: ComputeBackend | None
+        Backend chosen by select. It is only determined once it is needed for the
+        first time.
+
+    Methods
+    -------
+    register
+        Register a backend under its name.
+    get
+        Return the backend registered under a name.
+    get_available
+        Return all registered backends that can be used in the current installation.
+    select
+        Return the backend used if no backend is given explicitly.
+    calibrate
+        Measure the time a backend needs to apply a filter to a small plane.
+    check_conformance
+        Calculate the largest deviation of a backend from the reference backend.
+    compute_results
+        Calculate the gradients and their absolute values in all modes.
+    get_deviation
+        Calculate the largest relative difference between two results.
+    create_test_matrix
+        Create deterministic gray values used for calibration and conformance.
+
+    Notes
+    -----
+    The environment variable EDGE_DETECTION_BACKEND overrides the selection by
+    calibration.
+
+    """
+
+    # Name of the environment variable overriding the selection
+    ENVIRONMENT_VARIABLE: str = "EDGE_DETECTION_BACKEND"
+
+    # Largest relative deviation from the reference backend of a conforming backend
+    TOLERANCE: float = 1e-12
+
+    # Filter applied during the calibration
+    CALIBRATION_FILTER: Matrix = Matrix([[-1.0, 0.0, 1.0], [-2.0, 0.0, 2.0],
+                                         [-1.0, 0.0, 1.0]])
+
+    def __init__(self, backends: list[ComputeBackend]) -> None:
+        """
+        Construct one BackendRegistry object with the given backends.
+
+        Parameters
+        ----------
+        backends: list[ComputeBackend]
+            Backends to register. The first one is the reference backend.
+
+        """
+        self.backends: dict[str, ComputeBackend] = {}
+        self.selected: ComputeBackend | None = None
+
+        for backend in backends:
+            self.register(backend)
+
+    def register(self, backend: ComputeBackend) -> None:
+        """
+        Register a backend under its name.
+
+        Parameters
+        ----------
+        backend: ComputeBackend
+            Backend to register. A backend with the same name is replaced.
+
+        """
+        self.backends[backend.get_name()] = backend
+        self.selected = None
+
+    def get(self, name: str) -> ComputeBackend:
+        """
+        Return the backend registered under a name.
+
+        Parameters
+        ----------
+        name: str
+            Name of the backend.
+
+        Returns
+        -------
+        ComputeBackend
+            Registered backend.
+
+        Raises
+        ------
+        ValueError
+            If no backend is registered under the name or it is not available.
+
+        """
+        if name not in self.backends:
+            raise ValueError(f"Unknown backend '{name}', expected one of "
+                             f"{', '.join(self.backends)}.")
+        if not self.backends[name].is_available():
+            raise ValueError(f"Backend '{name}' is not available.")
+
+        return self.backends[name]
+
+    def get_available(self) -> list[ComputeBackend]:
+        """
+        Return all registered backends that can be used in the current installation.
+
+        Returns
+        -------
+        list[ComputeBackend]
+            Available backends in the order of their registration.
+
+        """
+        return [backend for backend in self.backends.values()
+                if backend.is_available()]
+
+    def select(self, name: str | None = None) -> ComputeBackend:
+        """
+        Return the backend used if no backend is given explicitly.
+
+        Parameters
+        ----------
+        name: str | None
+            Name of the backend. The default value is None, indicating that the
+            environment variable is used or, if it is not set, the fastest
+            available backend conforming to the reference backend.
+
+        Returns
+        -------
+        ComputeBackend
+            Selected backend. The result of the calibration is kept.
+
+        """
+        if name is None:
+            name = os.environ.get(BackendRegistry.ENVIRONMENT_VARIABLE) or None
+
+        if name is not None:
+            return self.get(name)
+
+        if self.selected is None:
+            # Time every conforming backend and keep the fastest one
+            timings: dict[str, float] = {
+                backend.get_name(): self.calibrate(backend)
+                for backend in self.get_available()
+                if self.check_conformance(
+                    backend, [BackendRegistry.CALIBRATION_FILTER])
+                <= BackendRegistry.TOLERANCE}
+
+            self.selected = self.backends[min(timings, key=timings.__getitem__)]
+
+        return self.selected
+
+    def calibrate(self, backend: ComputeBackend, size: int = 32,
+                  repetitions: int = 3) -> float:
+        """
+        Measure the time a backend needs to apply a filter to a small plane.
+
+        Parameters
+        ----------
+        backend: ComputeBackend
+            Backend to measure.
+        size: int
+            Number of rows and columns of the plane. The default value is 32.
+        repetitions: int
+            Number of measurements of which the fastest one is used. The default
+            value is 3.
+
+        Returns
+        -------
+        float
+            Shortest time in seconds.
+
+        """
+        plane: object = backend.create_plane(BackendRegistry.create_test_matrix(size))
+        region: tuple[int, int, int, int] = (0, size - 1, 0, size - 1)
+        timings: list[float] = []
+
+        for _ in range(repetitions):
+            start: float = time.perf_counter()
+            backend.magnitude(
+                backend.correlate(plane, BackendRegistry.CALIBRATION_FILTER, region),
+                backend.correlate(plane, BackendRegistry.CALIBRATION_FILTER.transpose(),
+                                  region))
+            timings.append(time.perf_counter() - start)
+
+        return min(timings)
+
+    def check_conformance(self, backend: ComputeBackend, filters: list[Matrix],
+                          size: int = 16) -> float:
+        """
+        Calculate the largest deviation of a backend from the reference backend.
+
+        Every filter and its transpose is applied to all positions of a plane
+        whose windows end inside of it, including the ones whose windows continue
+        at the opposite upper or left border. The absolute values are compared in
+        all modes.
+
+        Parameters
+        ----------
+        backend: ComputeBackend
+            Backend to check.
+        filters: list[Matrix]
+            Applied filters.
+        size: int
+            Number of rows and columns of the plane. It should be larger than the
+            filters. The default value is 16.
+
+        Returns
+        -------
+        deviation: float
+            Largest difference of the gradients and their absolute values relative
+            to the absolute value of the reference, if it is greater than 1. It is
+            0.0 if the backend calculates exactly the same results.
+
+        Raises
+        ------
+        ValueError
+            If a result of the backend does not have the shape of the reference.
+
+        Notes
+        -----
+        The absolute values may differ in the last digit, as the reference backend
+        calculates the square root as a power.
+
+        """
+        reference: ComputeBackend = next(iter(self.backends.values()))
+        gray_matrix: Matrix = BackendRegistry.create_test_matrix(size)
+        planes: tuple[object, object] = (reference.create_plane(gray_matrix),
+                                         backend.create_plane(gray_matrix))
+        deviation: float = 0.0
+
+        for differential_filter in filters:
+            # Windows may only continue at the opposite border at the upper and left
+            end: int = size - max(differential_filter.get_number_of_rows(),
+                                  differential_filter.get_number_of_columns()) // 2
+            region: tuple[int, int, int, int] = (0, end, 0, end)
+
+            # Calculate both directions and the absolute values with both backends
+            for expected, actual in zip(
+                    BackendRegistry.compute_results(reference, planes[0],
+                                                    differential_filter, region),
+                    BackendRegistry.compute_results(backend, planes[1],
+                                                    differential_filter, region),
+                    strict=True):
+                deviation = max(deviation,
+                                BackendRegistry.get_deviation(expected, actual))
+
+        return deviation
+
+    @staticmethod
+    def compute_results(backend: ComputeBackend, plane: object,
+                        differential_filter: Matrix,
+                        region: tuple[int, int, int, int]) -> list[list[list[float]]]:
+        """
+        Calculate the gradients and their absolute values in all modes.
+
+        Parameters
+        ----------
+        backend: ComputeBackend
+            Backend calculating the results.
+        plane: object
+            Gray values in the representation of the backend.
+        differential_filter: Matrix
+            Applied filter, its transpose is applied for the y direction.
+        region: tuple[int, int, int, int]
+            Region of positions in the format of (first row, row after the last,
+            first column, column after the last).
+
+        Returns
+        -------
+        list[list[list[float]]]
+            Gradients of both directions followed by the absolute values in the
+            order of ComputeBackend.MAGNITUDE_MODES, each as nested lists.
+
+        """
+        gradient_x: object = backend.correlate(plane, differential_filter, region)
+        gradient_y: object = backend.correlate(plane, differential_filter.transpose(),
+                                               region)
+
+        return ([backend.to_list(gradient_x), backend.to_list(gradient_y)]
+                + [backend.to_list(backend.magnitude(gradient_x, gradient_y, mode))
+                   for mode in ComputeBackend.MAGNITUDE_MODES])
+
+    @staticmethod
+    def get_deviation(expected: list[list[float]], actual: list[list[float]]) -> float:
+        """
+        Calculate the largest relative difference between two results.
+
+        Parameters
+        ----------
+        expected: list[list[float]]
+            Result of the reference backend.
+        actual: list[list[float]]
+            Result of the checked backend.
+
+        Returns
+        -------
+        float
+            Largest difference relative to the absolute value of the expected
+            value, if it is greater than 1.
+
+        Raises
+        ------
+        ValueError
+            If the results do not have the same shape.
+
+        """
+        if len(expected) != len(actual) or any(
+                len(row_expected) != len(row_actual)
+                for row_expected, row_actual in zip(expected, actual)):
+            raise ValueError("Results of the backends differ in shape.")
+
+        return max((abs(value_expected - value_actual) / max(abs(value_expected), 1.0)
+                    for row_expected, row_actual in zip(expected, actual)
+                    for value_expected, value_actual in zip(row_expected, row_actual)),
+                   default=0.0)
+
+    @staticmethod
+    def create_test_matrix(size: int) -> Matrix:
+        """
+        Create deterministic gray values used for calibration and conformance.
+
+        Parameters
+        ----------
+        size: int
+            Number of rows and columns.
+
+        Returns
+        -------
+        Matrix
+            Gray values between 0 and 255.
+
+        """
+        return Matrix([[float((row * 37 + col * 101 + row * col) % 256)
+                        for col in range(size)] for row in range(size)])
+
+
+# Registry of all backends, the reference backend first
+BACKENDS: BackendRegistry = BackendRegistry([ReferenceBackend(), NumpyBackend(),
+                                             ArrayBackend()])
@@ -0,0 +1,216 @@
+"""File containing the BatchProcessor class."""
+
+# Import for the return type of the generator
+from typing import Iterator
+
+# Import for stacking the gray values of many images
+import numpy as np
+
+# Import used classes
+from classes.image import Image
+from classes.filter_bank import FilterBank
+from classes.workspace_arena import WorkspaceArena
+from classes.border_options import BorderOptions
+
+class BatchProcessor:
+    """
+    A class representing the edge detection on many images of the same size.
+
+    The gray values of a batch of images are stacked into one array of the shape
+    (number of images, rows, columns) and all filters are applied to the entire
+    stack at once as one FilterBank.
+
+    Attributes
+    ----------
+    filter_bank: FilterBank
+        Fused filters applied to each batch.
+    batch_size: int
+        Maximum number of images stacked into one array.
+    options: BorderOptions
+        Border mode, value outside the images and arena reused by all batches.
+
+    Methods
+    -------
+    get_batch_size
+        Return the maximum number of images stacked into one array.
+    stack_planes
+        Stack the gray values of images of the same size.
+    apply
+        Calculate the absolute values of the gradients of a stack of images.
+    process
+        Read images and calculate their edge maps batch by batch.
+    process_batch
+        Calculate the edge maps of one batch of decoded images.
+
+    Notes
+    -----
+    In the border mode 'wrap', the edge maps are equal to the ones of
+    Image.compute_magnitude.
+
+    """
+
+    def __init__(self, filter_bank: FilterBank, batch_size: int = 16,
+                 options: BorderOptions | None = None) -> None:
+        """
+        Construct one BatchProcessor object with the given attributes.
+
+        Parameters
+        ----------
+        filter_bank: FilterBank
+            Fused filters applied to each batch, including the mode of the
+            absolute value.
+        batch_size: int
+            Maximum number of images stacked into one array. The default value is
+            16.
+        options: BorderOptions | None
+            Border mode, value outside the images and arena reused by all batches,
+            so that batches of the same size allocate no buffers. The edge maps of
+            a batch are then only valid until the next one is processed. The
+            default value is None, indicating the mode 'wrap' and a new arena for
+            each batch.
+
+        Raises
+        ------
+        ValueError
+            If the batch size is not positive.
+
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive.")
+
+        self.filter_bank: FilterBank = filter_bank
+        self.batch_size: int = batch_size
+        self.options: BorderOptions = BorderOptions() if options is None else options
+
+    def get_batch_size(self) -> int:
+        """
+        Return the maximum number of images stacked into one array.
+
+        Returns
+        -------
+        self.batch_size: int
+            Maximum number of images stacked into one array.
+
+        """
+        return self.batch_size
+
+    @staticmethod
+    def stack_planes(gray_planes: list[np.ndarray],
+                     arena: WorkspaceArena | None = None) -> np.ndarray:
+        """
+        Stack the gray values of images of the same size.
+
+        Parameters
+        ----------
+        gray_planes: list[np.ndarray]
+            Gray values of each image.
+        arena: WorkspaceArena | None
+            Arena providing the buffer of the stack. The default value is None,
+            indicating that a new array is created.
+
+        Returns
+        -------
+        np.ndarray
+            Gray values as float64 in the shape (number of images, rows, columns).
+
+        Raises
+        ------
+        ValueError
+            If the images do not have the same size.
+
+        """
+        if len({np.shape(gray_plane) for gray_plane in gray_planes}) > 1:
+            raise ValueError("All images of a batch must have the same size.")
+
+        if arena is None:
+            return np.stack(gray_planes).astype(np.float64)
+
+        stack: np.ndarray = arena.get_buffer(
+            "stack", (len(gray_planes),) + np.shape(gray_planes[0]))
+
+        for index, gray_plane in enumerate(gray_planes):
+            stack[index] = gray_plane
+
+        return stack
+
+    def apply(self, stack: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Calculate the absolute values of the gradients of a stack of images.
+
+        Parameters
+        ----------
+        stack: np.ndarray
+            Gray values in the shape (number of images, rows, columns).
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Absolute values of the gradients of each filter in the shape (number
+            of images, rows, columns), see FilterBank.get_output_shape.
+
+        """
+        return self.filter_bank.apply(stack, self.options)
+
+    def process(self, paths_to_images: list[str]
+                ) -> Iterator[tuple[str, dict[str, np.ndarray]]]:
+        """
+        Read images and calculate their edge maps batch by batch.
+
+        A batch is completed once it holds the maximum number of images or the
+        next image has a different size.
+
+        Parameters
+        ----------
+        paths_to_images: list[str]
+            Paths to the images, read in grayscale mode.
+
+        Yields
+        ------
+        tuple[str, dict[str, np.ndarray]]
+            Path to each image and its edge maps by the names of the filters, in
+            the order of the paths.
+
+        """
+        paths: list[str] = []
+        gray_planes: list[np.ndarray] = []
+
+        for path_to_image in paths_to_images:
+            gray_plane: np.ndarray = Image.decode_luminance(path_to_image)
+
+            # Process the collected images before starting a new batch
+            if gray_planes and (len(gray_planes) == self.batch_size
+                                or gray_plane.shape != gray_planes[0].shape):
+                yield from self.process_batch(paths, gray_planes)
+                paths, gray_planes = [], []
+
+            paths.append(path_to_image)
+            gray_planes.append(gray_plane)
+
+        # Process the last batch
+        if gray_planes:
+            yield from self.process_batch(paths, gray_planes)
+
+    def process_batch(self, paths: list[str], gray_planes: list[np.ndarray]
+                      ) -> Iterator[tuple[str, dict[str, np.ndarray]]]:
+        """
+        Calculate the edge maps of one batch of decoded images.
+
+        Parameters
+        ----------
+        paths: list[str]
+            Paths to the images of the batch.
+        gray_planes: list[np.ndarray]
+            Gray values of each image, all of the same size.
+
+        Yields
+        ------
+        tuple[str, dict[str, np.ndarray]]
+            Path to each image and its edge maps by the names of the filters, in
+            the order of the paths.
+
+        """
+        edge_maps: dict[str, np.ndarray] = self.apply(
+            BatchProcessor.stack_planes(gray_planes, self.options.arena))
+
+        for index, path in enumerate(paths):
+            yield path, {name: edge_map[index] for name, edge_map in edge_maps.items()}
@@ -0,0 +1,39 @@
+"""File containing the BorderOptions class."""
+
+# Import for generating the constructor of the options
+from dataclasses import dataclass
+
+# Import used classes
+from classes.workspace_arena import WorkspaceArena
+
+@dataclass(frozen=True)
+class BorderOptions:
+    """
+    A class representing how filters handle the border of padded images.
+
+    Attributes
+    ----------
+    border_mode: str
+        Border mode, see WorkspaceArena. The default value is 'wrap', in which the
+        windows at the upper and left border continue at the opposite border.
+    constant_value: float
+        Gray value outside the images in the border mode 'constant'. The default
+        value is 0.
+    arena: WorkspaceArena | None
+        Arena providing the buffers, reused by successive calls. The default value
+        is None, indicating that each call uses a new one.
+
+    Raises
+    ------
+    ValueError
+        If the border mode is not supported.
+
+    """
+
+    border_mode: str = "wrap"
+    constant_value: float = 0.0
+    arena: WorkspaceArena | None = None
+
+    def __post_init__(self) -> None:
+        """Check the options after they are set."""
+        WorkspaceArena.check_border_mode(self.border_mode)
@@ -0,0 +1,148 @@
+"""File containing the BoxFilter class."""
+
+# Import for referencing BoxFilter class before creation
+from __future__ import annotations
+
+# Import used classes
+from classes.matrix import Matrix
+
+class BoxFilter(Matrix):
+    """
+    A class representing a filter composed of weighted boxes of constant values.
+
+    Besides the values of the filter, the boxes are kept, so that the filter can
+    be applied with an integral image at a cost independent of its size.
+
+    Attributes
+    ----------
+    values: list[list[float]]
+        Values stored in the matrix, i.e. the sum of all weighted boxes.
+    boxes: list[tuple[float, int, int, int, int]]
+        Boxes in the format of (weight, first row, row after the last,
+        first column, column after the last).
+
+    Methods
+    -------
+    get_boxes
+        Return the boxes of the filter.
+    transpose
+        Transpose the filter and its boxes and return them as a new filter.
+    prewitt
+        Create a Prewitt-like filter of any size.
+    to_string
+        Format the filter into a short description.
+
+    """
+
+    def __init__(self, size: tuple[int, int],
+                 boxes: list[tuple[float, int, int, int, int]]) -> None:
+        """
+        Construct one BoxFilter object with the given arguments.
+
+        Parameters
+        ----------
+        size: tuple[int, int]
+            Size of the filter (Number of rows, Number of columns).
+        boxes: list[tuple[float, int, int, int, int]]
+            Boxes in the format of (weight, first row, row after the last,
+            first column, column after the last).
+
+        Raises
+        ------
+        ValueError
+            If a box exceeds the size of the filter.
+
+        """
+        values: list[list[float]] = [[0.0] * size[1] for _ in range(size[0])]
+
+        for weight, first_row, last_row, first_col, last_col in boxes:
+            if not (0 <= first_row <= last_row <= size[0]
+                    and 0 <= first_col <= last_col <= size[1]):
+                raise ValueError("Boxes must lie inside the filter.")
+
+            for row in range(first_row, last_row):
+                for col in range(first_col, last_col):
+                    values[row][col] += weight
+
+        super().__init__(values)
+        self.boxes: list[tuple[float, int, int, int, int]] = boxes
+
+    def get_boxes(self) -> list[tuple[float, int, int, int, int]]:
+        """
+        Return the boxes of the filter.
+
+        Returns
+        -------
+        self.boxes: list[tuple[float, int, int, int, int]]
+            Boxes in the format of (weight, first row, row after the last,
+            first column, column after the last).
+
+        """
+        return self.boxes
+
+    def transpose(self) -> BoxFilter:
+        """
+        Transpose the filter and its boxes and return them as a new filter.
+
+        Returns
+        -------
+        filter_transposed: BoxFilter
+            Filter with transposed values and boxes.
+
+        """
+        filter_transposed: BoxFilter = BoxFilter(
+            (self.get_number_of_columns(), self.get_number_of_rows()),
+            [(weight, first_col, last_col, first_row, last_row)
+             for weight, first_row, last_row, first_col, last_col in self.boxes])
+
+        return filter_transposed
+
+    @staticmethod
+    def prewitt(size: int) -> BoxFilter:
+        """
+        Create a Prewitt-like filter of any size.
+
+        All columns left of the centre are -1 and all columns right of it are 1,
+        so that the filter of size 3 equals the Prewitt filter.
+
+        Parameters
+        ----------
+        size: int
+            Number of rows and columns of the filter.
+
+        Returns
+        -------
+        prewitt_filter: BoxFilter
+            Newly created filter consisting of two boxes.
+
+        Raises
+        ------
+        ValueError
+            If the size is not an odd number of at least 3.
+
+        """
+        if size < 3 or size % 2 == 0:
+            raise ValueError("Size must be an odd number of at least 3.")
+
+        prewitt_filter: BoxFilter = BoxFilter((size, size), [
+            (-1.0, 0, size, 0, size // 2), (1.0, 0, size, size // 2 + 1, size)])
+
+        return prewitt_filter
+
+    def to_string(self) -> str:
+        """
+        Format the filter into a short description.
+
+        Returns
+        -------
+        str
+            Size and boxes of the filter, as the values of large filters do not fit
+            onto the window.
+
+        """
+        boxes: list[str] = [
+            f"{weight:+.1f} * [{first_row}:{last_row}, {first_col}:{last_col}]"
+            for weight, first_row, last_row, first_col, last_col in self.boxes]
+
+        return (f"Box filter {self.get_number_of_rows()}x"
+                f"{self.get_number_of_columns()}\n" + "\n".join(boxes))
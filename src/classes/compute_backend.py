@@ -0,0 +1,209 @@
+"""File containing the ComputeBackend class."""
+
+# Import used classes
+from classes.matrix import Matrix
+
+class ComputeBackend:
+    """
+    A class representing the interface of the backends calculating the gradients.
+
+    Every backend works on its own representation of the gray values (plane) and
+    of the results, which are only converted at the boundaries.
+
+    Attributes
+    ----------
+    name: str
+        Name under which the backend is registered.
+
+    Methods
+    -------
+    check_mode
+        Check whether a mode of the absolute value is supported.
+    get_name
+        Return the name of the backend.
+    is_available
+        Check whether the backend can be used in the current installation.
+    create_plane
+        Convert the gray values into the representation of the backend.
+    correlate
+        Apply a filter centred on all positions of a region.
+    magnitude
+        Calculate the absolute value of the gradients of both directions.
+    to_list
+        Convert a result of the backend into nested lists.
+
+    Notes
+    -----
+    The absolute value of the gradients is calculated in one of the modes 'l2'
+    (Euclidean norm), 'l1' (sum of the absolute values), 'max' (maximum norm) or
+    'alpha_max_beta_min' (alpha times the larger plus beta times the smaller
+    absolute value, approximating the Euclidean norm within 4 % without a square
+    root).
+
+    The window of the position (row, column) is centred on the same position of
+    the gray values. Windows at the upper and left border continue at the opposite
+    border.
+
+    """
+
+    # Supported modes of the absolute value of the gradients
+    MAGNITUDE_MODES: tuple[str, ...] = ("l2", "l1", "max", "alpha_max_beta_min")
+
+    # Factors of the alpha max plus beta min approximation with the smallest error
+    ALPHA: float = 0.96043387010342
+    BETA: float = 0.39782473475826
+
+    def __init__(self, name: str) -> None:
+        """
+        Construct one ComputeBackend object with the given attribute.
+
+        Parameters
+        ----------
+        name: str
+            Name under which the backend is registered.
+
+        """
+        self.name: str = name
+
+    @staticmethod
+    def check_mode(mode: str) -> None:
+        """
+        Check whether a mode of the absolute value is supported.
+
+        Parameters
+        ----------
+        mode: str
+            Mode of the absolute value.
+
+        Raises
+        ------
+        ValueError
+            If the mode is not supported.
+
+        """
+        if mode not in ComputeBackend.MAGNITUDE_MODES:
+            raise ValueError(f"Unknown mode '{mode}', expected one of "
+                             f"{', '.join(ComputeBackend.MAGNITUDE_MODES)}.")
+
+    def get_name(self) -> str:
+        """
+        Return the name of the backend.
+
+        Returns
+        -------
+        self.name: str
+            Name under which the backend is registered.
+
+        """
+        return self.name
+
+    def is_available(self) -> bool:
+        """
+        Check whether the backend can be used in the current installation.
+
+        Returns
+        -------
+        bool
+            True if all dependencies of the backend are installed, otherwise False.
+
+        """
+        return True
+
+    def create_plane(self, gray_matrix: Matrix) -> object:
+        """
+        Convert the gray values into the representation of the backend.
+
+        Parameters
+        ----------
+        gray_matrix: Matrix
+            Gray values of the image.
+
+        Returns
+        -------
+        object
+            Gray values in the representation of the backend.
+
+        Raises
+        ------
+        NotImplementedError
+            If the backend does not implement the method.
+
+        """
+        raise NotImplementedError
+
+    def correlate(self, plane: object, differential_filter: Matrix,
+                  region: tuple[int, int, int, int]) -> object:
+        """
+        Apply a filter centred on all positions of a region.
+
+        Parameters
+        ----------
+        plane: object
+            Gray values in the representation of the backend.
+        differential_filter: Matrix
+            Applied filter with an odd number of rows and columns.
+        region: tuple[int, int, int, int]
+            Region of positions in the format of (first row, row after the last,
+            first column, column after the last).
+
+        Returns
+        -------
+        object
+            Sum of the gray values multiplied with the filter at each position.
+
+        Raises
+        ------
+        NotImplementedError
+            If the backend does not implement the method.
+
+        """
+        raise NotImplementedError
+
+    def magnitude(self, gradient_x: object, gradient_y: object,
+                  mode: str = "l2") -> object:
+        """
+        Calculate the absolute value of the gradients of both directions.
+
+        Parameters
+        ----------
+        gradient_x: object
+            Gradients in the x direction as returned by correlate.
+        gradient_y: object
+            Gradients in the y direction as returned by correlate.
+        mode: str
+            Mode of the absolute value. The default value is 'l2'.
+
+        Returns
+        -------
+        object
+            Absolute value of the gradients of both directions.
+
+        Raises
+        ------
+        NotImplementedError
+            If the backend does not implement the method.
+
+        """
+        raise NotImplementedError
+
+    def to_list(self, result: object) -> list[list[float]]:
+        """
+        Convert a result of the backend into nested lists.
+
+        Parameters
+        ----------
+        result: object
+            Result of correlate or magnitude.
+
+        Returns
+        -------
+        list[list[float]]
+            Values of the result.
+
+        Raises
+        ------
+        NotImplementedError
+            If the backend does not implement the method.
+
+        """
+        raise NotImplementedError
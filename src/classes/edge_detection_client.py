@@ -0,0 +1,201 @@
+"""File containing the EdgeDetectionClient class."""
+
+# Imports for sending the requests to the service
+import http.client
+import socket
+
+# Imports for decoding the edge maps
+import io
+import numpy as np
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    A class representing one HTTP connection over a Unix socket.
+
+    Attributes
+    ----------
+    socket_path: str
+        Path of the Unix socket of the service.
+
+    Methods
+    -------
+    connect
+        Connect to the Unix socket.
+
+    """
+
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        """
+        Construct one UnixHTTPConnection object with the given attributes.
+
+        Parameters
+        ----------
+        socket_path: str
+            Path of the Unix socket of the service.
+        timeout: float
+            Timeout of the connection in seconds.
+
+        """
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path: str = socket_path
+
+    def connect(self) -> None:
+        """Connect to the Unix socket."""
+        self.sock = socket.socket(socket.AF_UNIX,  # pylint: disable=no-member
+                                  socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+class EdgeDetectionClient:
+    """
+    A class representing a client of the local edge detection service.
+
+    Attributes
+    ----------
+    host: str
+        Host of the service.
+    port: int
+        Port of the service.
+    socket_path: str | None
+        Path of the Unix socket of the service. If it is given, the host and the
+        port are ignored.
+    timeout: float
+        Timeout of each request in seconds.
+
+    Methods
+    -------
+    connect
+        Open a new connection to the service.
+    is_healthy
+        Check whether the service accepts requests.
+    detect
+        Execute filters on an image through the service.
+    detect_file
+        Execute filters on an image file through the service.
+
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080,
+                 socket_path: str | None = None, timeout: float = 60.0) -> None:
+        """
+        Construct one EdgeDetectionClient object with the given attributes.
+
+        Parameters
+        ----------
+        host: str
+            Host of the service. The default value is '127.0.0.1'.
+        port: int
+            Port of the service. The default value is 8080.
+        socket_path: str | None
+            Path of the Unix socket of the service. The default value is None,
+            indicating that the host and the port are used.
+        timeout: float
+            Timeout of each request in seconds. The default value is 60.
+
+        """
+        self.host: str = host
+        self.port: int = port
+        self.socket_path: str | None = socket_path
+        self.timeout: float = timeout
+
+    def connect(self) -> http.client.HTTPConnection:
+        """
+        Open a new connection to the service.
+
+        Returns
+        -------
+        http.client.HTTPConnection
+            Connection to the service.
+
+        """
+        if self.socket_path is not None:
+            return UnixHTTPConnection(self.socket_path, self.timeout)
+
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def is_healthy(self) -> bool:
+        """
+        Check whether the service accepts requests.
+
+        Returns
+        -------
+        bool
+            True if the service answered the health check, otherwise False.
+
+        """
+        connection: http.client.HTTPConnection = self.connect()
+
+        try:
+            connection.request("GET", "/health")
+            return connection.getresponse().status == 200
+        except OSError:
+            return False
+        finally:
+            connection.close()
+
+    def detect(self, image: bytes,
+               filters: list[str]) -> tuple[dict[str, np.ndarray], float]:
+        """
+        Execute filters on an image through the service.
+
+        Parameters
+        ----------
+        image: bytes
+            Encoded image (e.g. JPEG).
+        filters: list[str]
+            Names of the filters to execute.
+
+        Returns
+        -------
+        tuple[dict[str, np.ndarray], float]
+            Absolute values of the gradients of each filter and the latency of the
+            request inside the service in milliseconds.
+
+        Raises
+        ------
+        RuntimeError
+            If the service did not execute the filters.
+
+        """
+        connection: http.client.HTTPConnection = self.connect()
+
+        try:
+            connection.request("POST", "/detect?filters=" + ",".join(filters), image,
+                               {"Content-Type": "application/octet-stream"})
+            response: http.client.HTTPResponse = connection.getresponse()
+            body: bytes = response.read()
+
+            if response.status != 200:
+                raise RuntimeError(f"Service responded with {response.status}: "
+                                   + body.decode(errors="replace"))
+
+            latency: float = float(response.getheader("X-Latency-Ms", "nan"))
+        finally:
+            connection.close()
+
+        with np.load(io.BytesIO(body)) as data:
+            edge_maps: dict[str, np.ndarray] = {name: data[name] for name in data.files}
+
+        return edge_maps, latency
+
+    def detect_file(self, path_to_image: str,
+                    filters: list[str]) -> tuple[dict[str, np.ndarray], float]:
+        """
+        Execute filters on an image file through the service.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image file.
+        filters: list[str]
+            Names of the filters to execute.
+
+        Returns
+        -------
+        tuple[dict[str, np.ndarray], float]
+            Absolute values of the gradients of each filter and the latency of the
+            request inside the service in milliseconds.
+
+        """
+        with open(path_to_image, "rb") as file:
+            return self.detect(file.read(), filters)
@@ -0,0 +1,405 @@
+"""File containing the EdgeDetectionService class."""
+
+# Imports for serving the requests
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+# Import for measuring the latency of the requests
+import time
+
+# Imports for decoding the images and encoding the edge maps in memory
+import io
+from PIL import Image as Pixel_Reader
+
+# Import for encoding the edge maps as compact arrays
+import numpy as np
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.image import Image
+from classes.filter_bank import FilterBank
+from classes.batch_processor import BatchProcessor
+from classes.service_settings import ServiceSettings
+
+# Filters of a worker process, set once when the worker is started
+WORKER_FILTERS: dict[str, Matrix] = {}
+
+# Maximum size of the body of a request in bytes
+MAX_BODY_SIZE: int = 64 << 20
+
+# Reason phrases of the used HTTP status codes
+REASONS: dict[int, str] = {200: "OK", 400: "Bad Request", 404: "Not Found",
+                           413: "Payload Too Large", 500: "Internal Server Error",
+                           503: "Service Unavailable"}
+
+class EdgeDetectionService:
+    """
+    A class representing a local HTTP service executing the filters on images.
+
+    Requests are queued, images of the same size are batched together and each
+    batch is executed by a pool of worker processes that are started and warmed up
+    once, so that no request pays for starting the interpreter, importing the
+    modules or creating the filters. Inside a worker, the images of a batch are
+    stacked and differentiated at once by a BatchProcessor.
+
+    The service provides the following endpoints:
+
+    POST /detect?filters=<name>,<name>
+        The body holds the encoded image (e.g. JPEG). The response holds the
+        absolute values of the gradients of every filter as float32 arrays in a
+        compressed .npz file and the latency in the header 'X-Latency-Ms'.
+    GET /health
+        Responds with 'ok' once the service accepts requests.
+
+    Attributes
+    ----------
+    filters: dict[str, Matrix]
+        The filters that can be requested.
+    settings: ServiceSettings
+        Number of workers, size and delay of the batches and size of the queue.
+    requests: asyncio.Queue
+        Queue of the waiting requests.
+    executor: ProcessPoolExecutor | None
+        Pool of the worker processes.
+    tasks: set[asyncio.Task]
+        Running batches, stored so that they are not garbage collected.
+
+    Methods
+    -------
+    serve
+        Start the workers and serve requests until the service is cancelled.
+    handle_connection
+        Read one HTTP request, answer it and close the connection.
+    route
+        Answer one request depending on its method and path.
+    detect
+        Queue one image and wait for its edge maps.
+    dispatch
+        Collect the queued requests into batches of images of the same size.
+    execute_batch
+        Execute one batch in the worker pool and answer its requests.
+    warm_up
+        Prepare a worker process before it receives the first batch.
+    detect_batch
+        Execute the filters on all images of a batch inside a worker process.
+
+    """
+
+    def __init__(self, filters: dict[str, Matrix],
+                 settings: ServiceSettings | None = None) -> None:
+        """
+        Construct one EdgeDetectionService object with the given attributes.
+
+        Parameters
+        ----------
+        filters: dict[str, Matrix]
+            The filters that can be requested.
+        settings: ServiceSettings | None
+            Number of workers, size and delay of the batches and size of the
+            queue. The default value is None, indicating the default settings.
+
+        """
+        self.filters: dict[str, Matrix] = filters
+        self.settings: ServiceSettings = (ServiceSettings() if settings is None
+                                          else settings)
+
+        # The queue binds to the event loop on first use
+        self.requests: asyncio.Queue = asyncio.Queue(
+            maxsize=self.settings.queue_size)
+
+        # Initialized once the service is started inside the event loop
+        self.executor: ProcessPoolExecutor | None = None
+        self.tasks: set[asyncio.Task] = set()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080,
+                    socket_path: str | None = None) -> None:
+        """
+        Start the workers and serve requests until the service is cancelled.
+
+        Parameters
+        ----------
+        host: str
+            Host the service listens on. The default value is '127.0.0.1', so that
+            the service is only reachable locally.
+        port: int
+            Port the service listens on. The default value is 8080.
+        socket_path: str | None
+            Path of a Unix socket to listen on instead of the host and port. The
+            default value is None.
+
+        """
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.settings.number_of_workers,
+            initializer=EdgeDetectionService.warm_up, initargs=(self.filters,))
+
+        # Start all workers now instead of on the first request
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, time.sleep, 0.1)
+                               for _ in range(self.settings.number_of_workers)))
+
+        if socket_path is None:
+            server = await asyncio.start_server(self.handle_connection, host, port)
+        else:
+            server = await asyncio.start_unix_server(self.handle_connection,
+                                                     socket_path)
+
+        dispatcher: asyncio.Task = asyncio.create_task(self.dispatch())
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            dispatcher.cancel()
+            self.executor.shutdown(cancel_futures=True)
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """
+        Read one HTTP request, answer it and close the connection.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            Stream of the request.
+        writer: asyncio.StreamWriter
+            Stream of the response.
+
+        """
+        status: int
+        response_headers: dict[str, str]
+        body: bytes
+
+        try:
+            # Read the request line and the headers
+            request_line: str = (await reader.readline()).decode("latin-1")
+            method, target, _ = request_line.split(" ", 2)
+            headers: dict[str, str] = {}
+
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length: int = int(headers.get("content-length", "0"))
+
+            if not 0 <= length <= MAX_BODY_SIZE:
+                status, response_headers, body = 413, {}, b"Request too large."
+            else:
+                status, response_headers, body = await self.route(
+                    method, target, await reader.readexactly(length))
+        except (ValueError, asyncio.IncompleteReadError):
+            status, response_headers, body = 400, {}, b"Malformed request."
+        except Exception:  # pylint: disable=broad-exception-caught
+            status, response_headers, body = 500, {}, b"Answering the request failed."
+
+        response_headers.setdefault("Content-Type", "text/plain")
+        response_headers["Content-Length"] = str(len(body))
+        response_headers["Connection"] = "close"
+
+        writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\n".encode("latin-1"))
+        writer.write("".join(f"{name}: {value}\r\n" for name, value
+                             in response_headers.items()).encode("latin-1"))
+        writer.write(b"\r\n" + body)
+
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def route(self, method: str, target: str,
+                    body: bytes) -> tuple[int, dict[str, str], bytes]:
+        """
+        Answer one request depending on its method and path.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request.
+        target: str
+            Path and query of the request.
+        body: bytes
+            Body of the request.
+
+        Returns
+        -------
+        tuple[int, dict[str, str], bytes]
+            Status code, headers and body of the response.
+
+        """
+        url = urlsplit(target)
+
+        if method == "GET" and url.path == "/health":
+            return 200, {}, b"ok"
+
+        if method != "POST" or url.path != "/detect":
+            return 404, {}, b"Unknown endpoint."
+
+        # Get and check the requested filters
+        names: list[str] = [name for value in parse_qs(url.query).get("filters", [])
+                            for name in value.split(",") if name]
+        unknown: list[str] = [name for name in names if name not in self.filters]
+
+        if not names or unknown:
+            return 400, {}, ("Unknown or no filters: " + ", ".join(unknown)).encode()
+
+        return await self.detect(body, names)
+
+    async def detect(self, image: bytes,
+                     names: list[str]) -> tuple[int, dict[str, str], bytes]:
+        """
+        Queue one image and wait for its edge maps.
+
+        Parameters
+        ----------
+        image: bytes
+            Encoded image.
+        names: list[str]
+            Names of the filters to execute.
+
+        Returns
+        -------
+        tuple[int, dict[str, str], bytes]
+            Status code, headers and body of the response.
+
+        """
+        received: float = time.perf_counter()
+
+        # Only the header is decoded to get the size of the image
+        try:
+            with Pixel_Reader.open(io.BytesIO(image)) as img:
+                size: tuple[int, int] = img.size
+        except (OSError, ValueError):
+            return 400, {}, b"Body is not a readable image."
+
+        result: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        try:
+            self.requests.put_nowait((size, image, names, result))
+        except asyncio.QueueFull:
+            return 503, {}, b"Too many waiting requests."
+
+        try:
+            edge_maps: bytes = await result
+        except Exception:  # pylint: disable=broad-exception-caught
+            return 500, {}, b"Executing the filters failed."
+
+        latency: float = (time.perf_counter() - received) * 1000
+
+        return 200, {"Content-Type": "application/octet-stream",
+                     "X-Latency-Ms": f"{latency:.3f}"}, edge_maps
+
+    async def dispatch(self) -> None:
+        """Collect the queued requests into batches of images of the same size."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Wait for the first request and collect further ones for a moment
+            batch: list[tuple] = [await self.requests.get()]
+            deadline: float = loop.time() + self.settings.batch_delay
+
+            while len(batch) < self.settings.batch_size and (
+                    not self.requests.empty() or loop.time() < deadline):
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self.requests.get(), max(deadline - loop.time(), 0)))
+                except asyncio.TimeoutError:
+                    break
+
+            # Group the requests by the size of their images
+            groups: dict[tuple[int, int], list[tuple]] = {}
+
+            for request in batch:
+                groups.setdefault(request[0], []).append(request)
+
+            for group in groups.values():
+                task: asyncio.Task = asyncio.create_task(self.execute_batch(group))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+
+    async def execute_batch(self, batch: list[tuple]) -> None:
+        """
+        Execute one batch in the worker pool and answer its requests.
+
+        Parameters
+        ----------
+        batch: list[tuple]
+            Requests in the format of (size, image, filter names, future).
+
+        """
+        try:
+            results: list[bytes] = await asyncio.get_running_loop().run_in_executor(
+                self.executor, EdgeDetectionService.detect_batch,
+                [(request[1], request[2]) for request in batch])
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            for request in batch:
+                if not request[3].done():
+                    request[3].set_exception(error)
+            return
+
+        for request, result in zip(batch, results):
+            if not request[3].done():
+                request[3].set_result(result)
+
+    @staticmethod
+    def warm_up(filters: dict[str, Matrix]) -> None:
+        """
+        Prepare a worker process before it receives the first batch.
+
+        Parameters
+        ----------
+        filters: dict[str, Matrix]
+            The filters that can be requested.
+
+        """
+        WORKER_FILTERS.update(filters)
+
+        # Execute all filters once on a small image
+        BatchProcessor(FilterBank(WORKER_FILTERS)).apply(np.zeros((1, 16, 16)))
+
+    @staticmethod
+    def detect_batch(batch: list[tuple[bytes, list[str]]]) -> list[bytes]:
+        """
+        Execute the filters on all images of a batch inside a worker process.
+
+        Images of the same size requesting the same filters are stacked, so that
+        each filter is applied once to the whole stack.
+
+        Parameters
+        ----------
+        batch: list[tuple[bytes, list[str]]]
+            Encoded images and the names of the filters to execute on them.
+
+        Returns
+        -------
+        results: list[bytes]
+            Absolute values of the gradients of each image as compressed .npz file
+            holding one float32 array per filter.
+
+        """
+        results: list[bytes] = [b""] * len(batch)
+        gray_planes: list[np.ndarray] = []
+        groups: dict[tuple, list[int]] = {}
+
+        for index, (encoded_image, names) in enumerate(batch):
+            # Decode only the luminance, as only the gradients are needed
+            gray_planes.append(Image.decode_luminance(io.BytesIO(encoded_image)))
+
+            groups.setdefault((gray_planes[-1].shape, tuple(names)),
+                              []).append(index)
+
+        # Differentiate each group of images as one stack
+        for (_, names), indices in groups.items():
+            processor: BatchProcessor = BatchProcessor(
+                FilterBank({name: WORKER_FILTERS[name] for name in names}))
+            edge_maps: dict[str, np.ndarray] = processor.apply(
+                BatchProcessor.stack_planes([gray_planes[index]
+                                             for index in indices]))
+
+            for position, index in enumerate(indices):
+                buffer: io.BytesIO = io.BytesIO()
+                np.savez_compressed(buffer, **{
+                    name: edge_maps[name][position].astype(np.float32)
+                    for name in names})
+                results[index] = buffer.getvalue()
+
+        return results
@@ -0,0 +1,201 @@
+"""File containing the EdgeMapWriter class."""
+
+# Import for handling the edge maps as compact arrays
+import numpy as np
+
+# Import for encoding the edge maps as PNG files
+from PIL import Image as Pixel_Writer
+
+# Import used classes
+from classes.pixel import Pixel
+
+# Size of the write buffer of the output files in bytes
+BUFFER_SIZE: int = 1 << 20
+
+class EdgeMapWriter:
+    """
+    A class bundling the writers of edge maps into compact binary files.
+
+    Methods
+    -------
+    to_array
+        Convert an edge map into an array of its values.
+    quantise
+        Quantise an edge map into unsigned integers of the given bit depth.
+    write_png
+        Write an edge map as a single-channel PNG file.
+    write_npy
+        Write an edge map as an uncompressed .npy file.
+    write_npz
+        Write one or multiple edge maps into a compressed .npz file.
+    write_bitmap
+        Write a thresholded edge map as a packed 1-bit bitmap.
+
+    Notes
+    -----
+    All writers accept the edge maps either as arrays or as the pixels returned by
+    Image.traverse. All files are written at once through a buffered file object.
+
+    """
+
+    @staticmethod
+    def to_array(edge_map: list[list[Pixel]] | np.ndarray) -> np.ndarray:
+        """
+        Convert an edge map into an array of its values.
+
+        Parameters
+        ----------
+        edge_map: list[list[Pixel]] | np.ndarray
+            Edge map either as pixels or as an array.
+
+        Returns
+        -------
+        values: np.ndarray
+            Values of the edge map as a two-dimensional float32 array, also if
+            the edge map is empty.
+
+        Notes
+        -----
+        The pixels of an edge map hold the same value in all three colours, so
+        only the red value is used. The grey value is not used, as its weighted sum
+        does not reproduce the value exactly.
+
+        """
+        if isinstance(edge_map, np.ndarray):
+            return edge_map.astype(np.float32, copy=False)
+
+        # Keep two dimensions even if the edge map is empty
+        values: np.ndarray = np.array(
+            [[pixel.get_rgb_values()[0] for pixel in row] for row in edge_map],
+            dtype=np.float32).reshape(len(edge_map),
+                                      len(edge_map[0]) if edge_map else 0)
+
+        return values
+
+    @staticmethod
+    def quantise(edge_map: list[list[Pixel]] | np.ndarray, bit_depth: int = 8,
+                 normalise: bool = False) -> np.ndarray:
+        """
+        Quantise an edge map into unsigned integers of the given bit depth.
+
+        Parameters
+        ----------
+        edge_map: list[list[Pixel]] | np.ndarray
+            Edge map either as pixels or as an array.
+        bit_depth: int
+            Number of bits of each value, either 8 or 16. The default value is 8.
+        normalise: bool
+            Boolean indicating whether the edge map shall be scaled so that its
+            maximum becomes the largest representable value. The default value is
+            False, indicating that values above it are clipped instead.
+
+        Returns
+        -------
+        quantised: np.ndarray
+            Quantised edge map as uint8 or uint16 array.
+
+        Raises
+        ------
+        ValueError
+            If the bit depth is neither 8 nor 16.
+
+        """
+        if bit_depth not in (8, 16):
+            raise ValueError("Bit depth must be either 8 or 16.")
+
+        values: np.ndarray = EdgeMapWriter.to_array(edge_map)
+        max_value: int = (1 << bit_depth) - 1
+
+        if normalise:
+            maximum: float = float(values.max()) if values.size else 0.0
+            values = values * (max_value / maximum) if maximum > 0 else values
+
+        quantised: np.ndarray = np.clip(np.rint(values), 0, max_value).astype(
+            np.uint8 if bit_depth == 8 else np.uint16)
+
+        return quantised
+
+    @staticmethod
+    def write_png(edge_map: list[list[Pixel]] | np.ndarray, path: str,
+                  bit_depth: int = 8, normalise: bool = False) -> None:
+        """
+        Write an edge map as a single-channel PNG file.
+
+        Parameters
+        ----------
+        edge_map: list[list[Pixel]] | np.ndarray
+            Edge map either as pixels or as an array.
+        path: str
+            Path of the written file.
+        bit_depth: int
+            Number of bits of each value, either 8 or 16. The default value is 8.
+        normalise: bool
+            Boolean indicating whether the edge map shall be scaled to the entire
+            range of values instead of being clipped. The default value is False.
+
+        """
+        quantised: np.ndarray = EdgeMapWriter.quantise(edge_map, bit_depth, normalise)
+
+        with open(path, "wb", buffering=BUFFER_SIZE) as file:
+            Pixel_Writer.fromarray(quantised).save(file, format="PNG")
+
+    @staticmethod
+    def write_npy(edge_map: list[list[Pixel]] | np.ndarray, path: str) -> None:
+        """
+        Write an edge map as an uncompressed .npy file.
+
+        Parameters
+        ----------
+        edge_map: list[list[Pixel]] | np.ndarray
+            Edge map either as pixels or as an array.
+        path: str
+            Path of the written file.
+
+        """
+        with open(path, "wb", buffering=BUFFER_SIZE) as file:
+            np.save(file, EdgeMapWriter.to_array(edge_map))
+
+    @staticmethod
+    def write_npz(edge_maps: dict[str, list[list[Pixel]] | np.ndarray],
+                  path: str) -> None:
+        """
+        Write one or multiple edge maps into a compressed .npz file.
+
+        Parameters
+        ----------
+        edge_maps: dict[str, list[list[Pixel]] | np.ndarray]
+            Edge maps stored under their name, e.g. the name of the applied filter.
+        path: str
+            Path of the written file.
+
+        """
+        with open(path, "wb", buffering=BUFFER_SIZE) as file:
+            np.savez_compressed(file, **{
+                name: EdgeMapWriter.to_array(edge_map)
+                for name, edge_map in edge_maps.items()})
+
+    @staticmethod
+    def write_bitmap(edge_map: list[list[Pixel]] | np.ndarray, path: str,
+                     threshold: float) -> None:
+        """
+        Write a thresholded edge map as a packed 1-bit bitmap.
+
+        The bitmap is stored in the binary portable bitmap format (PBM), in which
+        every pixel takes one bit and every row is padded to entire bytes.
+
+        Parameters
+        ----------
+        edge_map: list[list[Pixel]] | np.ndarray
+            Edge map either as pixels or as an array.
+        path: str
+            Path of the written file.
+        threshold: float
+            Values greater than or equal to the threshold are stored as edges.
+
+        """
+        values: np.ndarray = EdgeMapWriter.to_array(edge_map)
+        packed: np.ndarray = np.packbits(values >= threshold, axis=1)
+
+        with open(path, "wb", buffering=BUFFER_SIZE) as file:
+            file.write(f"P4\n{values.shape[1]} {values.shape[0]}\n".encode("ascii"))
+            file.write(packed.tobytes())
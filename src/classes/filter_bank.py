@@ -0,0 +1,485 @@
+"""File containing the FilterBank class."""
+
+# Import for calculating the gradients as arrays
+import numpy as np
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.box_filter import BoxFilter
+from classes.integral_image import IntegralImage
+from classes.recursive_gaussian_filter import RecursiveGaussianFilter
+from classes.compute_backend import ComputeBackend
+from classes.numpy_backend import NumpyBackend
+from classes.workspace_arena import WorkspaceArena
+from classes.border_options import BorderOptions
+
+class FilterBank:
+    """
+    A class representing several filters applied together to stacked gray values.
+
+    The filters are fused: every shifted view of the padded gray values is cut out
+    only once and added to the gradients of all filters that have a non-zero value
+    at its offset. Filters composed of boxes share one integral image and recursive
+    filters run along all images at once. The padded gray values, the gradients and
+    the edge maps are written into buffers of a WorkspaceArena.
+
+    Attributes
+    ----------
+    filters: dict[str, Matrix]
+        Applied filters by their names.
+    mode: str
+        Mode of the absolute value, see ComputeBackend.
+    taps: list[tuple[tuple[int, int], list[tuple[str, int, float]]]]
+        Offsets to the centre of all non-zero values of the fused filters, each
+        with the name of the filter, the direction (0 for x, 1 for y) and the
+        value. The offsets are sorted row by row.
+
+    Methods
+    -------
+    get_filters
+        Return the applied filters by their names.
+    create_taps
+        Fuse the non-zero values of filters and their transposes into one bank.
+    get_border
+        Return the border of the image that is ignored by a filter.
+    get_output_shape
+        Return the shape of the edge map of a filter in a border mode.
+    get_padding
+        Return the padding needed by all filters of the bank.
+    get_anchor
+        Return the upper left window centre of a filter inside the image.
+    apply
+        Calculate the absolute values of the gradients of stacked gray values.
+    apply_taps
+        Apply the fused filters, cutting out each shifted view only once.
+    apply_boxes
+        Apply the filters composed of boxes to one integral image.
+    apply_recursive
+        Apply the recursive filters along all images at once.
+    apply_magnitude
+        Calculate the absolute values of gradients into a buffer.
+
+    Notes
+    -----
+    In the border mode 'wrap', the edge maps are equal to the ones of
+    Image.compute_magnitude. The values of the filters are added in the same order
+    as by the backends, so that the results are identical.
+
+    """
+
+    def __init__(self, filters: dict[str, Matrix], mode: str = "l2") -> None:
+        """
+        Construct one FilterBank object with the given attributes.
+
+        Parameters
+        ----------
+        filters: dict[str, Matrix]
+            Applied filters by their names.
+        mode: str
+            Mode of the absolute value, see ComputeBackend. The default value is
+            'l2'.
+
+        Raises
+        ------
+        ValueError
+            If the mode is not supported.
+
+        """
+        ComputeBackend.check_mode(mode)
+
+        self.filters: dict[str, Matrix] = filters
+        self.mode: str = mode
+        self.taps: list[tuple[tuple[int, int], list[tuple[str, int, float]]]] = (
+            FilterBank.create_taps({
+                name: differential_filter
+                for name, differential_filter in filters.items()
+                if not isinstance(differential_filter,
+                                  (BoxFilter, RecursiveGaussianFilter))}))
+
+    def get_filters(self) -> dict[str, Matrix]:
+        """
+        Return the applied filters by their names.
+
+        Returns
+        -------
+        self.filters: dict[str, Matrix]
+            Applied filters by their names.
+
+        """
+        return self.filters
+
+    @staticmethod
+    def create_taps(filters: dict[str, Matrix]
+                    ) -> list[tuple[tuple[int, int], list[tuple[str, int, float]]]]:
+        """
+        Fuse the non-zero values of filters and their transposes into one bank.
+
+        Parameters
+        ----------
+        filters: dict[str, Matrix]
+            Fused filters by their names.
+
+        Returns
+        -------
+        list[tuple[tuple[int, int], list[tuple[str, int, float]]]]
+            Offsets to the centre sorted row by row, each with the name of the
+            filter, the direction and the value of all filters that use it.
+
+        """
+        taps: dict[tuple[int, int], list[tuple[str, int, float]]] = {}
+
+        for name, differential_filter in filters.items():
+            for direction, oriented_filter in enumerate(
+                    (differential_filter, differential_filter.transpose())):
+                half: tuple[int, int] = (oriented_filter.get_number_of_rows() // 2,
+                                         oriented_filter.get_number_of_columns() // 2)
+
+                for row, values in enumerate(oriented_filter.get_values()):
+                    for col, value in enumerate(values):
+                        if value != 0:
+                            taps.setdefault((row - half[0], col - half[1]), []).append(
+                                (name, direction, value))
+
+        return sorted(taps.items())
+
+    @staticmethod
+    def get_border(differential_filter: Matrix) -> tuple[int, int]:
+        """
+        Return the border of the image that is ignored by a filter.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+
+        Returns
+        -------
+        border: tuple[int, int]
+            Number of ignored rows and columns on each side (rows, columns).
+
+        """
+        # Get the size of the filter (Number of rows, Number of columns)
+        filter_size: tuple[int, int] = (differential_filter.get_number_of_rows(),
+                                        differential_filter.get_number_of_columns())
+
+        # Calculate the border to ignore; Tuple[rows, columns]
+        border: tuple[int, int] = (
+            filter_size[0] - 2 if filter_size[0] > 3 else 1,
+            filter_size[1] - 2 if filter_size[1] > 3 else 1)
+
+        return border
+
+    @staticmethod
+    def get_half(differential_filter: Matrix) -> int:
+        """
+        Return the largest distance of a value of a filter to its centre.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+
+        Returns
+        -------
+        int
+            Half of the size of the filter, the same for the filter of both
+            directions.
+
+        """
+        return max(differential_filter.get_number_of_rows(),
+                   differential_filter.get_number_of_columns()) // 2
+
+    @staticmethod
+    def get_output_shape(size: tuple[int, int], differential_filter: Matrix,
+                         border_mode: str = "wrap") -> tuple[int, int]:
+        """
+        Return the shape of the edge map of a filter in a border mode.
+
+        Parameters
+        ----------
+        size: tuple[int, int]
+            Number of rows and columns of the image.
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        border_mode: str
+            Border mode, see WorkspaceArena. The default value is 'wrap'.
+
+        Returns
+        -------
+        tuple[int, int]
+            Number of rows and columns of the edge map. In the mode 'wrap', the
+            border of Image.traverse is ignored, in the mode 'crop' all positions
+            whose windows lie inside the image are kept and in the other modes the
+            edge map has the size of the image.
+
+        Raises
+        ------
+        ValueError
+            If the border mode is not supported.
+
+        """
+        WorkspaceArena.check_border_mode(border_mode)
+
+        border: tuple[int, int] = (0, 0)
+
+        if border_mode == "wrap":
+            border = FilterBank.get_border(differential_filter)
+        elif border_mode == "crop":
+            border = (FilterBank.get_half(differential_filter),) * 2
+
+        return (max(size[0] - 2 * border[0], 0), max(size[1] - 2 * border[1], 0))
+
+    def get_padding(self) -> int:
+        """
+        Return the padding needed by all filters of the bank.
+
+        Returns
+        -------
+        int
+            Largest half of the size of the filters, 0 for an empty bank.
+
+        """
+        return max([FilterBank.get_half(differential_filter)
+                    for differential_filter in self.filters.values()] + [0])
+
+    @staticmethod
+    def get_anchor(differential_filter: Matrix, border_mode: str) -> int:
+        """
+        Return the upper left window centre of a filter inside the image.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        border_mode: str
+            Border mode, see WorkspaceArena.
+
+        Returns
+        -------
+        int
+            Row and column of the first window centre, which is inside the image
+            only in the mode 'crop'.
+
+        """
+        return (FilterBank.get_half(differential_filter)
+                if border_mode == "crop" else 0)
+
+    def apply(self, stack: np.ndarray,
+              options: BorderOptions | None = None) -> dict[str, np.ndarray]:
+        """
+        Calculate the absolute values of the gradients of stacked gray values.
+
+        Parameters
+        ----------
+        stack: np.ndarray
+            Gray values in the shape (number of images, rows, columns).
+        options: BorderOptions | None
+            Border mode, value outside the image and arena providing the buffers.
+            The default value is None, indicating the mode 'wrap' with a new
+            arena.
+
+        Returns
+        -------
+        edge_maps: dict[str, np.ndarray]
+            Absolute values of the gradients of each filter in the shape (number
+            of images, rows, columns), see get_output_shape. They are buffers of
+            the arena and overwritten by its next use.
+
+        """
+        if options is None:
+            options = BorderOptions()
+
+        arena: WorkspaceArena = (WorkspaceArena() if options.arena is None
+                                 else options.arena)
+        padded: np.ndarray = arena.pad(stack, self.get_padding(), options)
+
+        # Allocate the gradients of both directions of each filter
+        gradients: dict[str, list[np.ndarray]] = {}
+
+        for name, differential_filter in self.filters.items():
+            shape: tuple[int, ...] = stack.shape[:-2] + FilterBank.get_output_shape(
+                (stack.shape[-2], stack.shape[-1]), differential_filter,
+                options.border_mode)
+            gradients[name] = [arena.get_buffer("gradient_x:" + name, shape),
+                               arena.get_buffer("gradient_y:" + name, shape)]
+
+        self.apply_taps(padded, gradients, options.border_mode, arena)
+        self.apply_boxes(padded, gradients, options.border_mode, arena)
+        self.apply_recursive(padded, gradients, options.border_mode)
+
+        edge_maps: dict[str, np.ndarray] = {
+            name: self.apply_magnitude(
+                gradient_x, gradient_y,
+                arena.get_buffer("magnitude:" + name, gradient_x.shape),
+                arena.get_buffer("temporary", gradient_x.shape))
+            for name, (gradient_x, gradient_y) in gradients.items()}
+
+        return edge_maps
+
+    def apply_taps(self, padded: np.ndarray, gradients: dict[str, list[np.ndarray]],
+                   border_mode: str, arena: WorkspaceArena) -> None:
+        """
+        Apply the fused filters, cutting out each shifted view only once.
+
+        Parameters
+        ----------
+        padded: np.ndarray
+            Gray values padded by get_padding.
+        gradients: dict[str, list[np.ndarray]]
+            Buffers of the gradients of both directions of each filter, overwritten
+            for the fused filters.
+        border_mode: str
+            Border mode, see WorkspaceArena.
+        arena: WorkspaceArena
+            Arena providing the buffer of the products.
+
+        """
+        # Position of the upper left window centre of each fused filter in the
+        # padding
+        origins: dict[str, int] = {
+            name: self.get_padding() + FilterBank.get_anchor(self.filters[name],
+                                                             border_mode)
+            for _, uses in self.taps for name, _, _ in uses}
+
+        if not origins:
+            return
+
+        for name in origins:
+            gradients[name][0].fill(0)
+            gradients[name][1].fill(0)
+
+        products: np.ndarray = arena.get_buffer(
+            "product", padded.shape[:-2] + (
+                max(gradients[name][0].shape[-2] for name in origins),
+                max(gradients[name][0].shape[-1] for name in origins)))
+
+        for offset, uses in self.taps:
+            for name, direction, value in uses:
+                rows, cols = gradients[name][direction].shape[-2:]
+                product: np.ndarray = products[..., :rows, :cols]
+
+                np.multiply(value, padded[..., origins[name] + offset[0]:
+                                          origins[name] + offset[0] + rows,
+                                          origins[name] + offset[1]:
+                                          origins[name] + offset[1] + cols],
+                            out=product)
+                gradients[name][direction] += product
+
+    def apply_boxes(self, padded: np.ndarray,
+                    gradients: dict[str, list[np.ndarray]], border_mode: str,
+                    arena: WorkspaceArena) -> None:
+        """
+        Apply the filters composed of boxes to one integral image.
+
+        Parameters
+        ----------
+        padded: np.ndarray
+            Gray values padded by get_padding.
+        gradients: dict[str, list[np.ndarray]]
+            Buffers of the gradients of both directions of each filter, overwritten
+            for the filters composed of boxes.
+        border_mode: str
+            Border mode, see WorkspaceArena.
+        arena: WorkspaceArena
+            Arena providing the buffers of the integral image.
+
+        """
+        box_filters: dict[str, BoxFilter] = {
+            name: differential_filter
+            for name, differential_filter in self.filters.items()
+            if isinstance(differential_filter, BoxFilter)}
+
+        if not box_filters:
+            return
+
+        rows: np.ndarray = arena.get_buffer("integral:rows", padded.shape)
+        table: np.ndarray = arena.get_buffer(
+            "integral", padded.shape[:-2] + (padded.shape[-2] + 1,
+                                             padded.shape[-1] + 1))
+        table[..., 0, :] = 0
+        table[..., :, 0] = 0
+        np.cumsum(padded, axis=-2, out=rows)
+        np.cumsum(rows, axis=-1, out=table[..., 1:, 1:])
+        integral_image: IntegralImage = IntegralImage(table, self.get_padding())
+
+        for name, box_filter in box_filters.items():
+            anchor: int = FilterBank.get_anchor(box_filter, border_mode)
+            region: tuple[int, int, int, int] = (
+                anchor, anchor + gradients[name][0].shape[-2],
+                anchor, anchor + gradients[name][0].shape[-1])
+            gradients[name][0][...] = integral_image.apply_filter(box_filter, region)
+            gradients[name][1][...] = integral_image.apply_filter(
+                box_filter.transpose(), region)
+
+    def apply_recursive(self, padded: np.ndarray,
+                        gradients: dict[str, list[np.ndarray]],
+                        border_mode: str) -> None:
+        """
+        Apply the recursive filters along all images at once.
+
+        Parameters
+        ----------
+        padded: np.ndarray
+            Gray values padded by get_padding.
+        gradients: dict[str, list[np.ndarray]]
+            Buffers of the gradients of both directions of each filter, overwritten
+            for the recursive filters.
+        border_mode: str
+            Border mode, see WorkspaceArena.
+
+        """
+        padding: int = self.get_padding()
+
+        for name, differential_filter in self.filters.items():
+            if isinstance(differential_filter, RecursiveGaussianFilter):
+                # The recursion starts at the border of its own padding
+                half: int = 0 if border_mode == "wrap" else FilterBank.get_half(
+                    differential_filter)
+                gradient_x, gradient_y = differential_filter.apply_recursive(
+                    padded[..., padding - half:padded.shape[-2] - padding + half,
+                           padding - half:padded.shape[-1] - padding + half])
+                first: int = half + FilterBank.get_anchor(differential_filter,
+                                                          border_mode)
+                rows, cols = gradients[name][0].shape[-2:]
+                gradients[name][0][...] = gradient_x[..., first:first + rows,
+                                                     first:first + cols]
+                gradients[name][1][...] = gradient_y[..., first:first + rows,
+                                                     first:first + cols]
+
+    def apply_magnitude(self, gradient_x: np.ndarray, gradient_y: np.ndarray,
+                        magnitude: np.ndarray, temporary: np.ndarray) -> np.ndarray:
+        """
+        Calculate the absolute values of gradients into a buffer.
+
+        Parameters
+        ----------
+        gradient_x: np.ndarray
+            Gradients in the x direction, overwritten in the mode
+            'alpha_max_beta_min'.
+        gradient_y: np.ndarray
+            Gradients in the y direction.
+        magnitude: np.ndarray
+            Buffer of the absolute values.
+        temporary: np.ndarray
+            Buffer of intermediate values.
+
+        Returns
+        -------
+        magnitude: np.ndarray
+            Absolute values of the gradients of both directions, calculated in the
+            same order as by Gradient.get_magnitude.
+
+        """
+        if self.mode == "l2":
+            np.multiply(gradient_x, gradient_x, out=magnitude)
+            np.multiply(gradient_y, gradient_y, out=temporary)
+            magnitude += temporary
+            np.sqrt(magnitude, out=magnitude)
+
+            return magnitude
+
+        np.abs(gradient_x, out=magnitude)
+        np.abs(gradient_y, out=temporary)
+
+        return NumpyBackend.combine_absolute(magnitude, temporary, self.mode,
+                                             gradient_x)
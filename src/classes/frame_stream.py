@@ -0,0 +1,428 @@
+"""File containing the FrameStream class."""
+
+# Import for reading the frames of a directory
+import os
+
+# Imports for decoding and writing the frames alongside the detection
+import queue
+import threading
+
+# Import for measuring the frame rate
+import time
+
+# Import for the return type of the generators
+from typing import Any, Iterator
+
+# Import for reading the frames of an animated image
+from PIL import Image as Pixel_Reader, ImageSequence
+
+# Import for storing the results as compact arrays
+import numpy as np
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.image import Image
+from classes.recursive_gaussian_filter import RecursiveGaussianFilter
+from classes.edge_map_writer import EdgeMapWriter
+
+# File extensions of the frames read from a directory
+FRAME_EXTENSIONS: tuple[str, ...] = (".jpg", ".jpeg", ".png", ".bmp")
+
+class FrameStream:
+    """
+    A class representing the edge detection on a sequence of frames.
+
+    Frames are decoded ahead in a prefetch thread and the edge maps are written in
+    a writer thread, while the current frame is differentiated. Only the tiles of
+    a frame whose underlying pixels changed since the previous frame are
+    calculated again, all other tiles reuse the result of the previous frame.
+    The gradients of a recursive filter depend on all pixels of a line, so that
+    all tiles are calculated again once any pixel changed.
+
+    Attributes
+    ----------
+    differential_filter: Matrix
+        Applied filter to differentiate.
+    tile_size: int
+        Height and width of one square tile of the edge map in pixels.
+    prefetch: int
+        Maximum number of decoded frames waiting to be differentiated.
+    output_directory: str | None
+        Directory the edge maps are written to as PNG files. If it is None, the
+        edge maps are not written.
+    number_of_frames: int
+        Number of differentiated frames.
+    tiles_calculated: int
+        Number of calculated tiles.
+    tiles_reused: int
+        Number of tiles reused from the previous frame.
+    seconds: float
+        Time elapsed for the differentiated frames in seconds.
+
+    Methods
+    -------
+    read_frames
+        Read the frames of a directory or an animated image one after another.
+    process
+        Differentiate all frames and yield the absolute values of the gradients.
+    differentiate
+        Calculate the absolute values of the gradients of the changed tiles.
+    tile_changed
+        Check whether any pixel influencing the gradients of a tile changed.
+    decode_frames
+        Decode all frames ahead and put them into a queue.
+    put_until_stopped
+        Put an item into a queue unless the consumer stopped.
+    write_frames
+        Write all edge maps of a queue until None is received.
+    get_frames_per_second
+        Return the sustained number of differentiated frames per second.
+    get_statistics
+        Return the statistics of the processed frames.
+
+    """
+
+    def __init__(self, differential_filter: Matrix, tile_size: int = 64,
+                 prefetch: int = 4, output_directory: str | None = None) -> None:
+        """
+        Initialize one FrameStream object with the given attributes.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        tile_size: int
+            Height and width of one square tile of the edge map in pixels. The
+            default value is 64.
+        prefetch: int
+            Maximum number of decoded frames waiting to be differentiated. The
+            default value is 4.
+        output_directory: str | None
+            Directory the edge maps are written to as PNG files. The default value
+            is None, indicating that the edge maps are not written.
+
+        Raises
+        ------
+        ValueError
+            If the tile size or the number of prefetched frames is not positive.
+
+        """
+        if tile_size < 1 or prefetch < 1:
+            raise ValueError("Tile size and prefetch must be positive.")
+
+        self.differential_filter: Matrix = differential_filter
+        self.tile_size: int = tile_size
+        self.prefetch: int = prefetch
+        self.output_directory: str | None = output_directory
+
+        # Initialize the statistics
+        self.number_of_frames: int = 0
+        self.tiles_calculated: int = 0
+        self.tiles_reused: int = 0
+        self.seconds: float = 0.0
+
+    @staticmethod
+    def read_frames(source: str) -> Iterator[Image]:
+        """
+        Read the frames of a directory or an animated image one after another.
+
+        Parameters
+        ----------
+        source: str
+            Either a directory containing the frames as image files, which are read
+            in the order of their names, or the path to an animated image (GIF).
+
+        Yields
+        ------
+        Image
+            The next frame as an Image object only holding its luminance.
+
+        """
+        if os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                if name.lower().endswith(FRAME_EXTENSIONS):
+                    yield Image.read_image(os.path.join(source, name), mode="L")
+        else:
+            with Pixel_Reader.open(source) as img:
+                for frame in ImageSequence.Iterator(img):
+                    yield Image.create_from_luminance(frame)
+
+    def process(self, source: str) -> Iterator[np.ndarray]:
+        """
+        Differentiate all frames and yield the absolute values of the gradients.
+
+        Parameters
+        ----------
+        source: str
+            Either a directory containing the frames as image files or the path to
+            an animated image (GIF).
+
+        Yields
+        ------
+        np.ndarray
+            Absolute values of the gradients of the next frame. The array is
+            read-only, as it is reused for the next frame and written in the
+            background.
+
+        Raises
+        ------
+        Exception
+            Any exception raised while decoding or writing a frame is raised again
+            in the calling thread.
+
+        """
+        decoded: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        written: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        errors: list[BaseException] = []
+        stop: threading.Event = threading.Event()
+
+        # Start decoding and writing the frames in the background
+        decoder = threading.Thread(target=self.decode_frames,
+                                   args=(source, decoded, errors, stop), daemon=True)
+        writer = threading.Thread(target=self.write_frames,
+                                  args=(written, errors), daemon=True)
+        decoder.start()
+        writer.start()
+
+        # Initialize the values of the previous frame
+        previous_gray: np.ndarray | None = None
+        previous_magnitude: np.ndarray | None = None
+        start: float = time.perf_counter()
+
+        try:
+            while (image := decoded.get()) is not None:
+                gray_plane: np.ndarray = image.get_gray_plane()
+
+                if (previous_gray is None or previous_magnitude is None
+                        or previous_gray.shape != gray_plane.shape):
+                    magnitude: np.ndarray = self.differentiate(image, None)
+                else:
+                    magnitude = self.differentiate(
+                        image, (gray_plane != previous_gray, previous_magnitude))
+
+                # Hand the edge map over to the writer, protected from changes
+                magnitude.flags.writeable = False
+                written.put((self.number_of_frames, magnitude))
+
+                previous_gray, previous_magnitude = gray_plane, magnitude
+                self.number_of_frames += 1
+                self.seconds = time.perf_counter() - start
+
+                yield magnitude
+        finally:
+            # Stop the decoder, also if the caller stopped iterating early
+            stop.set()
+
+            while decoder.is_alive():
+                try:
+                    decoded.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+            # Stop the writer and wait until all edge maps are written
+            written.put(None)
+            writer.join()
+
+        if errors:
+            raise errors[0]
+
+    def differentiate(self, image: Image,
+                      previous: tuple[np.ndarray, np.ndarray] | None) -> np.ndarray:
+        """
+        Calculate the absolute values of the gradients of the changed tiles.
+
+        Parameters
+        ----------
+        image: Image
+            The current frame.
+        previous: tuple[np.ndarray, np.ndarray] | None
+            Mask of the pixels that changed since the previous frame and the
+            absolute values of the gradients of the previous frame. If it is None,
+            all tiles are calculated.
+
+        Returns
+        -------
+        magnitude: np.ndarray
+            Absolute values of the gradients of the current frame.
+
+        """
+        output_shape: tuple[int, int] = image.get_output_shape(self.differential_filter)
+
+        # Any changed pixel influences all gradients of a recursive filter
+        if (previous is not None and previous[0].any()
+                and isinstance(self.differential_filter, RecursiveGaussianFilter)):
+            previous = None
+
+        magnitude: np.ndarray = (np.empty(output_shape) if previous is None
+                                 else previous[1].copy())
+
+        # Pixels influencing one gradient around its position in both directions
+        halo: int = max(self.differential_filter.get_number_of_rows(),
+                        self.differential_filter.get_number_of_columns()) // 2
+
+        for row in range(0, output_shape[0], self.tile_size):
+            for col in range(0, output_shape[1], self.tile_size):
+                region: tuple[int, int, int, int] = (
+                    row, min(row + self.tile_size, output_shape[0]),
+                    col, min(col + self.tile_size, output_shape[1]))
+
+                if previous is not None and not self.tile_changed(
+                        previous[0], region, halo):
+                    self.tiles_reused += 1
+                    continue
+
+                magnitude[region[0]:region[1], region[2]:region[3]] = (
+                    image.compute_gradients(self.differential_filter, region)
+                    .get_magnitude())
+                self.tiles_calculated += 1
+
+        return magnitude
+
+    @staticmethod
+    def tile_changed(changed: np.ndarray, region: tuple[int, int, int, int],
+                     halo: int) -> bool:
+        """
+        Check whether any pixel influencing the gradients of a tile changed.
+
+        Parameters
+        ----------
+        changed: np.ndarray
+            Mask of the pixels that changed since the previous frame.
+        region: tuple[int, int, int, int]
+            Region of the tile in the format of (first row, row after the last,
+            first column, column after the last).
+        halo: int
+            Number of pixels around a position influencing its gradient.
+
+        Returns
+        -------
+        bool
+            True if any pixel influencing the tile changed, otherwise False.
+
+        Notes
+        -----
+        The windows of the gradients at the upper and left border of the image
+        continue at the opposite border, so the indices are wrapped around.
+
+        """
+        rows: np.ndarray = np.arange(region[0] - halo, region[1] + halo)
+        cols: np.ndarray = np.arange(region[2] - halo, region[3] + halo)
+
+        return bool(changed.take(rows, axis=0, mode="wrap")
+                    .take(cols, axis=1, mode="wrap").any())
+
+    def decode_frames(self, source: str, decoded: queue.Queue,
+                      errors: list[BaseException], stop: threading.Event) -> None:
+        """
+        Decode all frames ahead and put them into a queue.
+
+        Parameters
+        ----------
+        source: str
+            Either a directory containing the frames as image files or the path to
+            an animated image (GIF).
+        decoded: queue.Queue
+            Queue receiving the decoded frames, followed by None after the last one.
+        errors: list[BaseException]
+            List receiving an exception raised while decoding.
+        stop: threading.Event
+            Event set once the frames are no longer consumed.
+
+        """
+        try:
+            for image in self.read_frames(source):
+                # Decode the gray values here, so that it is not done while
+                # differentiating
+                image.get_gray_matrix()
+
+                if not FrameStream.put_until_stopped(decoded, image, stop):
+                    return
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            errors.append(error)
+
+        FrameStream.put_until_stopped(decoded, None, stop)
+
+    @staticmethod
+    def put_until_stopped(items: queue.Queue, item: Any,
+                          stop: threading.Event) -> bool:
+        """
+        Put an item into a queue unless the consumer stopped.
+
+        Parameters
+        ----------
+        items: queue.Queue
+            Queue receiving the item.
+        item: Any
+            Put item.
+        stop: threading.Event
+            Event set once the items are no longer consumed.
+
+        Returns
+        -------
+        bool
+            True if the item was put, False if the consumer stopped before.
+
+        """
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def write_frames(self, written: queue.Queue,
+                     errors: list[BaseException]) -> None:
+        """
+        Write all edge maps of a queue until None is received.
+
+        Parameters
+        ----------
+        written: queue.Queue
+            Queue holding the index of each frame and its edge map.
+        errors: list[BaseException]
+            List receiving an exception raised while writing.
+
+        """
+        while (item := written.get()) is not None:
+            if self.output_directory is None or errors:
+                continue
+
+            try:
+                EdgeMapWriter.write_png(item[1], os.path.join(
+                    self.output_directory, f"edges_{item[0]:06d}.png"))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                errors.append(error)
+
+    def get_frames_per_second(self) -> float:
+        """
+        Return the sustained number of differentiated frames per second.
+
+        Returns
+        -------
+        float
+            Number of differentiated frames per second since the first frame.
+
+        """
+        return self.number_of_frames / self.seconds if self.seconds > 0 else 0.0
+
+    def get_statistics(self) -> dict[str, float]:
+        """
+        Return the statistics of the processed frames.
+
+        Returns
+        -------
+        dict[str, float]
+            Number of frames, elapsed seconds, frames per second and the number of
+            calculated and reused tiles.
+
+        """
+        return {
+            'frames': self.number_of_frames,
+            'seconds': self.seconds,
+            'frames_per_second': self.get_frames_per_second(),
+            'tiles_calculated': self.tiles_calculated,
+            'tiles_reused': self.tiles_reused
+        }
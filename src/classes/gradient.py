@@ -0,0 +1,198 @@
+"""File containing the Gradient class."""
+
+# Import for storing the gradients as compact arrays
+import numpy as np
+
+# Import used classes
+from classes.compute_backend import ComputeBackend
+from classes.numpy_backend import NumpyBackend
+
+class Gradient:
+    """
+    A class representing the gradients of one image in both directions.
+
+    Attributes
+    ----------
+    gradient_x: np.ndarray
+        Gradients of the image in the x direction.
+    gradient_y: np.ndarray
+        Gradients of the image in the y direction.
+
+    Methods
+    -------
+    get_gradient_x
+        Return the gradients in the x direction.
+    get_gradient_y
+        Return the gradients in the y direction.
+    get_magnitude
+        Return the absolute value of the gradients.
+    get_orientation
+        Return the orientation of the gradients.
+    get_histograms
+        Return the quantised orientation histograms of all cells.
+
+    """
+
+    def __init__(self, gradient_x: np.ndarray, gradient_y: np.ndarray) -> None:
+        """
+        Initialize one Gradient object with the given attributes.
+
+        Parameters
+        ----------
+        gradient_x: np.ndarray
+            Gradients of the image in the x direction.
+        gradient_y: np.ndarray
+            Gradients of the image in the y direction.
+
+        Raises
+        ------
+        ValueError
+            If the gradients of both directions do not have the same shape.
+
+        """
+        if np.shape(gradient_x) != np.shape(gradient_y):
+            raise ValueError("Both gradients must have the same shape.")
+
+        self.gradient_x: np.ndarray = np.asarray(gradient_x, dtype=np.float64)
+        self.gradient_y: np.ndarray = np.asarray(gradient_y, dtype=np.float64)
+
+    def get_gradient_x(self) -> np.ndarray:
+        """
+        Return the gradients in the x direction.
+
+        Returns
+        -------
+        self.gradient_x: np.ndarray
+            Gradients of the image in the x direction.
+
+        """
+        return self.gradient_x
+
+    def get_gradient_y(self) -> np.ndarray:
+        """
+        Return the gradients in the y direction.
+
+        Returns
+        -------
+        self.gradient_y: np.ndarray
+            Gradients of the image in the y direction.
+
+        """
+        return self.gradient_y
+
+    def get_magnitude(self, mode: str = "l2") -> np.ndarray:
+        """
+        Return the absolute value of the gradients.
+
+        Parameters
+        ----------
+        mode: str
+            Mode of the absolute value, see ComputeBackend. The modes other than
+            'l2' avoid the square root. The default value is 'l2'.
+
+        Returns
+        -------
+        magnitude: np.ndarray
+            Absolute value of the gradients of both directions.
+
+        """
+        ComputeBackend.check_mode(mode)
+
+        if mode == "l2":
+            magnitude: np.ndarray = np.sqrt(
+                self.get_gradient_x() ** 2 + self.get_gradient_y() ** 2)
+
+            return magnitude
+
+        # Work in place on the absolute values to avoid temporary arrays
+        magnitude = NumpyBackend.combine_absolute(np.abs(self.get_gradient_x()),
+                                                  np.abs(self.get_gradient_y()), mode)
+
+        return magnitude
+
+    def get_orientation(self) -> np.ndarray:
+        """
+        Return the orientation of the gradients.
+
+        Returns
+        -------
+        orientation: np.ndarray
+            Orientation of the gradients in radians within the range [-pi, pi].
+
+        """
+        orientation: np.ndarray = np.arctan2(
+            self.get_gradient_y(), self.get_gradient_x()).astype(np.float32)
+
+        return orientation
+
+    def get_histograms(self, cell_size: int, number_of_bins: int,
+                       magnitude: np.ndarray | None = None,
+                       orientation: np.ndarray | None = None) -> np.ndarray:
+        """
+        Return the quantised orientation histograms of all cells.
+
+        The orientations are taken unsigned (within the range [0, pi)), quantised
+        into the given number of bins and weighted by the magnitude of the
+        gradient, as in histograms of oriented gradients (HOG).
+
+        Parameters
+        ----------
+        cell_size: int
+            Height and width of one square cell in pixels.
+        number_of_bins: int
+            Number of bins the orientations are quantised into.
+        magnitude: np.ndarray | None
+            Absolute values of the gradients if already calculated. The default
+            value is None, indicating that they are calculated.
+        orientation: np.ndarray | None
+            Orientation of the gradients if already calculated. The default value
+            is None, indicating that it is calculated.
+
+        Returns
+        -------
+        histograms: np.ndarray
+            Histograms with the shape (cell rows, cell columns, number of bins).
+
+        Raises
+        ------
+        ValueError
+            If the cell size or the number of bins is not positive.
+
+        Notes
+        -----
+        Pixels at the right and lower border that do not fill an entire cell are
+        ignored.
+
+        """
+        if cell_size < 1 or number_of_bins < 1:
+            raise ValueError("Cell size and number of bins must be positive.")
+
+        # Get the number of entire cells in both directions
+        cells: tuple[int, int] = (self.gradient_x.shape[0] // cell_size,
+                                  self.gradient_x.shape[1] // cell_size)
+        height: int = cells[0] * cell_size
+        width: int = cells[1] * cell_size
+
+        if magnitude is None:
+            magnitude = self.get_magnitude()
+        if orientation is None:
+            orientation = self.get_orientation()
+
+        # Quantise the unsigned orientation of the pixels covered by the cells
+        unsigned: np.ndarray = np.mod(orientation[:height, :width], np.pi)
+        bins: np.ndarray = np.minimum(
+            (unsigned * (number_of_bins / np.pi)).astype(np.intp),
+            number_of_bins - 1)
+
+        # Determine the flat index of the histogram entry of every pixel
+        cell_rows: np.ndarray = np.arange(height) // cell_size
+        cell_cols: np.ndarray = np.arange(width) // cell_size
+        cell_index: np.ndarray = cell_rows[:, None] * cells[1] + cell_cols[None, :]
+
+        histograms: np.ndarray = np.bincount(
+            (cell_index * number_of_bins + bins).ravel(),
+            weights=magnitude[:height, :width].ravel(),
+            minlength=cells[0] * cells[1] * number_of_bins)
+
+        return histograms.astype(np.float32).reshape(
+            (cells[0], cells[1], number_of_bins))
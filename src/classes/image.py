@@ -3,15 +3,33 @@
 # Import for referencing Image class before creation
 from __future__ import annotations
 
+# Imports for the tasks applying a filter and its transpose concurrently
+from functools import partial
+from typing import BinaryIO, Callable
+
 # Import for getting rgb values of the image pixels
 from PIL import Image as Pixel_Reader
 
 # Import for displaying image
 import matplotlib.pyplot as plt
 
+# Import for storing the results as compact arrays
+import numpy as np
+
 # Import used classes
 from classes.pixel import Pixel
 from classes.matrix import Matrix
+from classes.gradient import Gradient
+from classes.sparse_edge_map import SparseEdgeMap
+from classes.box_filter import BoxFilter
+from classes.integral_image import IntegralImage
+from classes.recursive_gaussian_filter import RecursiveGaussianFilter
+from classes.compute_backend import ComputeBackend
+from classes.backend_registry import BACKENDS
+from classes.magnitude_quantiser import MagnitudeQuantiser
+from classes.filter_bank import FilterBank
+from classes.border_options import BorderOptions
+from classes.thread_executor import ThreadExecutor
 
 class Image:
     """
@@ -19,35 +37,95 @@ class Image:
 
     Attributes
     ----------
-    pixels: list[list[Pixel]]
-        Pixels of the image.
+    pixels: list[list[Pixel]] | None
+        Pixels of the image. Images read in grayscale mode only create them once
+        they are needed for the first time.
+    gray_matrix: Matrix | None
+        Gray values of the pixels as a Matrix object. It is only created once it
+        is needed for the first time.
+    integral_image: IntegralImage | None
+        Integral image of the gray values used for filters composed of boxes. It
+        is only created once it is needed for the first time.
+    recursive_gradients: tuple[float, np.ndarray, np.ndarray] | None
+        Standard deviation and gradients of both directions of the entire image
+        of the recursive filter applied last. Only the last filter is kept, as
+        the gradients are as large as the image.
+    planes: dict[str, object]
+        Gray values in the representation of each backend used so far, stored
+        under the name of the backend.
 
     Methods
     -------
     get_pixels
         Return the pixels of the image.
+    get_size
+        Return the size of the image.
     get_gray_values
         Return the gray values of the pixels.
+    get_gray_matrix
+        Return the gray values of the pixels as a Matrix object.
+    get_gray_plane
+        Return the gray values of the pixels as an array.
     read_image
         Read RGB values of an image an create an Image object with the values.
+    create_from_pil_image
+        Create an Image object from the RGB values of an already opened image.
+    create_from_luminance
+        Create an Image object from the luminance of an already opened image.
+    decode_luminance
+        Decode only the luminance of an image into an array of bytes.
     add_image_to_plot
         Add the image to the plot to later display them.
+    get_output_shape
+        Return the shape of the gradients calculated with a filter.
+    get_plane
+        Return the gray values in the representation of a backend.
+    compute_gradients
+        Traverse the image once and calculate the gradients of both directions.
+    get_integral_image
+        Return the integral image of the gray values.
+    compute_gradients_integral
+        Calculate the gradients of a filter composed of boxes with an integral image.
+    compute_gradients_recursive
+        Calculate the gradients of a recursive derivative-of-Gaussian filter.
+    compute_magnitude
+        Calculate the absolute value of the gradients of both directions.
     traverse
         Traverse the image vertically and differentiate all pixels.
+    traverse_sparse
+        Traverse the image and keep only the edges above a threshold.
+    extract_features
+        Calculate magnitude, orientation and orientation histograms in one pass.
 
     """
 
-    def __init__(self, pixels: list[list[Pixel]]) -> None:
+    def __init__(self, pixels: list[list[Pixel]] | None,
+                 gray_matrix: Matrix | None = None) -> None:
         """
-        Initialize one Image object with the given attribute.
+        Initialize one Image object with the given attributes.
 
         Parameters
         ----------
-        pixels: list[list[Pixel]]
-            Pixels of the image.
+        pixels: list[list[Pixel]] | None
+            Pixels of the image. It may only be None if the gray values are given.
+        gray_matrix: Matrix | None
+            Gray values of the pixels. The default value is None, indicating that
+            they are determined from the pixels.
+
+        Raises
+        ------
+        ValueError
+            If neither the pixels nor the gray values are given.
 
         """
-        self.pixels = pixels
+        if pixels is None and gray_matrix is None:
+            raise ValueError("Either the pixels or the gray values must be given.")
+
+        self.pixels: list[list[Pixel]] | None = pixels
+        self.gray_matrix: Matrix | None = gray_matrix
+        self.integral_image: IntegralImage | None = None
+        self.recursive_gradients: tuple[float, np.ndarray, np.ndarray] | None = None
+        self.planes: dict[str, object] = {}
 
     def get_pixels(self) -> list[list[Pixel]]:
         """
@@ -56,11 +134,31 @@ class Image:
         Returns
         -------
         self.pixels: list[list[pixels]]
-            Pixels of the image.
+            Pixels of the image. Images only holding gray values get gray pixels.
 
         """
+        if self.pixels is None:
+            self.pixels = [[Pixel.create_gray(value) for value in row]
+                           for row in self.get_gray_matrix().get_values()]
+
         return self.pixels
 
+    def get_size(self) -> tuple[int, int]:
+        """
+        Return the size of the image.
+
+        Returns
+        -------
+        tuple[int, int]
+            Number of rows and columns of the image.
+
+        """
+        if self.pixels is None:
+            return (self.get_gray_matrix().get_number_of_rows(),
+                    self.get_gray_matrix().get_number_of_columns())
+
+        return (len(self.pixels), len(self.pixels[0]))
+
     def get_gray_values(self) -> list[list[float]]:
         """
         Return the gray values of the pixels.
@@ -76,6 +174,9 @@ class Image:
         used as the values of a Matrix object which only accepts floats.
 
         """
+        if self.gray_matrix is not None:
+            return self.gray_matrix.get_values()
+
         gray_values: list[list[float]] = []
 
         for count, row in enumerate(self.get_pixels()):
@@ -86,8 +187,42 @@ class Image:
 
         return gray_values
 
+    def get_gray_matrix(self) -> Matrix:
+        """
+        Return the gray values of the pixels as a Matrix object.
+
+        Returns
+        -------
+        self.gray_matrix: Matrix
+            Gray values of the pixels as a Matrix object.
+
+        Notes
+        -----
+        The Matrix object is only created on the first call and reused afterwards,
+        so that computing the gradients of several regions does not convert all
+        pixels again.
+
+        """
+        if self.gray_matrix is None:
+            self.gray_matrix = Matrix(self.get_gray_values())
+
+        return self.gray_matrix
+
+    def get_gray_plane(self) -> np.ndarray:
+        """
+        Return the gray values of the pixels as an array.
+
+        Returns
+        -------
+        np.ndarray
+            Gray values of the pixels as a two-dimensional float64 array.
+
+        """
+        return np.array(self.get_gray_matrix().get_values(), dtype=np.float64)
+
     @staticmethod
-    def read_image(path_to_image: str) -> Image:
+    def read_image(path_to_image: str, scale: float = 1.0,
+                   mode: str = "RGB") -> Image:
         """
         Read RGB values of an image an create an Image object with the values.
 
@@ -95,20 +230,137 @@ class Image:
         ----------
         path_to_image: str
             Path to the image of which the Image object is to be generated.
+        scale: float
+            Factor within (0, 1] by which the height and width of the image are
+            reduced. The default value is 1, indicating the full resolution.
+        mode: str
+            Either 'RGB' to read the colours of the image or 'L' to read only its
+            luminance, e.g. if only gradients are needed. The default value is
+            'RGB'.
 
         Returns
         -------
         image_new: Image
             Newly created Image object.
 
+        Raises
+        ------
+        ValueError
+            If the scale or the mode is not supported.
+
+        Notes
+        -----
+        JPEG images are reduced by the decoder itself by a factor of 1/2, 1/4 or
+        1/8 in the frequency domain and decoded directly into the luminance in
+        mode 'L', so that the time and memory of decoding drop with the square of
+        the scale. The remaining reduction to the exact size is done afterwards.
+        The luminance is rounded by the decoder and may therefore differ slightly
+        from the grey value of the pixels in mode 'RGB'.
+
         """
+        if not 0 < scale <= 1:
+            raise ValueError("Scale must be within (0, 1].")
+        if mode not in ("RGB", "L"):
+            raise ValueError("Mode must be either 'RGB' or 'L'.")
+
         with Pixel_Reader.open(path_to_image) as img:
-            rgb_values: list[tuple[float, float, float]] = img.getdata()
-            image_width: int = img.size[0]
+            size: tuple[int, int] = (max(round(img.size[0] * scale), 1),
+                                     max(round(img.size[1] * scale), 1))
+
+            # Let the decoder reduce the image and choose the mode if possible
+            if scale < 1 or mode == "L":
+                img.draft(mode, size)
+
+            resized: Pixel_Reader.Image = (img if img.size == size
+                                           else img.resize(size))
+
+            if mode == "L":
+                image_new: Image = Image.create_from_luminance(resized)
+            else:
+                image_new = Image.create_from_pil_image(resized)
+
+        return image_new
+
+    @staticmethod
+    def create_from_luminance(img: Pixel_Reader.Image) -> Image:
+        """
+        Create an Image object from the luminance of an already opened image.
+
+        Parameters
+        ----------
+        img: Pixel_Reader.Image
+            Opened image. Images that are not in mode 'L' are converted to it.
+
+        Returns
+        -------
+        image_new: Image
+            Newly created Image object only holding gray values.
+
+        """
+        if img.mode != "L":
+            img = img.convert("L")
+
+        gray_values: list[list[float]] = np.asarray(
+            img, dtype=np.float64).tolist()
+
+        # Create and return the Image object
+        image_new: Image = Image(None, Matrix(gray_values))
+
+        return image_new
+
+    @staticmethod
+    def decode_luminance(source: str | BinaryIO) -> np.ndarray:
+        """
+        Decode only the luminance of an image into an array of bytes.
 
-        # Initialize the Pixel objects
+        Unlike read_image, no Image object is created, so that the gray values
+        take one byte per pixel, e.g. to stack or tile them.
+
+        Parameters
+        ----------
+        source: str | BinaryIO
+            Path to the image or file object holding the encoded image.
+
+        Returns
+        -------
+        np.ndarray
+            Luminance of the image as uint8, equal to the gray values of
+            read_image in mode 'L'.
+
+        """
+        with Pixel_Reader.open(source) as img:
+            img.draft("L", img.size)
+
+            return np.asarray(img if img.mode == "L" else img.convert("L"),
+                              dtype=np.uint8)
+
+    @staticmethod
+    def create_from_pil_image(img: Pixel_Reader.Image) -> Image:
+        """
+        Create an Image object from the RGB values of an already opened image.
+
+        Parameters
+        ----------
+        img: Pixel_Reader.Image
+            Opened image, e.g. one frame of an animated image. Images that are not
+            in RGB mode are converted to it.
+
+        Returns
+        -------
+        image_new: Image
+            Newly created Image object.
+
+        """
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+
+        rgb_values: list[tuple[float, float, float]] = img.getdata()
+        image_width: int = img.size[0]
+
+        # Initialize the Pixel objects, sharing one object per colour
         pixel_list: list[list[Pixel]] = []
         current_row: int = -1
+        colours: dict[tuple[float, float, float], Pixel] = {}
 
         for count, pixel in enumerate(rgb_values):
             # Switch to the enxt row if an entire row has been initialized
@@ -116,8 +368,13 @@ class Image:
                 pixel_list.append([])
                 current_row += 1
 
-            pixel_list[current_row].append(Pixel(
-                pixel[0], pixel[1], pixel[2]))
+            pixel_new: Pixel | None = colours.get(pixel)
+
+            if pixel_new is None:
+                pixel_new = colours.setdefault(pixel, Pixel(pixel[0], pixel[1],
+                                                            pixel[2]))
+
+            pixel_list[current_row].append(pixel_new)
 
         # Create and return the Image object
         image_new: Image = Image(pixel_list)
@@ -139,22 +396,288 @@ class Image:
         """
         pixel_values: list[list[tuple[float, float, float]]] = []
 
-        for count, row in enumerate(self.get_pixels()):
-            pixel_values.append([])
+        if grayscale:
+            pixel_values = [[(int(gray_value), int(gray_value), int(gray_value))
+                             for gray_value in row]
+                            for row in self.get_gray_values()]
+        else:
+            for count, row in enumerate(self.get_pixels()):
+                pixel_values.append([])
 
-            for pixel in row:
-                if grayscale:
-                    pixel_values[count].append(
-                        (pixel.get_gray_value(), pixel.get_gray_value(),
-                         pixel.get_gray_value()))
-                else:
+                for pixel in row:
                     pixel_values[count].append(pixel.get_rgb_values())
 
         plt.imshow(pixel_values)
         plt.axis('off')
         plt.title(title)
 
-    def traverse(self, differential_filter: Matrix) -> list[list[Pixel]]:
+    def get_output_shape(self, differential_filter: Matrix) -> tuple[int, int]:
+        """
+        Return the shape of the gradients calculated with a filter.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+
+        Returns
+        -------
+        tuple[int, int]
+            Number of rows and columns of the gradients.
+
+        """
+        border: tuple[int, int] = FilterBank.get_border(differential_filter)
+        size: tuple[int, int] = self.get_size()
+
+        return (max(size[0] - 2 * border[0], 0), max(size[1] - 2 * border[1], 0))
+
+    def get_plane(self, backend: ComputeBackend) -> object:
+        """
+        Return the gray values in the representation of a backend.
+
+        Parameters
+        ----------
+        backend: ComputeBackend
+            Backend using the gray values.
+
+        Returns
+        -------
+        object
+            Gray values in the representation of the backend. They are only
+            converted once per backend.
+
+        """
+        if backend.get_name() not in self.planes:
+            self.planes[backend.get_name()] = backend.create_plane(
+                self.get_gray_matrix())
+
+        return self.planes[backend.get_name()]
+
+    def compute_gradients(self, differential_filter: Matrix,
+                          region: tuple[int, int, int, int] | None = None,
+                          backend: ComputeBackend | None = None,
+                          executor: ThreadExecutor | None = None) -> Gradient:
+        """
+        Traverse the image once and calculate the gradients of both directions.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        region: tuple[int, int, int, int] | None
+            Region of the gradients to calculate in the format of (first row,
+            row after the last, first column, column after the last). The default
+            value is None, indicating that all gradients inside the border are
+            calculated.
+        backend: ComputeBackend | None
+            Backend calculating the gradients. The default value is None,
+            indicating that the backend selected by the registry is used.
+        executor: ThreadExecutor | None
+            Executor calculating the gradients of both directions concurrently.
+            The default value is None, indicating that they are calculated one
+            after another.
+
+        Returns
+        -------
+        gradients: Gradient
+            Gradients of both directions of the pixels inside the border or
+            inside the region.
+
+        Notes
+        -----
+        The gradients of a region are identical to the respective part of the
+        gradients of the entire image, so that regions can be stitched together.
+        Filters composed of boxes are applied with an integral image and
+        derivative-of-Gaussian filters recursively instead of with a backend.
+
+        """
+        if isinstance(differential_filter, BoxFilter):
+            return self.compute_gradients_integral(differential_filter, region,
+                                                   executor)
+        if isinstance(differential_filter, RecursiveGaussianFilter):
+            return self.compute_gradients_recursive(differential_filter, region)
+
+        # A single worker applies the filter and its transpose one after another
+        gradient_x, gradient_y, shape = (
+            ThreadExecutor(1) if executor is None else executor).correlate(
+                self, differential_filter, region, backend)
+
+        # Create and return the Gradient object
+        gradients: Gradient = Gradient(
+            np.asarray(gradient_x, dtype=np.float64).reshape(shape),
+            np.asarray(gradient_y, dtype=np.float64).reshape(shape))
+
+        return gradients
+
+    def get_integral_image(self, padding: int) -> IntegralImage:
+        """
+        Return the integral image of the gray values.
+
+        Parameters
+        ----------
+        padding: int
+            Smallest number of rows and columns prepended to the gray values.
+
+        Returns
+        -------
+        self.integral_image: IntegralImage
+            Integral image, only created again if a larger padding is needed.
+
+        """
+        if self.integral_image is None or self.integral_image.padding < padding:
+            self.integral_image = IntegralImage.create_from_plane(
+                self.get_gray_plane(), padding)
+
+        return self.integral_image
+
+    def compute_gradients_integral(self, box_filter: BoxFilter,
+                                   region: tuple[int, int, int, int] | None = None,
+                                   executor: ThreadExecutor | None = None
+                                   ) -> Gradient:
+        """
+        Calculate the gradients of a filter composed of boxes with an integral image.
+
+        The cost per pixel only depends on the number of boxes and not on the size
+        of the filter.
+
+        Parameters
+        ----------
+        box_filter: BoxFilter
+            Applied filter to differentiate.
+        region: tuple[int, int, int, int] | None
+            Region of the gradients to calculate in the format of (first row,
+            row after the last, first column, column after the last). The default
+            value is None, indicating that all gradients inside the border are
+            calculated.
+        executor: ThreadExecutor | None
+            Executor calculating the gradients of both directions concurrently.
+            The default value is None, indicating that they are calculated one
+            after another.
+
+        Returns
+        -------
+        gradients: Gradient
+            Gradients of both directions of the pixels inside the border or
+            inside the region, equal to the ones of compute_gradients.
+
+        """
+        # Create the integral image once with a padding large enough for the filter
+        integral_image: IntegralImage = self.get_integral_image(
+            max(box_filter.get_number_of_rows(),
+                box_filter.get_number_of_columns()) // 2)
+
+        if region is None:
+            output_shape: tuple[int, int] = self.get_output_shape(box_filter)
+            region = (0, output_shape[0], 0, output_shape[1])
+
+        tasks: list[Callable[[], np.ndarray]] = [
+            partial(integral_image.apply_filter, box_filter, region),
+            partial(integral_image.apply_filter, box_filter.transpose(), region)]
+        gradient_x, gradient_y = (executor.run_all(tasks) if executor is not None
+                                  else [task() for task in tasks])
+
+        gradients: Gradient = Gradient(gradient_x, gradient_y)
+
+        return gradients
+
+    def compute_gradients_recursive(self, gaussian_filter: RecursiveGaussianFilter,
+                                    region: tuple[int, int, int, int] | None = None
+                                    ) -> Gradient:
+        """
+        Calculate the gradients of a recursive derivative-of-Gaussian filter.
+
+        The cost per pixel does not depend on the standard deviation.
+
+        Parameters
+        ----------
+        gaussian_filter: RecursiveGaussianFilter
+            Applied filter to differentiate.
+        region: tuple[int, int, int, int] | None
+            Region of the gradients to calculate in the format of (first row,
+            row after the last, first column, column after the last). The default
+            value is None, indicating that all gradients inside the border are
+            calculated.
+
+        Returns
+        -------
+        gradients: Gradient
+            Gradients of both directions of the pixels inside the border or
+            inside the region.
+
+        Notes
+        -----
+        As the recursive filter depends on all pixels of a line, the gradients are
+        always calculated for the entire image and the region is cut out of them.
+        They are kept for the last standard deviation, so that further regions of
+        the same filter, e.g. the tiles of a FrameStream, are only cut out. Like in
+        compute_gradients, the gradient at a position of the output belongs to the
+        same position of the image.
+
+        """
+        if region is None:
+            output_shape: tuple[int, int] = self.get_output_shape(gaussian_filter)
+            region = (0, output_shape[0], 0, output_shape[1])
+
+        # Calculate the gradients of the entire image only once per filter
+        if (self.recursive_gradients is None
+                or self.recursive_gradients[0] != gaussian_filter.get_sigma()):
+            self.recursive_gradients = (gaussian_filter.get_sigma(),
+                                        *gaussian_filter.apply_recursive(
+                                            self.get_gray_plane()))
+
+        _, gradient_x, gradient_y = self.recursive_gradients
+
+        gradients: Gradient = Gradient(
+            gradient_x[region[0]:region[1], region[2]:region[3]],
+            gradient_y[region[0]:region[1], region[2]:region[3]])
+
+        return gradients
+
+    def compute_magnitude(self, differential_filter: Matrix,
+                          region: tuple[int, int, int, int] | None = None,
+                          backend: ComputeBackend | None = None,
+                          mode: str = "l2") -> np.ndarray:
+        """
+        Calculate the absolute value of the gradients of both directions.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        region: tuple[int, int, int, int] | None
+            Region of the gradients to calculate in the format of (first row,
+            row after the last, first column, column after the last). The default
+            value is None, indicating that all gradients inside the border are
+            calculated.
+        backend: ComputeBackend | None
+            Backend calculating the gradients. The default value is None,
+            indicating that the backend selected by the registry is used.
+        mode: str
+            Mode of the absolute value, see ComputeBackend. The default value is
+            'l2'.
+
+        Returns
+        -------
+        np.ndarray
+            Absolute values of the gradients as float64.
+
+        """
+        if isinstance(differential_filter, (BoxFilter, RecursiveGaussianFilter)):
+            return self.compute_gradients(differential_filter,
+                                          region).get_magnitude(mode)
+
+        if backend is None:
+            backend = BACKENDS.select()
+
+        gradient_x, gradient_y, shape = ThreadExecutor(1).correlate(
+            self, differential_filter, region, backend)
+
+        return np.asarray(backend.magnitude(gradient_x, gradient_y, mode),
+                          dtype=np.float64).reshape(shape)
+
+    def traverse(self, differential_filter: Matrix, mode: str = "l2",
+                 normalise: bool = False, options: BorderOptions | None = None,
+                 executor: ThreadExecutor | None = None) -> list[list[Pixel]]:
         """
         Traverse the image vertically and differentiate all pixels.
 
@@ -162,6 +685,23 @@ class Image:
         ----------
         differential_filter: Matrix
             Applied filter to differentiate.
+        mode: str
+            Mode of the absolute value, see ComputeBackend. The default value is
+            'l2'.
+        normalise: bool
+            Whether the absolute values are scaled by the largest one the filter
+            can produce to gray values from 0 to 255 with a lookup table. The
+            default value is False, indicating that they are only truncated to
+            integers.
+        options: BorderOptions | None
+            Border mode, value outside the image and arena providing the buffers,
+            reused by successive calls. The default value is None, indicating the
+            border mode 'wrap', in which the windows at the upper and left border
+            continue at the opposite border, without an arena.
+        executor: ThreadExecutor | None
+            Executor calculating the gradients of both directions concurrently in
+            the default border mode, see compute_gradients. The default value is
+            None, indicating that they are calculated one after another.
 
         Returns
         -------
@@ -169,44 +709,85 @@ class Image:
             Differentiated pixels after vertical transverse.
 
         """
-        # Get the grayscale values of the image
-        gray_values: list[list[float]] = self.get_gray_values()
+        # Keep the options of the border and of the threads separate
+        # pylint: disable=too-many-arguments
+        magnitude: np.ndarray
+
+        # Pad the gray values into buffers unless the default border is kept
+        if options is None or (options.border_mode == "wrap"
+                               and options.arena is None):
+            magnitude = (
+                self.compute_magnitude(differential_filter, mode=mode)
+                if executor is None else self.compute_gradients(
+                    differential_filter, executor=executor).get_magnitude(mode))
+        else:
+            magnitude = FilterBank({"": differential_filter}, mode).apply(
+                self.get_gray_plane()[np.newaxis], options)[""][0]
+
+        return MagnitudeQuantiser.create_gray_pixels(magnitude, differential_filter,
+                                                     mode, normalise)
+
+    def traverse_sparse(self, differential_filter: Matrix,
+                        threshold: float) -> SparseEdgeMap:
+        """
+        Traverse the image and keep only the edges above a threshold.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        threshold: float
+            Absolute values of the gradients greater than or equal to the threshold
+            are kept as edges.
+
+        Returns
+        -------
+        edges: SparseEdgeMap
+            Coordinates and absolute values of the gradients of all edges.
+
+        """
+        edges: SparseEdgeMap = SparseEdgeMap.from_dense(
+            self.compute_gradients(differential_filter).get_magnitude(), threshold)
 
-        # Create a Matrix object with the grayscale values to create sub matrices of it
-        gray_values_as_matrix: Matrix = Matrix(gray_values)
+        return edges
 
-        # Initialize the return value
-        pixels_differentiated: list[list[Pixel]] = []
+    def extract_features(self, differential_filter: Matrix, cell_size: int = 8,
+                         number_of_bins: int = 9) -> dict[str, np.ndarray]:
+        """
+        Calculate magnitude, orientation and orientation histograms in one pass.
 
-        # Get the size of the filter (Number of rows, Number of columns)
-        filter_size: tuple[int, int] = (differential_filter.get_number_of_rows(),
-                                        differential_filter.get_number_of_columns())
+        The gradients are only calculated once and all features are derived from
+        them, so that the image does not have to be traversed once per feature.
 
-        # Calculate the border to ignore; Tuple[rows, columns]
-        border: tuple[int, int] = (
-            filter_size[0] - 2 if filter_size[0] > 3 else 1,
-            filter_size[1] - 2 if filter_size[1] > 3 else 1)
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        cell_size: int
+            Height and width of one cell of the histograms in pixels. The default
+            value is 8.
+        number_of_bins: int
+            Number of bins of each histogram. The default value is 9.
 
-        # Ignore the border of the image
-        for row_count, row in enumerate(gray_values[border[0]:-border[0]]):
-            pixels_differentiated.append([])
+        Returns
+        -------
+        features: dict[str, np.ndarray]
+            The magnitude (float32), the orientation in radians (float32) and the
+            orientation histograms of all cells (float32) stored under the keys
+            'magnitude', 'orientation' and 'histograms'.
 
-            for col_count in range(len(row[border[1]:-border[1]])):
-                # Get sub matrices for both directions
-                sub_matrix_x: Matrix = gray_values_as_matrix.create_sub_matrix(
-                    (row_count, col_count), (filter_size[0], filter_size[1]))
-                sub_matrix_y: Matrix = gray_values_as_matrix.create_sub_matrix(
-                    (row_count, col_count), (filter_size[1], filter_size[0]))
+        """
+        gradients: Gradient = self.compute_gradients(differential_filter)
 
-                # Calculate the differentiated pixel value at the current position
-                gradient_x: float = sub_matrix_x.apply_filter(
-                    differential_filter).get_sum()
-                gradient_y: float = sub_matrix_y.apply_filter(
-                    differential_filter.transpose()).get_sum()
-                gradient_absolute: int = int(
-                    (abs(gradient_x) ** 2 + abs(gradient_y) ** 2) ** 0.5)
+        # Calculate magnitude and orientation once and weight the histograms by them
+        magnitude: np.ndarray = gradients.get_magnitude()
+        orientation: np.ndarray = gradients.get_orientation()
 
-                pixels_differentiated[row_count].append(Pixel(
-                    gradient_absolute, gradient_absolute, gradient_absolute))
+        features: dict[str, np.ndarray] = {
+            'magnitude': magnitude.astype(np.float32),
+            'orientation': orientation,
+            'histograms': gradients.get_histograms(cell_size, number_of_bins,
+                                                   magnitude, orientation)
+        }
 
-        return pixels_differentiated
+        return features
@@ -0,0 +1,183 @@
+"""File containing the IntegralImage class."""
+
+# Import for referencing IntegralImage class before creation
+from __future__ import annotations
+
+# Import for calculating the sums as arrays
+import numpy as np
+
+# Import used classes
+from classes.box_filter import BoxFilter
+
+class IntegralImage:
+    """
+    A class representing the integral image (summed-area table) of gray values.
+
+    The sum of any box of gray values is calculated from four values of the table,
+    so that a filter composed of boxes is applied at a constant cost per pixel,
+    independent of the size of the filter.
+
+    Attributes
+    ----------
+    table: np.ndarray
+        Sums of all gray values above and left of each position. The first row and
+        column are zero.
+    padding: int
+        Number of rows and columns prepended to the gray values.
+
+    Methods
+    -------
+    get_table
+        Return the summed-area table.
+    create_from_plane
+        Create an IntegralImage object from gray values.
+    apply_filter
+        Apply a filter composed of boxes to all positions of a region.
+    get_box_sums
+        Return the sums of the gray values of one box at many positions.
+
+    Notes
+    -----
+    Like the windows of Image.traverse, windows at the upper and left border of the
+    image continue at the opposite border. Therefore, the gray values are padded at
+    the upper and left border with the values of the opposite border.
+
+    """
+
+    def __init__(self, table: np.ndarray, padding: int) -> None:
+        """
+        Initialize one IntegralImage object with the given attributes.
+
+        Parameters
+        ----------
+        table: np.ndarray
+            Sums of all gray values above and left of each position.
+        padding: int
+            Number of rows and columns prepended to the gray values.
+
+        """
+        self.table: np.ndarray = table
+        self.padding: int = padding
+
+    def get_table(self) -> np.ndarray:
+        """
+        Return the summed-area table.
+
+        Returns
+        -------
+        self.table: np.ndarray
+            Sums of all gray values above and left of each position.
+
+        """
+        return self.table
+
+    @staticmethod
+    def create_from_plane(gray_plane: np.ndarray, padding: int) -> IntegralImage:
+        """
+        Create an IntegralImage object from gray values.
+
+        Parameters
+        ----------
+        gray_plane: np.ndarray
+            Gray values of the image. Further leading dimensions, e.g. a stack of
+            images of the same size, are kept.
+        padding: int
+            Number of rows and columns prepended from the opposite border, at least
+            half of the size of the largest applied filter.
+
+        Returns
+        -------
+        integral_image: IntegralImage
+            Newly created IntegralImage object.
+
+        """
+        gray_plane = np.asarray(gray_plane, dtype=np.float64)
+        padded: np.ndarray = np.pad(
+            gray_plane,
+            ((0, 0),) * (gray_plane.ndim - 2) + ((padding, 0), (padding, 0)),
+            mode="wrap")
+
+        table: np.ndarray = np.zeros(padded.shape[:-2] + (padded.shape[-2] + 1,
+                                                          padded.shape[-1] + 1))
+        np.cumsum(np.cumsum(padded, axis=-2), axis=-1, out=table[..., 1:, 1:])
+
+        integral_image: IntegralImage = IntegralImage(table, padding)
+
+        return integral_image
+
+    def apply_filter(self, box_filter: BoxFilter,
+                     region: tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Apply a filter composed of boxes to all positions of a region.
+
+        Parameters
+        ----------
+        box_filter: BoxFilter
+            Applied filter, centred on each position.
+        region: tuple[int, int, int, int]
+            Region of positions in the format of (first row, row after the last,
+            first column, column after the last).
+
+        Returns
+        -------
+        result: np.ndarray
+            Sum of the gray values multiplied with the filter at each position,
+            with the leading dimensions of the gray values.
+
+        Raises
+        ------
+        ValueError
+            If the padding is smaller than half of the size of the filter.
+
+        """
+        # Offset between a position and the upper left corner of its window
+        offset: tuple[int, int] = (
+            self.padding - box_filter.get_number_of_rows() // 2,
+            self.padding - box_filter.get_number_of_columns() // 2)
+
+        if min(offset) < 0:
+            raise ValueError("Padding is too small for the filter.")
+
+        # Upper left corner of the window of the first position in the table
+        corner: tuple[int, int] = (region[0] + offset[0], region[2] + offset[1])
+        shape: tuple[int, int] = (max(region[1] - region[0], 0),
+                                  max(region[3] - region[2], 0))
+        result: np.ndarray = np.zeros(self.get_table().shape[:-2] + shape)
+
+        for box in box_filter.get_boxes():
+            result += box[0] * self.get_box_sums(box[1:], corner, shape)
+
+        return result
+
+    def get_box_sums(self, box: tuple[int, int, int, int], corner: tuple[int, int],
+                     shape: tuple[int, int]) -> np.ndarray:
+        """
+        Return the sums of the gray values of one box at many positions.
+
+        Parameters
+        ----------
+        box: tuple[int, int, int, int]
+            Box within the window in the format of (first row, row after the last,
+            first column, column after the last).
+        corner: tuple[int, int]
+            Upper left corner of the window of the first position in the table.
+        shape: tuple[int, int]
+            Number of rows and columns of the positions.
+
+        Returns
+        -------
+        np.ndarray
+            Sum of the gray values of the box at each position, from the four
+            corners of the box in the table.
+
+        """
+        table: np.ndarray = self.get_table()
+        top: int = corner[0] + box[0]
+        bottom: int = corner[0] + box[1]
+        left: int = corner[1] + box[2]
+        right: int = corner[1] + box[3]
+
+        return (table[..., bottom:bottom + shape[0], right:right + shape[1]]
+                - table[..., top:top + shape[0], right:right + shape[1]]
+                - table[..., bottom:bottom + shape[0], left:left + shape[1]]
+                + table[..., top:top + shape[0], left:left + shape[1]])
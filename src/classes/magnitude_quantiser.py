@@ -0,0 +1,252 @@
+"""File containing the MagnitudeQuantiser class."""
+
+# Import necessary for type hints of the shared MagnitudeQuantiser objects
+from __future__ import annotations
+
+# Import for storing the lookup table as a compact array
+import numpy as np
+
+# Import used classes
+from classes.pixel import Pixel
+from classes.matrix import Matrix
+from classes.compute_backend import ComputeBackend
+
+class MagnitudeQuantiser:
+    """
+    A class representing the quantisation of absolute values of gradients to bytes.
+
+    The largest absolute value a filter can produce is mapped to 255, so that edge
+    maps of different filters and modes are comparable. The mapping is done by
+    looking up the truncated absolute values in a precomputed table.
+
+    Attributes
+    ----------
+    mode: str
+        Mode of the absolute value, see ComputeBackend.
+    maximum: float
+        Largest absolute value the filter can produce.
+    table: np.ndarray
+        Quantised value (uint8) of each truncated absolute value up to the maximum.
+
+    Methods
+    -------
+    get_mode
+        Return the mode of the absolute value.
+    get_maximum
+        Return the largest absolute value the filter can produce.
+    get_table
+        Return the lookup table.
+    quantise
+        Quantise absolute values of gradients to bytes.
+    get_maximum_gradient
+        Return the largest absolute gradient of one direction a filter can produce.
+    create
+        Return the shared MagnitudeQuantiser object of a filter and a mode.
+    create_gray_pixels
+        Convert the absolute values of gradients into gray pixels.
+
+    """
+
+    # Shared MagnitudeQuantiser objects by their filter values and mode
+    QUANTISERS: dict[tuple[tuple[tuple[float, ...], ...], str, float],
+                     MagnitudeQuantiser] = {}
+
+    def __init__(self, differential_filter: Matrix, mode: str = "l2",
+                 maximum_gray_value: float = 255.0) -> None:
+        """
+        Construct one MagnitudeQuantiser object for a filter.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        mode: str
+            Mode of the absolute value. The default value is 'l2'.
+        maximum_gray_value: float
+            Largest gray value of the images. The default value is 255.
+
+        Raises
+        ------
+        ValueError
+            If the mode is not supported.
+
+        """
+        ComputeBackend.check_mode(mode)
+
+        # The largest gradients of both directions are equal, as the filter of
+        # the y direction is the transposed one
+        gradient: float = MagnitudeQuantiser.get_maximum_gradient(
+            differential_filter, maximum_gray_value)
+
+        self.mode: str = mode
+        self.maximum: float = {
+            "l2": gradient * 2 ** 0.5,
+            "l1": 2 * gradient,
+            "max": gradient,
+            "alpha_max_beta_min": (ComputeBackend.ALPHA + ComputeBackend.BETA)
+                                  * gradient
+        }[mode]
+
+        # Map every truncated absolute value to its rounded share of 255
+        scale: float = 255 / self.maximum if self.maximum > 0 else 0.0
+        self.table: np.ndarray = np.minimum(
+            np.rint(np.arange(int(self.maximum) + 1) * scale), 255).astype(np.uint8)
+
+    def get_mode(self) -> str:
+        """
+        Return the mode of the absolute value.
+
+        Returns
+        -------
+        self.mode: str
+            Mode of the absolute value.
+
+        """
+        return self.mode
+
+    def get_maximum(self) -> float:
+        """
+        Return the largest absolute value the filter can produce.
+
+        Returns
+        -------
+        self.maximum: float
+            Largest absolute value the filter can produce.
+
+        """
+        return self.maximum
+
+    def get_table(self) -> np.ndarray:
+        """
+        Return the lookup table.
+
+        Returns
+        -------
+        self.table: np.ndarray
+            Quantised value (uint8) of each truncated absolute value.
+
+        """
+        return self.table
+
+    def quantise(self, magnitude: np.ndarray) -> np.ndarray:
+        """
+        Quantise absolute values of gradients to bytes.
+
+        Parameters
+        ----------
+        magnitude: np.ndarray
+            Absolute values of the gradients calculated in the mode of the
+            quantiser.
+
+        Returns
+        -------
+        np.ndarray
+            Quantised absolute values (uint8). Values above the maximum are
+            clipped to 255.
+
+        """
+        indices: np.ndarray = np.minimum(np.asarray(magnitude).astype(np.intp),
+                                         len(self.table) - 1)
+
+        return self.table[indices]
+
+    @staticmethod
+    def get_maximum_gradient(differential_filter: Matrix,
+                             maximum_gray_value: float = 255.0) -> float:
+        """
+        Return the largest absolute gradient of one direction a filter can produce.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        maximum_gray_value: float
+            Largest gray value of the images. The default value is 255.
+
+        Returns
+        -------
+        float
+            Largest absolute gradient, reached if the gray values are maximal at
+            the positive values of the filter and zero at the negative ones or the
+            other way round.
+
+        """
+        values: list[float] = [value for row in differential_filter.get_values()
+                               for value in row]
+
+        return maximum_gray_value * max(sum(value for value in values if value > 0),
+                                        -sum(value for value in values if value < 0))
+
+    @staticmethod
+    def create(differential_filter: Matrix, mode: str = "l2",
+               maximum_gray_value: float = 255.0) -> MagnitudeQuantiser:
+        """
+        Return the shared MagnitudeQuantiser object of a filter and a mode.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        mode: str
+            Mode of the absolute value. The default value is 'l2'.
+        maximum_gray_value: float
+            Largest gray value of the images. The default value is 255.
+
+        Returns
+        -------
+        MagnitudeQuantiser
+            Quantiser created once per filter values, mode and largest gray value.
+
+        """
+        key: tuple[tuple[tuple[float, ...], ...], str, float] = (
+            tuple(tuple(row) for row in differential_filter.get_values()), mode,
+            maximum_gray_value)
+
+        if key not in MagnitudeQuantiser.QUANTISERS:
+            MagnitudeQuantiser.QUANTISERS[key] = MagnitudeQuantiser(
+                differential_filter, mode, maximum_gray_value)
+
+        return MagnitudeQuantiser.QUANTISERS[key]
+
+    @staticmethod
+    def create_gray_pixels(magnitude: np.ndarray, differential_filter: Matrix,
+                           mode: str = "l2",
+                           normalise: bool = False) -> list[list[Pixel]]:
+        """
+        Convert the absolute values of gradients into gray pixels.
+
+        Parameters
+        ----------
+        magnitude: np.ndarray
+            Absolute values of the gradients.
+        differential_filter: Matrix
+            Filter the absolute values were calculated with.
+        mode: str
+            Mode of the absolute value, see ComputeBackend. The default value is
+            'l2'.
+        normalise: bool
+            Whether the absolute values are quantised, see Image.traverse. The
+            default value is False.
+
+        Returns
+        -------
+        pixels_differentiated: list[list[Pixel]]
+            Gray pixels of the truncated or quantised absolute values.
+
+        """
+        # Truncate the absolute values to integers or quantise them to bytes
+        gradients_absolute: list[list[int]] = (
+            MagnitudeQuantiser.create(differential_filter, mode).quantise(magnitude)
+            if normalise else magnitude.astype(int)).tolist()
+
+        # Initialize the return value
+        pixels_differentiated: list[list[Pixel]] = []
+
+        for row_count, row in enumerate(gradients_absolute):
+            pixels_differentiated.append([])
+
+            for gradient_absolute in row:
+                pixels_differentiated[row_count].append(
+                    Pixel.create_gray(gradient_absolute))
+
+        return pixels_differentiated
@@ -0,0 +1,142 @@
+"""File containing the MemoryPlan class."""
+
+# Import for generating the constructor of the plan
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class MemoryPlan:
+    """
+    A class representing the tiling of an image chosen to fit a memory budget.
+
+    Attributes
+    ----------
+    grid_shape: tuple[int, int]
+        Number of rows and columns of the positions differentiated by any filter.
+    tile_shape: tuple[int, int]
+        Number of rows and columns of the positions of one tile.
+    halo: int
+        Number of additional pixels around each tile needed by the filters.
+    order: str
+        Either 'strips' if the tiles span the entire width and are processed from
+        top to bottom or 'blocks' if they are processed row by row.
+    estimate: int
+        Estimated peak memory in bytes.
+    strip_lines: int
+        Number of rows or columns of the image smoothed at once by recursive
+        filters.
+
+    Methods
+    -------
+    get_grid_shape
+        Return the number of rows and columns of the differentiated positions.
+    get_tile_shape
+        Return the number of rows and columns of the positions of one tile.
+    get_halo
+        Return the number of additional pixels around each tile.
+    get_order
+        Return the order in which the tiles are processed.
+    get_estimate
+        Return the estimated peak memory in bytes.
+    get_strip_lines
+        Return the number of lines smoothed at once by recursive filters.
+    get_regions
+        Return the regions of all tiles in the order they are processed.
+
+    """
+
+    grid_shape: tuple[int, int]
+    tile_shape: tuple[int, int]
+    halo: int
+    order: str
+    estimate: int
+    strip_lines: int
+
+    def get_grid_shape(self) -> tuple[int, int]:
+        """
+        Return the number of rows and columns of the differentiated positions.
+
+        Returns
+        -------
+        self.grid_shape: tuple[int, int]
+            Number of rows and columns of the positions differentiated by any
+            filter.
+
+        """
+        return self.grid_shape
+
+    def get_tile_shape(self) -> tuple[int, int]:
+        """
+        Return the number of rows and columns of the positions of one tile.
+
+        Returns
+        -------
+        self.tile_shape: tuple[int, int]
+            Number of rows and columns of the positions of one tile.
+
+        """
+        return self.tile_shape
+
+    def get_halo(self) -> int:
+        """
+        Return the number of additional pixels around each tile.
+
+        Returns
+        -------
+        self.halo: int
+            Number of additional pixels around each tile needed by the filters.
+
+        """
+        return self.halo
+
+    def get_order(self) -> str:
+        """
+        Return the order in which the tiles are processed.
+
+        Returns
+        -------
+        self.order: str
+            Either 'strips' or 'blocks'.
+
+        """
+        return self.order
+
+    def get_estimate(self) -> int:
+        """
+        Return the estimated peak memory in bytes.
+
+        Returns
+        -------
+        self.estimate: int
+            Estimated peak memory in bytes.
+
+        """
+        return self.estimate
+
+    def get_strip_lines(self) -> int:
+        """
+        Return the number of lines smoothed at once by recursive filters.
+
+        Returns
+        -------
+        self.strip_lines: int
+            Number of rows or columns of the image smoothed at once by recursive
+            filters.
+
+        """
+        return self.strip_lines
+
+    def get_regions(self) -> list[tuple[int, int, int, int]]:
+        """
+        Return the regions of all tiles in the order they are processed.
+
+        Returns
+        -------
+        list[tuple[int, int, int, int]]
+            Regions in the format of (first row, row after the last, first column,
+            column after the last), row by row from the upper left corner.
+
+        """
+        return [(row, min(row + self.tile_shape[0], self.grid_shape[0]),
+                 col, min(col + self.tile_shape[1], self.grid_shape[1]))
+                for row in range(0, self.grid_shape[0], max(self.tile_shape[0], 1))
+                for col in range(0, self.grid_shape[1], max(self.tile_shape[1], 1))]
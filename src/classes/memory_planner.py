@@ -0,0 +1,641 @@
+"""File containing the MemoryPlanner class."""
+
+# Imports for the edge maps and intermediate results written to disk
+import os
+import tempfile
+
+# Import for measuring the actual peak memory
+import tracemalloc
+
+# Import for the type hints of the search for the largest tile
+from typing import Callable
+
+# Import for storing the image and the edge maps as compact arrays
+import numpy as np
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.image import Image
+from classes.gradient import Gradient
+from classes.box_filter import BoxFilter
+from classes.recursive_gaussian_filter import RecursiveGaussianFilter
+from classes.filter_bank import FilterBank
+from classes.compute_backend import ComputeBackend
+from classes.memory_plan import MemoryPlan
+
+class MemoryPlanner:
+    """
+    A class representing the planning of the edge detection under a memory budget.
+
+    The image is decoded once into its luminance (one byte per pixel). Its
+    gradients are then calculated tile by tile, so that the gray values as Python
+    floats and the intermediate results only exist for one tile at a time.
+    Recursive filters depend on all pixels of a line and are therefore applied
+    before the tiles in strips of entire rows or columns, passing their
+    intermediate results through memory-mapped temporary files.
+
+    Attributes
+    ----------
+    budget: int
+        Maximum memory in bytes the edge detection may use.
+    dtype: np.dtype
+        Data type of the edge maps.
+    backend: ComputeBackend | None
+        Backend calculating the gradients. If it is None, the backend selected by
+        the registry is used.
+    report: dict[str, object]
+        Estimated and actual peak memory of the last run.
+
+    Methods
+    -------
+    get_report
+        Return the estimated and actual peak memory of the last run.
+    get_tiled_filters
+        Return the filters that are applied tile by tile.
+    get_halo
+        Return the number of additional pixels around each tile needed by filters.
+    get_grid_shape
+        Return the number of rows and columns of the positions differentiated.
+    get_edge_map_bytes
+        Return the memory of the edge maps kept in memory.
+    get_strip_lines
+        Return the number of lines smoothed at once by recursive filters.
+    estimate
+        Estimate the peak memory of the edge detection with a tile shape.
+    plan
+        Choose the largest tiles for which the estimate fits the budget.
+    run
+        Calculate the absolute values of the gradients of an image tile by tile.
+    allocate_edge_maps
+        Allocate the edge maps in memory or on disk.
+    apply_recursive
+        Apply a recursive filter strip by strip.
+    apply_tiles
+        Apply all other filters tile by tile.
+
+    Notes
+    -----
+    The estimate is based on the following bytes per value: a Python float in a
+    list (32) plus a float64 copy of it for the backend (8) plus the windows cut
+    out of it (8) per pixel of a tile including its halo, and the gradients of
+    both directions, their absolute value and temporary arrays (64) per position
+    of a tile. Filters composed of boxes need another 48 bytes per pixel of a tile
+    for the integral image, recursive filters 80 bytes per pixel of a strip and
+    small objects 64 KiB. Memory allocated by the decoder itself and the pages of
+    memory-mapped files are not traced.
+
+    The intermediate results of recursive filters are stored in the data type of
+    the edge maps, so that their edge maps only equal the ones of
+    Image.compute_magnitude up to its precision.
+
+    """
+
+    # Bytes per pixel of a tile including its halo
+    SOURCE_BYTES_PER_PIXEL: int = 48
+
+    # Additional bytes per pixel of a tile including its halo for integral images
+    INTEGRAL_BYTES_PER_PIXEL: int = 48
+
+    # Bytes per row of a tile for the lists of the gray values
+    SOURCE_BYTES_PER_ROW: int = 120
+
+    # Bytes per position of a tile for the gradients and temporary arrays
+    WORKING_BYTES_PER_POSITION: int = 64
+
+    # Bytes per pixel of the image while decoding it (decoder and array)
+    DECODING_BYTES_PER_PIXEL: int = 2
+
+    # Bytes of small objects independent of the size of the image
+    FIXED_BYTES: int = 1 << 16
+
+    # Bytes per pixel of a strip for applying a recursive filter
+    RECURSIVE_BYTES_PER_PIXEL: int = 80
+
+    def __init__(self, budget: int, dtype: type = np.float32,
+                 backend: ComputeBackend | None = None) -> None:
+        """
+        Construct one MemoryPlanner object with the given attributes.
+
+        Parameters
+        ----------
+        budget: int
+            Maximum memory in bytes the edge detection may use.
+        dtype: type
+            Data type of the edge maps. The default value is np.float32.
+        backend: ComputeBackend | None
+            Backend calculating the gradients. The default value is None,
+            indicating that the backend selected by the registry is used.
+
+        Raises
+        ------
+        ValueError
+            If the budget is not positive.
+
+        """
+        if budget <= 0:
+            raise ValueError("Budget must be positive.")
+
+        self.budget: int = budget
+        self.dtype: np.dtype = np.dtype(dtype)
+        self.backend: ComputeBackend | None = backend
+        self.report: dict[str, object] = {}
+
+    def get_report(self) -> dict[str, object]:
+        """
+        Return the estimated and actual peak memory of the last run.
+
+        Returns
+        -------
+        self.report: dict[str, object]
+            Budget, estimated and traced peak memory in bytes, tile shape, order and
+            number of tiles stored under the keys 'budget', 'estimate', 'peak',
+            'tile_shape', 'order' and 'number_of_tiles'. Whether the peak stayed
+            below the estimate and the budget is stored under 'within_estimate'
+            and 'within_budget'.
+
+        """
+        return self.report
+
+    @staticmethod
+    def get_tiled_filters(filters: list[Matrix]) -> list[Matrix]:
+        """
+        Return the filters that are applied tile by tile.
+
+        Parameters
+        ----------
+        filters: list[Matrix]
+            Applied filters.
+
+        Returns
+        -------
+        list[Matrix]
+            All filters except the recursive ones.
+
+        """
+        return [differential_filter for differential_filter in filters
+                if not isinstance(differential_filter, RecursiveGaussianFilter)]
+
+    @staticmethod
+    def get_halo(filters: list[Matrix]) -> int:
+        """
+        Return the number of additional pixels around each tile needed by filters.
+
+        Parameters
+        ----------
+        filters: list[Matrix]
+            Applied filters.
+
+        Returns
+        -------
+        int
+            Half of the largest number of rows or columns of the filters.
+
+        """
+        return max((max(differential_filter.get_number_of_rows(),
+                        differential_filter.get_number_of_columns()) // 2
+                    for differential_filter in filters), default=0)
+
+    @staticmethod
+    def get_grid_shape(image_size: tuple[int, int],
+                       filters: list[Matrix]) -> tuple[int, int]:
+        """
+        Return the number of rows and columns of the positions differentiated.
+
+        Parameters
+        ----------
+        image_size: tuple[int, int]
+            Number of rows and columns of the image.
+        filters: list[Matrix]
+            Applied filters.
+
+        Returns
+        -------
+        tuple[int, int]
+            Largest number of rows and columns of the gradients of any filter.
+
+        """
+        borders: list[tuple[int, int]] = [FilterBank.get_border(differential_filter)
+                                          for differential_filter in filters]
+
+        return (max((max(image_size[0] - 2 * border[0], 0) for border in borders),
+                    default=0),
+                max((max(image_size[1] - 2 * border[1], 0) for border in borders),
+                    default=0))
+
+    def get_edge_map_bytes(self, image_size: tuple[int, int], filters: list[Matrix],
+                           in_memory: bool = True) -> int:
+        """
+        Return the memory of the edge maps kept in memory.
+
+        Parameters
+        ----------
+        image_size: tuple[int, int]
+            Number of rows and columns of the image.
+        filters: list[Matrix]
+            Applied filters.
+        in_memory: bool
+            Whether the edge maps are kept in memory instead of being written to
+            disk. The default value is True.
+
+        Returns
+        -------
+        int
+            Memory of the edge maps of all filters in bytes, 0 if they are written
+            to disk.
+
+        """
+        if not in_memory:
+            return 0
+
+        return sum(max(image_size[0] - 2 * border[0], 0)
+                   * max(image_size[1] - 2 * border[1], 0) * self.dtype.itemsize
+                   for border in map(FilterBank.get_border, filters))
+
+    def get_strip_lines(self, image_size: tuple[int, int], filters: list[Matrix],
+                        in_memory: bool = True) -> int:
+        """
+        Return the number of lines smoothed at once by recursive filters.
+
+        The strips are applied before the tiles, so that they may use all memory
+        not taken by the image and the edge maps.
+
+        Parameters
+        ----------
+        image_size: tuple[int, int]
+            Number of rows and columns of the image.
+        filters: list[Matrix]
+            Applied filters.
+        in_memory: bool
+            Whether the edge maps are kept in memory instead of being written to
+            disk. The default value is True.
+
+        Returns
+        -------
+        int
+            Largest number of rows or columns of a strip fitting the budget, at most
+            the larger side of the image. It is 0 if not even one line fits.
+
+        """
+        available: int = (self.budget - MemoryPlanner.FIXED_BYTES
+                          - image_size[0] * image_size[1]
+                          - self.get_edge_map_bytes(image_size, filters, in_memory))
+        bytes_per_line: int = (max(*image_size, 1)
+                               * MemoryPlanner.RECURSIVE_BYTES_PER_PIXEL)
+
+        return min(max(available // bytes_per_line, 0), max(image_size))
+
+    def estimate(self, image_size: tuple[int, int], filters: list[Matrix],
+                 tile_shape: tuple[int, int], in_memory: bool = True) -> int:
+        """
+        Estimate the peak memory of the edge detection with a tile shape.
+
+        Parameters
+        ----------
+        image_size: tuple[int, int]
+            Number of rows and columns of the image.
+        filters: list[Matrix]
+            Applied filters.
+        tile_shape: tuple[int, int]
+            Number of rows and columns of the positions of one tile.
+        in_memory: bool
+            Whether the edge maps are kept in memory instead of being written to
+            disk. The default value is True.
+
+        Returns
+        -------
+        int
+            Estimated peak memory in bytes.
+
+        """
+        tiled_filters: list[Matrix] = MemoryPlanner.get_tiled_filters(filters)
+        halo: int = MemoryPlanner.get_halo(tiled_filters)
+        grid_shape: tuple[int, int] = MemoryPlanner.get_grid_shape(image_size,
+                                                                   tiled_filters)
+        tile_shape = (min(tile_shape[0], grid_shape[0]),
+                      min(tile_shape[1], grid_shape[1]))
+        pixels: int = image_size[0] * image_size[1]
+
+        # Memory of one tile including its halo and its intermediate results
+        source_bytes_per_pixel: int = MemoryPlanner.SOURCE_BYTES_PER_PIXEL + (
+            MemoryPlanner.INTEGRAL_BYTES_PER_PIXEL
+            if any(isinstance(differential_filter, BoxFilter)
+                   for differential_filter in tiled_filters) else 0)
+        tile: int = ((tile_shape[0] + 2 * halo) * (tile_shape[1] + 2 * halo)
+                     * source_bytes_per_pixel
+                     + (tile_shape[0] + 2 * halo) * MemoryPlanner.SOURCE_BYTES_PER_ROW
+                     + tile_shape[0] * tile_shape[1]
+                     * MemoryPlanner.WORKING_BYTES_PER_POSITION
+                     if tile_shape[0] > 0 and tile_shape[1] > 0 else 0)
+
+        # Memory of one strip of the recursive filters
+        recursive: int = (self.get_strip_lines(image_size, filters, in_memory)
+                          * max(image_size) * MemoryPlanner.RECURSIVE_BYTES_PER_PIXEL
+                          if len(tiled_filters) < len(filters) else 0)
+
+        return (max(pixels * MemoryPlanner.DECODING_BYTES_PER_PIXEL,
+                    pixels + self.get_edge_map_bytes(image_size, filters, in_memory)
+                    + max(tile, recursive))
+                + MemoryPlanner.FIXED_BYTES)
+
+    def plan(self, image_size: tuple[int, int], filters: list[Matrix],
+             in_memory: bool = True) -> MemoryPlan:
+        """
+        Choose the largest tiles for which the estimate fits the budget.
+
+        Both the highest strip spanning the entire width, processed from top to
+        bottom, and the largest square block, processed row by row, are
+        considered. The one whose halo adds the fewest pixels per position is
+        chosen, as the halo is converted and differentiated repeatedly.
+
+        Parameters
+        ----------
+        image_size: tuple[int, int]
+            Number of rows and columns of the image.
+        filters: list[Matrix]
+            Applied filters.
+        in_memory: bool
+            Whether the edge maps are kept in memory instead of being written to
+            disk. The default value is True.
+
+        Returns
+        -------
+        MemoryPlan
+            Tiling of the image.
+
+        Raises
+        ------
+        MemoryError
+            If not even a tile of one position or a strip of one line fits the
+            budget.
+
+        """
+        tiled_filters: list[Matrix] = MemoryPlanner.get_tiled_filters(filters)
+        strip_lines: int = self.get_strip_lines(image_size, filters, in_memory)
+        grid_shape: tuple[int, int] = MemoryPlanner.get_grid_shape(image_size,
+                                                                   tiled_filters)
+
+        def fits(tile_shape: tuple[int, int]) -> bool:
+            return self.estimate(image_size, filters, tile_shape,
+                                 in_memory) <= self.budget
+
+        def find_largest(create_shape: Callable[[int], tuple[int, int]],
+                         maximum: int) -> int:
+            # The estimate grows with the tile, so the largest one is searched
+            lower, upper = 0, maximum
+
+            while lower < upper:
+                middle: int = (lower + upper + 1) // 2
+
+                if fits(create_shape(middle)):
+                    lower = middle
+                else:
+                    upper = middle - 1
+
+            return lower
+
+        halo: int = MemoryPlanner.get_halo(tiled_filters)
+        height: int = find_largest(lambda size: (size, max(grid_shape[1], 1)),
+                                   max(grid_shape[0], 1))
+        side: int = find_largest(lambda size: (size, size), max(min(grid_shape), 1))
+
+        if (height == 0 and side == 0) or (strip_lines == 0
+                                           and len(tiled_filters) < len(filters)):
+            raise MemoryError(f"Budget of {self.budget} bytes is too small for an "
+                              f"image of {image_size[0]}x{image_size[1]} pixels.")
+
+        # Compare the pixels including the halo per position of both tilings
+        candidates: list[tuple[float, tuple[int, int], str]] = [
+            ((size[0] + 2 * halo) * (size[1] + 2 * halo) / (size[0] * size[1]),
+             size, order)
+            for size, order in (((height, max(grid_shape[1], 1)), "strips"),
+                                ((side, side), "blocks"))
+            if size[0] > 0]
+        _, tile_shape, order = min(candidates, key=lambda candidate: candidate[0])
+
+        return MemoryPlan(grid_shape, tile_shape, halo, order,
+                          self.estimate(image_size, filters, tile_shape, in_memory),
+                          strip_lines)
+
+    def run(self, path_to_image: str, filters: dict[str, Matrix],
+            output_directory: str | None = None) -> dict[str, np.ndarray]:
+        """
+        Calculate the absolute values of the gradients of an image tile by tile.
+
+        The peak memory is traced with tracemalloc and compared to the estimate,
+        see get_report.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        filters: dict[str, Matrix]
+            Applied filters by their names.
+        output_directory: str | None
+            Directory the edge maps are written to as memory-mapped NPY files named
+            after the filters, so that they are not counted against the budget.
+            The default value is None, indicating that they are kept in memory.
+
+        Returns
+        -------
+        edge_maps: dict[str, np.ndarray]
+            Absolute values of the gradients of each filter, equal to the ones of
+            Image.compute_magnitude of the image read in mode 'L' (for recursive
+            filters up to the precision of the data type).
+
+        Raises
+        ------
+        MemoryError
+            If not even a tile of one position or a strip of one line fits the
+            budget.
+
+        """
+        started: bool = not tracemalloc.is_tracing()
+
+        if started:
+            tracemalloc.start()
+
+        tracemalloc.reset_peak()
+        memory_before: int = tracemalloc.get_traced_memory()[0]
+
+        gray_plane: np.ndarray = Image.decode_luminance(path_to_image)
+        memory_plan: MemoryPlan = self.plan(
+            (gray_plane.shape[0], gray_plane.shape[1]), list(filters.values()),
+            output_directory is None)
+        edge_maps: dict[str, np.ndarray] = self.allocate_edge_maps(
+            (gray_plane.shape[0], gray_plane.shape[1]), filters, output_directory)
+
+        # Apply recursive filters strip by strip before all other filters
+        for name, differential_filter in filters.items():
+            if isinstance(differential_filter, RecursiveGaussianFilter):
+                self.apply_recursive(gray_plane, differential_filter, edge_maps[name],
+                                     memory_plan.get_strip_lines())
+
+        self.apply_tiles(gray_plane, filters, edge_maps, memory_plan)
+
+        for edge_map in edge_maps.values():
+            if isinstance(edge_map, np.memmap):
+                edge_map.flush()
+
+        peak: int = tracemalloc.get_traced_memory()[1] - memory_before
+
+        if started:
+            tracemalloc.stop()
+
+        self.report = {
+            'budget': self.budget,
+            'estimate': memory_plan.get_estimate(),
+            'peak': peak,
+            'tile_shape': memory_plan.get_tile_shape(),
+            'order': memory_plan.get_order(),
+            'number_of_tiles': len(memory_plan.get_regions()),
+            'within_estimate': peak <= memory_plan.get_estimate(),
+            'within_budget': peak <= self.budget
+        }
+
+        return edge_maps
+
+    def allocate_edge_maps(self, image_size: tuple[int, int],
+                           filters: dict[str, Matrix],
+                           output_directory: str | None) -> dict[str, np.ndarray]:
+        """
+        Allocate the edge maps in memory or on disk.
+
+        Parameters
+        ----------
+        image_size: tuple[int, int]
+            Number of rows and columns of the image.
+        filters: dict[str, Matrix]
+            Applied filters by their names.
+        output_directory: str | None
+            Directory the edge maps are written to as memory-mapped NPY files named
+            after the filters. If it is None, they are kept in memory.
+
+        Returns
+        -------
+        edge_maps: dict[str, np.ndarray]
+            Uninitialized edge maps of each filter with its output shape.
+
+        """
+        edge_maps: dict[str, np.ndarray] = {}
+
+        for name, differential_filter in filters.items():
+            border: tuple[int, int] = FilterBank.get_border(differential_filter)
+            shape: tuple[int, int] = (max(image_size[0] - 2 * border[0], 0),
+                                      max(image_size[1] - 2 * border[1], 0))
+
+            if output_directory is None:
+                edge_maps[name] = np.empty(shape, dtype=self.dtype)
+            else:
+                edge_maps[name] = np.lib.format.open_memmap(
+                    os.path.join(output_directory, f"{name}.npy"), mode="w+",
+                    dtype=self.dtype, shape=shape)
+
+        return edge_maps
+
+    def apply_recursive(self, gray_plane: np.ndarray,
+                        gaussian_filter: RecursiveGaussianFilter,
+                        edge_map: np.ndarray, strip_lines: int) -> None:
+        """
+        Apply a recursive filter strip by strip.
+
+        The passes of RecursiveGaussianFilter.apply_recursive along the rows are
+        applied to strips of entire rows and the passes along the columns to strips
+        of entire columns. The results between them are stored in memory-mapped
+        temporary files.
+
+        Parameters
+        ----------
+        gray_plane: np.ndarray
+            Gray values of the image.
+        gaussian_filter: RecursiveGaussianFilter
+            Applied filter.
+        edge_map: np.ndarray
+            Edge map receiving the absolute values of the gradients, cut out at the
+            upper left like in compute_gradients.
+        strip_lines: int
+            Number of rows or columns of one strip.
+
+        """
+        rows, cols = gray_plane.shape
+        step: int = max(strip_lines, 1)
+
+        with tempfile.TemporaryFile() as file_x, tempfile.TemporaryFile() as file_y:
+            gradient_x: np.ndarray = np.memmap(file_x, dtype=self.dtype, mode="w+",
+                                               shape=(rows, cols))
+            gradient_y: np.ndarray = np.memmap(file_y, dtype=self.dtype, mode="w+",
+                                               shape=(rows, cols))
+
+            # Smooth the rows and take the central differences along them
+            for first in range(0, rows, step):
+                padded: np.ndarray = np.pad(gaussian_filter.smooth(
+                    gray_plane[first:first + step].astype(np.float64), -1),
+                    ((0, 0), (1, 1)), mode="edge")
+                gradient_x[first:first + step] = (padded[:, 2:] - padded[:, :-2]) / 2
+
+            # Smooth the columns, take the central differences along them and
+            # smooth the differences of the rows along the columns
+            for first in range(0, cols, step):
+                padded = np.pad(gaussian_filter.smooth(
+                    gray_plane[:, first:first + step].astype(np.float64), -2),
+                    ((1, 1), (0, 0)), mode="edge")
+                gradient_y[:, first:first + step] = (padded[2:] - padded[:-2]) / 2
+                gradient_x[:, first:first + step] = gaussian_filter.smooth(
+                    gradient_x[:, first:first + step], -2)
+
+            # Smooth the differences of the columns along the rows
+            for first in range(0, edge_map.shape[0], step):
+                last: int = min(first + step, edge_map.shape[0])
+                edge_map[first:last] = Gradient(
+                    gradient_x[first:last, :edge_map.shape[1]].astype(np.float64),
+                    gaussian_filter.smooth(gradient_y[first:last], -1)
+                    [:, :edge_map.shape[1]]).get_magnitude()
+
+            del gradient_x, gradient_y
+
+    def apply_tiles(self, gray_plane: np.ndarray, filters: dict[str, Matrix],
+                    edge_maps: dict[str, np.ndarray], memory_plan: MemoryPlan) -> None:
+        """
+        Apply all other filters tile by tile.
+
+        Parameters
+        ----------
+        gray_plane: np.ndarray
+            Gray values of the image.
+        filters: dict[str, Matrix]
+            Applied filters by their names. Recursive filters are skipped.
+        edge_maps: dict[str, np.ndarray]
+            Edge maps of each filter receiving the absolute values of the
+            gradients.
+        memory_plan: MemoryPlan
+            Tiling of the image.
+
+        """
+        halo: int = memory_plan.get_halo()
+
+        for region in memory_plan.get_regions():
+            # Cut out the tile with its halo, continuing at the opposite border
+            tile: Image = Image(None, Matrix(gray_plane.take(
+                np.arange(region[0] - halo, region[1] + halo), axis=0,
+                mode="wrap").take(
+                np.arange(region[2] - halo, region[3] + halo), axis=1,
+                mode="wrap").astype(np.float64).tolist()))
+
+            for name, differential_filter in filters.items():
+                if isinstance(differential_filter, RecursiveGaussianFilter):
+                    continue
+
+                # Clip the region to the edge map of the filter
+                rows: tuple[int, int] = (region[0],
+                                         min(region[1], edge_maps[name].shape[0]))
+                cols: tuple[int, int] = (region[2],
+                                         min(region[3], edge_maps[name].shape[1]))
+
+                if rows[0] < rows[1] and cols[0] < cols[1]:
+                    edge_maps[name][rows[0]:rows[1], cols[0]:cols[1]] = (
+                        tile.compute_magnitude(
+                            differential_filter,
+                            (rows[0] - region[0] + halo, rows[1] - region[0] + halo,
+                             cols[0] - region[2] + halo, cols[1] - region[2] + halo),
+                            self.backend))
+
+            del tile
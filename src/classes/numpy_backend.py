@@ -0,0 +1,189 @@
+"""File containing the NumpyBackend class."""
+
+# Import for calculating the gradients as arrays
+import numpy as np
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.compute_backend import ComputeBackend
+
+class NumpyBackend(ComputeBackend):
+    """
+    A class representing the backend calculating the gradients with NumPy arrays.
+
+    The filter is applied by adding up shifted views of the gray values, one per
+    non-zero value of the filter, so that every step is a vectorized operation on
+    the entire region.
+
+    Methods
+    -------
+    create_plane
+        Convert the gray values into a float64 array.
+    correlate
+        Apply a filter centred on all positions of a region.
+    magnitude
+        Calculate the absolute value of the gradients of both directions.
+    combine_absolute
+        Combine the absolute values of both directions in place.
+    to_list
+        Convert an array into nested lists.
+
+    """
+
+    def __init__(self) -> None:
+        """Construct one NumpyBackend object."""
+        super().__init__("numpy")
+
+    def create_plane(self, gray_matrix: Matrix) -> np.ndarray:
+        """
+        Convert the gray values into a float64 array.
+
+        Parameters
+        ----------
+        gray_matrix: Matrix
+            Gray values of the image.
+
+        Returns
+        -------
+        np.ndarray
+            Gray values of the image.
+
+        """
+        return np.array(gray_matrix.get_values(), dtype=np.float64)
+
+    def correlate(self, plane: object, differential_filter: Matrix,
+                  region: tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Apply a filter centred on all positions of a region.
+
+        Parameters
+        ----------
+        plane: object
+            Gray values as a float64 array.
+        differential_filter: Matrix
+            Applied filter with an odd number of rows and columns.
+        region: tuple[int, int, int, int]
+            Region of positions in the format of (first row, row after the last,
+            first column, column after the last).
+
+        Returns
+        -------
+        result: np.ndarray
+            Sum of the gray values multiplied with the filter at each position.
+
+        Notes
+        -----
+        The values of the filter are added in the same order as by the reference
+        backend, so that the results are identical.
+
+        """
+        if not isinstance(plane, np.ndarray):
+            raise TypeError("Plane must be an array.")
+
+        height: int = max(region[1] - region[0], 0)
+        width: int = max(region[3] - region[2], 0)
+        half: tuple[int, int] = (differential_filter.get_number_of_rows() // 2,
+                                 differential_filter.get_number_of_columns() // 2)
+
+        # Cut out the windows of the region, continuing at the opposite border
+        window: np.ndarray = plane.take(
+            np.arange(region[0] - half[0], region[0] + height + half[0]),
+            axis=0, mode="wrap").take(
+            np.arange(region[2] - half[1], region[2] + width + half[1]),
+            axis=1, mode="wrap")
+
+        result: np.ndarray = np.zeros((height, width))
+
+        for row, values in enumerate(differential_filter.get_values()):
+            for col, value in enumerate(values):
+                if value != 0:
+                    result += value * window[row:row + height, col:col + width]
+
+        return result
+
+    def magnitude(self, gradient_x: object, gradient_y: object,
+                  mode: str = "l2") -> np.ndarray:
+        """
+        Calculate the absolute value of the gradients of both directions.
+
+        Parameters
+        ----------
+        gradient_x: object
+            Gradients in the x direction as an array.
+        gradient_y: object
+            Gradients in the y direction as an array.
+        mode: str
+            Mode of the absolute value. The default value is 'l2'.
+
+        Returns
+        -------
+        np.ndarray
+            Absolute value of the gradients of both directions.
+
+        """
+        ComputeBackend.check_mode(mode)
+
+        values_x: np.ndarray = np.asarray(gradient_x)
+        values_y: np.ndarray = np.asarray(gradient_y)
+
+        if mode == "l2":
+            return np.sqrt(np.square(values_x) + np.square(values_y))
+
+        return NumpyBackend.combine_absolute(np.abs(values_x), np.abs(values_y), mode)
+
+    @staticmethod
+    def combine_absolute(magnitude: np.ndarray, absolute_y: np.ndarray, mode: str,
+                         larger: np.ndarray | None = None) -> np.ndarray:
+        """
+        Combine the absolute values of both directions in place.
+
+        Parameters
+        ----------
+        magnitude: np.ndarray
+            Absolute values of the gradients in the x direction, overwritten by the
+            result.
+        absolute_y: np.ndarray
+            Absolute values of the gradients in the y direction.
+        mode: str
+            Mode of the absolute value except 'l2'.
+        larger: np.ndarray | None
+            Buffer of the larger absolute values in the mode 'alpha_max_beta_min'.
+            The default value is None, indicating that a new array is created.
+
+        Returns
+        -------
+        magnitude: np.ndarray
+            Absolute value of the gradients of both directions.
+
+        """
+        if mode == "l1":
+            magnitude += absolute_y
+        elif mode == "max":
+            np.maximum(magnitude, absolute_y, out=magnitude)
+        else:
+            # The smaller value is the sum minus the larger one
+            larger = np.maximum(magnitude, absolute_y, out=larger)
+            magnitude += absolute_y
+            magnitude -= larger
+            magnitude *= ComputeBackend.BETA
+            larger *= ComputeBackend.ALPHA
+            magnitude += larger
+
+        return magnitude
+
+    def to_list(self, result: object) -> list[list[float]]:
+        """
+        Convert an array into nested lists.
+
+        Parameters
+        ----------
+        result: object
+            Result of correlate or magnitude.
+
+        Returns
+        -------
+        list[list[float]]
+            Values of the result.
+
+        """
+        return np.asarray(result).tolist()
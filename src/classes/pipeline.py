@@ -0,0 +1,655 @@
+"""File containing the Pipeline class."""
+
+# Import necessary for type hints of the created Pipeline objects
+from __future__ import annotations
+
+# Imports for the type hints of the results and for binding their arguments
+from functools import partial
+from typing import Any, Callable
+
+# Import used classes
+from classes.pixel import Pixel
+from classes.matrix import Matrix
+from classes.image import Image
+from classes.sparse_edge_map import SparseEdgeMap
+from classes.edge_map_writer import EdgeMapWriter
+from classes.magnitude_quantiser import MagnitudeQuantiser
+from classes.thread_executor import ThreadExecutor
+from classes.pipeline_node import PipelineNode
+from classes.pipeline_options import PipelineOptions
+
+class Pipeline:
+    """
+    A class representing the stages of the edge detection as a lazy graph.
+
+    The stages (decode, gray, gradients, magnitude, threshold, pixels, render and
+    write) are added as nodes identified by their stage and parameters, so that a
+    stage requested twice, e.g. the gradients of a filter both rendered and
+    thresholded, is only added once. Nothing is calculated until the pipeline is
+    evaluated, and then only the stages the requested outputs depend on.
+
+    Attributes
+    ----------
+    nodes: dict[tuple, PipelineNode]
+        All added nodes by their keys.
+    outputs: dict[str, PipelineNode]
+        Requested nodes by the names of their outputs.
+    executor: ThreadExecutor | None
+        Executor evaluating independent nodes concurrently.
+    filters: dict[str, list[Matrix]]
+        Filters of the added gradient stages by the paths to the images.
+
+    Methods
+    -------
+    get_nodes
+        Return all added nodes by their keys.
+    get_outputs
+        Return the requested nodes by the names of their outputs.
+    add_node
+        Add a node unless one with the same key has been added already.
+    add_decode
+        Add the stage reading an image.
+    add_gray
+        Add the stage holding the gray values of an image.
+    create_gray
+        Create an Image object only holding the gray values of another one.
+    get_filter_key
+        Return the kernel identifying the gradients of a filter.
+    add_gradients
+        Add the stage calculating the gradients of a filter.
+    add_magnitude
+        Add the stage calculating the absolute values of the gradients.
+    add_threshold
+        Add the stage keeping the edges above a threshold.
+    add_pixels
+        Add the stage converting the absolute values into gray pixels.
+    add_render
+        Add the stage creating a displayable image of an edge map.
+    add_write
+        Add the stage writing an edge map into a PNG file.
+    request
+        Request the result of a node as an output.
+    get_required_nodes
+        Return the nodes the requested outputs depend on in evaluation order.
+    prune
+        Remove all nodes the requested outputs do not depend on.
+    evaluate
+        Calculate the requested outputs.
+    clear_cache
+        Drop the kept results of a node and of all nodes depending on it.
+    depends_on
+        Check whether a node depends on another one.
+    create_from_selections
+        Create the pipeline of the selections of the user interface.
+
+    """
+
+    def __init__(self, executor: ThreadExecutor | None = None) -> None:
+        """
+        Construct one empty Pipeline object.
+
+        Parameters
+        ----------
+        executor: ThreadExecutor | None
+            Executor evaluating independent nodes concurrently. The default value
+            is None, indicating that the nodes are evaluated one after another.
+
+        """
+        self.nodes: dict[tuple, PipelineNode] = {}
+        self.outputs: dict[str, PipelineNode] = {}
+        self.executor: ThreadExecutor | None = executor
+        self.filters: dict[str, list[Matrix]] = {}
+
+    def get_nodes(self) -> dict[tuple, PipelineNode]:
+        """
+        Return all added nodes by their keys.
+
+        Returns
+        -------
+        self.nodes: dict[tuple, PipelineNode]
+            All added nodes by their keys.
+
+        """
+        return self.nodes
+
+    def get_outputs(self) -> dict[str, PipelineNode]:
+        """
+        Return the requested nodes by the names of their outputs.
+
+        Returns
+        -------
+        self.outputs: dict[str, PipelineNode]
+            Requested nodes by the names of their outputs.
+
+        """
+        return self.outputs
+
+    def add_node(self, key: tuple, operation: Callable[..., Any],
+                 inputs: list[PipelineNode] | None = None,
+                 cacheable: bool = True) -> PipelineNode:
+        """
+        Add a node unless one with the same key has been added already.
+
+        Parameters
+        ----------
+        key: tuple
+            Stage and parameters identifying the node.
+        operation: Callable[..., Any]
+            Operation calculating the result from the results of the input nodes.
+        inputs: list[PipelineNode] | None
+            Nodes whose results are passed to the operation. The default value is
+            None.
+        cacheable: bool
+            Whether the result is kept for later evaluations. The default value is
+            True.
+
+        Returns
+        -------
+        PipelineNode
+            The added node or the one added before with the same key.
+
+        """
+        if key not in self.nodes:
+            self.nodes[key] = PipelineNode(key, operation, inputs, cacheable)
+
+        return self.nodes[key]
+
+    def add_decode(self, path_to_image: str, mode: str = "RGB") -> PipelineNode:
+        """
+        Add the stage reading an image.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        mode: str
+            Either 'RGB' or 'L', see Image.read_image. The default value is 'RGB'.
+
+        Returns
+        -------
+        PipelineNode
+            Node of the read Image object.
+
+        """
+        return self.add_node(("decode", path_to_image, mode),
+                             lambda: Image.read_image(path_to_image, mode=mode))
+
+    def add_gray(self, path_to_image: str) -> PipelineNode:
+        """
+        Add the stage holding the gray values of an image.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+
+        Returns
+        -------
+        PipelineNode
+            Node of an Image object only holding the gray values. They are derived
+            from the colours if the stage reading them has been added before,
+            otherwise only the luminance is decoded. The mode of the read image is
+            part of the key, as both gray values may differ slightly.
+
+        """
+        # Derive the gray values from the colours once they are read anyway
+        mode: str = "RGB" if ("decode", path_to_image, "RGB") in self.nodes else "L"
+        decode: PipelineNode = self.add_decode(path_to_image, mode)
+
+        return self.add_node(("gray", path_to_image, mode),
+                             partial(self.create_gray, path_to_image), [decode])
+
+    def create_gray(self, path_to_image: str, image: Image) -> Image:
+        """
+        Create an Image object only holding the gray values of another one.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        image: Image
+            Read image.
+
+        Returns
+        -------
+        gray_image: Image
+            Image object only holding the gray values. If the nodes are evaluated
+            concurrently, the representations used by the filters are created
+            beforehand, so that the threads only read them.
+
+        """
+        gray_image: Image = Image(None, image.get_gray_matrix())
+
+        if self.executor is not None:
+            ThreadExecutor.prepare(gray_image, self.filters.get(path_to_image, []))
+
+        return gray_image
+
+    @staticmethod
+    def get_filter_key(differential_filter: Matrix) -> tuple:
+        """
+        Return the kernel identifying the gradients of a filter.
+
+        Parameters
+        ----------
+        differential_filter: Matrix
+            Applied filter to differentiate.
+
+        Returns
+        -------
+        tuple
+            Class, shape and values of the filter, so that filters with equal
+            kernels share their stages whatever their names.
+
+        """
+        return (type(differential_filter).__name__,
+                (differential_filter.get_number_of_rows(),
+                 differential_filter.get_number_of_columns()),
+                tuple(tuple(row) for row in differential_filter.get_values()))
+
+    def add_gradients(self, path_to_image: str,
+                      differential_filter: Matrix) -> PipelineNode:
+        """
+        Add the stage calculating the gradients of a filter.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        differential_filter: Matrix
+            Applied filter to differentiate.
+
+        Returns
+        -------
+        PipelineNode
+            Node of the Gradient object of the filter.
+
+        """
+        gray: PipelineNode = self.add_gray(path_to_image)
+        key: tuple = (("gradients",) + gray.get_key()[1:]
+                      + (Pipeline.get_filter_key(differential_filter),))
+
+        if key not in self.nodes:
+            self.filters.setdefault(path_to_image, []).append(differential_filter)
+
+        return self.add_node(
+            key,
+            lambda image: image.compute_gradients(differential_filter,
+                                                  executor=self.executor),
+            [gray])
+
+    def add_magnitude(self, path_to_image: str, differential_filter: Matrix,
+                      options: PipelineOptions | None = None) -> PipelineNode:
+        """
+        Add the stage calculating the absolute values of the gradients.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        options: PipelineOptions | None
+            Options holding the mode of the absolute value. The default value is
+            None, indicating the default options.
+
+        Returns
+        -------
+        PipelineNode
+            Node of the absolute values as an array.
+
+        """
+        if options is None:
+            options = PipelineOptions()
+
+        mode: str = options.mode
+        gradients: PipelineNode = self.add_gradients(path_to_image,
+                                                     differential_filter)
+
+        return self.add_node(("magnitude",) + gradients.get_key()[1:] + (mode,),
+                             lambda gradient: gradient.get_magnitude(mode),
+                             [gradients])
+
+    def add_threshold(self, path_to_image: str, differential_filter: Matrix,
+                      threshold: float,
+                      options: PipelineOptions | None = None) -> PipelineNode:
+        """
+        Add the stage keeping the edges above a threshold.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        threshold: float
+            Absolute values greater than or equal to the threshold are kept.
+        options: PipelineOptions | None
+            Options holding the mode of the absolute value. The default value is
+            None, indicating the default options.
+
+        Returns
+        -------
+        PipelineNode
+            Node of the SparseEdgeMap object of the edges.
+
+        """
+        magnitude: PipelineNode = self.add_magnitude(path_to_image,
+                                                     differential_filter, options)
+
+        return self.add_node(
+            ("threshold",) + magnitude.get_key()[1:] + (threshold,),
+            lambda values: SparseEdgeMap.from_dense(values, threshold), [magnitude])
+
+    def add_pixels(self, path_to_image: str, differential_filter: Matrix,
+                   options: PipelineOptions | None = None) -> PipelineNode:
+        """
+        Add the stage converting the absolute values into gray pixels.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        options: PipelineOptions | None
+            Options holding the mode of the absolute value and whether the
+            absolute values are quantised. The default value is None, indicating
+            the default options.
+
+        Returns
+        -------
+        PipelineNode
+            Node of the pixels, equal to the ones of Image.traverse.
+
+        """
+        if options is None:
+            options = PipelineOptions()
+
+        magnitude: PipelineNode = self.add_magnitude(path_to_image,
+                                                     differential_filter, options)
+        mode: str = options.mode
+        normalise: bool = options.normalise
+
+        return self.add_node(
+            ("pixels",) + magnitude.get_key()[1:] + (normalise,),
+            lambda values: MagnitudeQuantiser.create_gray_pixels(
+                values, differential_filter, mode, normalise),
+            [magnitude])
+
+    def add_render(self, path_to_image: str, differential_filter: Matrix,
+                   options: PipelineOptions | None = None) -> PipelineNode:
+        """
+        Add the stage creating a displayable image of an edge map.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        options: PipelineOptions | None
+            Options of the edge map, see add_pixels. The default value is None,
+            indicating the default options.
+
+        Returns
+        -------
+        PipelineNode
+            Node of the Image object of the edge map.
+
+        """
+        pixels: PipelineNode = self.add_pixels(path_to_image, differential_filter,
+                                               options)
+
+        return self.add_node(("render",) + pixels.get_key()[1:], Image, [pixels])
+
+    def add_write(self, path_to_image: str, differential_filter: Matrix,
+                  path_to_output: str,
+                  options: PipelineOptions | None = None) -> PipelineNode:
+        """
+        Add the stage writing an edge map into a PNG file.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the image.
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        path_to_output: str
+            Path to the written file.
+        options: PipelineOptions | None
+            Options of the edge map, see add_pixels. The default value is None,
+            indicating the default options.
+
+        Returns
+        -------
+        PipelineNode
+            Node of the path to the written file. It is written again by every
+            evaluation.
+
+        """
+        pixels: PipelineNode = self.add_pixels(path_to_image, differential_filter,
+                                               options)
+
+        def write(edge_map: list[list[Pixel]]) -> str:
+            EdgeMapWriter.write_png(edge_map, path_to_output)
+
+            return path_to_output
+
+        return self.add_node(("write",) + pixels.get_key()[1:] + (path_to_output,),
+                             write, [pixels], cacheable=False)
+
+    def request(self, name: str, node: PipelineNode) -> None:
+        """
+        Request the result of a node as an output.
+
+        Parameters
+        ----------
+        name: str
+            Name of the output.
+        node: PipelineNode
+            Node calculating the output.
+
+        """
+        self.outputs[name] = node
+
+    def get_required_nodes(self, names: list[str] | None = None
+                           ) -> list[PipelineNode]:
+        """
+        Return the nodes the requested outputs depend on in evaluation order.
+
+        Parameters
+        ----------
+        names: list[str] | None
+            Names of the outputs. The default value is None, indicating all
+            requested outputs.
+
+        Returns
+        -------
+        required_nodes: list[PipelineNode]
+            Nodes whose inputs precede them, each only once.
+
+        Raises
+        ------
+        KeyError
+            If an output has not been requested.
+
+        """
+        required_nodes: list[PipelineNode] = []
+        visited: set[tuple] = set()
+
+        # Walk from each output to its inputs and append the nodes after them
+        stack: list[tuple[PipelineNode, bool]] = [
+            (self.outputs[name], False)
+            for name in reversed(list(self.outputs) if names is None else names)]
+
+        while stack:
+            node, expanded = stack.pop()
+
+            if expanded:
+                required_nodes.append(node)
+            elif node.get_key() not in visited:
+                visited.add(node.get_key())
+                stack.append((node, True))
+                stack.extend((input_node, False)
+                             for input_node in reversed(node.get_inputs()))
+
+        return required_nodes
+
+    def prune(self) -> None:
+        """Remove all nodes the requested outputs do not depend on."""
+        required: set[tuple] = {node.get_key() for node in self.get_required_nodes()}
+        self.nodes = {key: node for key, node in self.nodes.items()
+                      if key in required}
+
+    def evaluate(self, names: list[str] | None = None) -> dict[str, Any]:
+        """
+        Calculate the requested outputs.
+
+        Parameters
+        ----------
+        names: list[str] | None
+            Names of the calculated outputs. The default value is None, indicating
+            all requested outputs.
+
+        Returns
+        -------
+        dict[str, Any]
+            Results of the outputs by their names in the order of the request.
+
+        Raises
+        ------
+        KeyError
+            If an output has not been requested.
+
+        """
+        # Results of this evaluation, including the ones of uncacheable nodes
+        results: dict[tuple, Any] = {}
+
+        # Nodes of the same depth do not depend on each other
+        depths: dict[tuple, int] = {}
+        levels: list[list[PipelineNode]] = []
+
+        for node in self.get_required_nodes(names):
+            if node.is_cached():
+                results[node.get_key()] = node.get_result()
+                depths[node.get_key()] = -1
+                continue
+
+            depths[node.get_key()] = 1 + max(
+                [depths[input_node.get_key()] for input_node in node.get_inputs()]
+                + [-1])
+
+            if depths[node.get_key()] == len(levels):
+                levels.append([])
+            levels[depths[node.get_key()]].append(node)
+
+        for level in levels:
+            tasks: list[Callable[[], Any]] = [
+                partial(node.evaluate, [results[input_node.get_key()]
+                                        for input_node in node.get_inputs()])
+                for node in level]
+
+            for node, result in zip(level, self.executor.run_all(tasks)
+                                    if self.executor is not None
+                                    else [task() for task in tasks]):
+                results[node.get_key()] = result
+
+        return {name: results[self.outputs[name].get_key()]
+                for name in (list(self.outputs) if names is None else names)}
+
+    def clear_cache(self, node: PipelineNode | None = None) -> None:
+        """
+        Drop the kept results of a node and of all nodes depending on it.
+
+        Parameters
+        ----------
+        node: PipelineNode | None
+            Node whose result is outdated. The default value is None, indicating
+            that the results of all nodes are dropped.
+
+        """
+        for dependent in self.nodes.values():
+            if (node is None or dependent is node
+                    or Pipeline.depends_on(dependent, node)):
+                dependent.clear()
+
+    @staticmethod
+    def depends_on(dependent: PipelineNode, dependency: PipelineNode) -> bool:
+        """
+        Check whether a node depends on another one.
+
+        Parameters
+        ----------
+        dependent: PipelineNode
+            Possibly depending node.
+        dependency: PipelineNode
+            Possible input of the depending node or of one of its inputs.
+
+        Returns
+        -------
+        bool
+            True if the dependency is reached from the inputs of the depending
+            node.
+
+        """
+        stack: list[PipelineNode] = list(dependent.get_inputs())
+
+        while stack:
+            input_node: PipelineNode = stack.pop()
+
+            if input_node is dependency:
+                return True
+
+            stack.extend(input_node.get_inputs())
+
+        return False
+
+    @staticmethod
+    def create_from_selections(path_to_image: str, filters: dict[str, Matrix],
+                               options: PipelineOptions | None = None,
+                               executor: ThreadExecutor | None = None) -> Pipeline:
+        """
+        Create the pipeline of the selections of the user interface.
+
+        Parameters
+        ----------
+        path_to_image: str
+            Path to the selected image.
+        filters: dict[str, Matrix]
+            Selected filters by their names.
+        options: PipelineOptions | None
+            Options of the edge maps and whether the original and the grayscale
+            image are shown. The default value is None, indicating the default
+            options.
+        executor: ThreadExecutor | None
+            Executor evaluating independent nodes concurrently. The default value
+            is None.
+
+        Returns
+        -------
+        pipeline: Pipeline
+            Pipeline with the outputs 'Original Image', 'Grayscale Image' and the
+            name of each filter followed by ' filter', each an Image object in the
+            order they are shown. The colours are only read if the original image
+            is shown, and the gray values are then derived from them.
+
+        """
+        if options is None:
+            options = PipelineOptions()
+
+        pipeline: Pipeline = Pipeline(executor)
+
+        if options.show_original:
+            pipeline.request("Original Image",
+                             pipeline.add_decode(path_to_image, "RGB"))
+        if options.show_grayscale:
+            pipeline.request("Grayscale Image", pipeline.add_gray(path_to_image))
+
+        for name, differential_filter in filters.items():
+            pipeline.request(name + " filter", pipeline.add_render(
+                path_to_image, differential_filter, options))
+
+        pipeline.prune()
+
+        return pipeline
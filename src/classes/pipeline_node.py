@@ -0,0 +1,169 @@
+"""File containing the PipelineNode class."""
+
+# Import necessary for type hints of the input nodes
+from __future__ import annotations
+
+# Import for the type hints of the operation and its result
+from typing import Any, Callable
+
+class PipelineNode:
+    """
+    A class representing one stage of a Pipeline.
+
+    Attributes
+    ----------
+    key: tuple
+        Stage and parameters identifying the node, e.g. ('gray', path to the image,
+        mode of the read image).
+    operation: Callable[..., Any]
+        Operation calculating the result from the results of the input nodes.
+    inputs: list[PipelineNode]
+        Nodes whose results are passed to the operation in this order.
+    cacheable: bool
+        Whether the result is kept for later evaluations.
+    result: Any
+        Kept result of the operation.
+    cached: bool
+        Whether the result is kept.
+
+    Methods
+    -------
+    get_key
+        Return the stage and parameters identifying the node.
+    get_inputs
+        Return the input nodes.
+    is_cacheable
+        Check whether the result is kept for later evaluations.
+    is_cached
+        Check whether the result is kept.
+    get_result
+        Return the kept result.
+    evaluate
+        Run the operation on the results of the input nodes.
+    clear
+        Drop the kept result.
+
+    """
+
+    def __init__(self, key: tuple, operation: Callable[..., Any],
+                 inputs: list[PipelineNode] | None = None,
+                 cacheable: bool = True) -> None:
+        """
+        Construct one PipelineNode object with the given attributes.
+
+        Parameters
+        ----------
+        key: tuple
+            Stage and parameters identifying the node.
+        operation: Callable[..., Any]
+            Operation calculating the result from the results of the input nodes.
+        inputs: list[PipelineNode] | None
+            Nodes whose results are passed to the operation. The default value is
+            None, indicating that the node has no inputs.
+        cacheable: bool
+            Whether the result is kept for later evaluations. The default value is
+            True.
+
+        """
+        self.key: tuple = key
+        self.operation: Callable[..., Any] = operation
+        self.inputs: list[PipelineNode] = [] if inputs is None else inputs
+        self.cacheable: bool = cacheable
+        self.result: Any = None
+        self.cached: bool = False
+
+    def get_key(self) -> tuple:
+        """
+        Return the stage and parameters identifying the node.
+
+        Returns
+        -------
+        self.key: tuple
+            Stage and parameters identifying the node.
+
+        """
+        return self.key
+
+    def get_inputs(self) -> list[PipelineNode]:
+        """
+        Return the input nodes.
+
+        Returns
+        -------
+        self.inputs: list[PipelineNode]
+            Nodes whose results are passed to the operation.
+
+        """
+        return self.inputs
+
+    def is_cacheable(self) -> bool:
+        """
+        Check whether the result is kept for later evaluations.
+
+        Returns
+        -------
+        self.cacheable: bool
+            Whether the result is kept for later evaluations.
+
+        """
+        return self.cacheable
+
+    def is_cached(self) -> bool:
+        """
+        Check whether the result is kept.
+
+        Returns
+        -------
+        self.cached: bool
+            Whether the result is kept.
+
+        """
+        return self.cached
+
+    def get_result(self) -> Any:
+        """
+        Return the kept result.
+
+        Returns
+        -------
+        self.result: Any
+            Kept result of the operation.
+
+        Raises
+        ------
+        ValueError
+            If no result is kept.
+
+        """
+        if not self.cached:
+            raise ValueError(f"Node {self.key} has not been evaluated.")
+
+        return self.result
+
+    def evaluate(self, arguments: list[Any]) -> Any:
+        """
+        Run the operation on the results of the input nodes.
+
+        Parameters
+        ----------
+        arguments: list[Any]
+            Results of the input nodes in their order.
+
+        Returns
+        -------
+        result: Any
+            Result of the operation, kept if the node is cacheable.
+
+        """
+        result: Any = self.operation(*arguments)
+
+        if self.cacheable:
+            self.result = result
+            self.cached = True
+
+        return result
+
+    def clear(self) -> None:
+        """Drop the kept result."""
+        self.result = None
+        self.cached = False
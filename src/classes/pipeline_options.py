@@ -0,0 +1,42 @@
+"""File containing the PipelineOptions class."""
+
+# Import for generating the constructor of the options
+from dataclasses import dataclass
+
+# Import used classes
+from classes.compute_backend import ComputeBackend
+
+@dataclass(frozen=True)
+class PipelineOptions:
+    """
+    A class representing how a Pipeline calculates and shows the edge maps.
+
+    Attributes
+    ----------
+    mode: str
+        Mode of the absolute value, see ComputeBackend. The default value is 'l2'.
+    normalise: bool
+        Whether the absolute values are quantised, see Image.traverse. The default
+        value is False.
+    show_original: bool
+        Whether Pipeline.create_from_selections requests the original image. The
+        default value is True.
+    show_grayscale: bool
+        Whether Pipeline.create_from_selections requests the grayscale image. The
+        default value is True.
+
+    Raises
+    ------
+    ValueError
+        If the mode is not supported.
+
+    """
+
+    mode: str = "l2"
+    normalise: bool = False
+    show_original: bool = True
+    show_grayscale: bool = True
+
+    def __post_init__(self) -> None:
+        """Check the options after they are set."""
+        ComputeBackend.check_mode(self.mode)
@@ -1,5 +1,8 @@
 """File containing the Pixel class."""
 
+# Import necessary for type hints of the shared Pixel objects
+from __future__ import annotations
+
 class Pixel:
     """
     A class representing one Pixel.
@@ -12,8 +15,9 @@ class Pixel:
         Value of the primary colour green.
     blue_value: float
         Value of the primary colour blue.
-    grey_value: int
-        Grey value of the pixel.
+    grey_value: int | None
+        Grey value of the pixel. It is only determined once it is needed for the
+        first time.
 
     Methods
     -------
@@ -21,9 +25,21 @@ class Pixel:
         Return the grey value of the pixel.
     get_rgb_values
         Return the RGB values of the image as a tuple.
+    create_gray
+        Return a Pixel object of a gray value, shared for the gray values of bytes.
+
+    Notes
+    -----
+    The attributes are stored in slots instead of a dictionary per object. Pixel
+    objects may be shared by several images and must therefore not be changed.
 
     """
 
+    __slots__ = ("red_value", "green_value", "blue_value", "grey_value")
+
+    # Number of integer gray values with a shared Pixel object, one per byte value
+    GRAY_LEVELS: int = 256
+
     def __init__(self, red_value: float, green_value: float, blue_value: float) -> None:
         """
         Initialize one Pixel object with the given attributes.
@@ -41,11 +57,7 @@ class Pixel:
         self.red_value: float = red_value
         self.green_value: float = green_value
         self.blue_value: float = blue_value
-
-        # Determine the grey value of the pixel
-        self.grey_value: int = int(
-            sum([self.red_value * 0.2989, self.green_value * 0.5870,
-                 self.blue_value * 0.1140]))
+        self.grey_value: int | None = None
 
     def get_gray_value(self) -> int:
         """
@@ -53,10 +65,16 @@ class Pixel:
 
         Returns
         -------
-        self.grey_value: float
+        self.grey_value: int
             Grey value of the pixel.
 
         """
+        # Determine the grey value of the pixel
+        if self.grey_value is None:
+            self.grey_value = int(
+                sum([self.red_value * 0.2989, self.green_value * 0.5870,
+                     self.blue_value * 0.1140]))
+
         return self.grey_value
 
     def get_rgb_values(self) -> tuple[float, float, float]:
@@ -70,3 +88,35 @@ class Pixel:
 
         """
         return (self.red_value, self.green_value, self.blue_value)
+
+    @staticmethod
+    def create_gray(gray_value: float) -> Pixel:
+        """
+        Return a Pixel object of a gray value, shared for the gray values of bytes.
+
+        Gray pixels mostly take the integer values 0 to 255, e.g. in the
+        differentiated images, so that one Pixel object is created per value in
+        advance and reused. Any other value gets a new Pixel object, so that the
+        shared objects do not grow with the values seen.
+
+        Parameters
+        ----------
+        gray_value: float
+            Value of all three primary colours.
+
+        Returns
+        -------
+        Pixel
+            Pixel object with the gray value as red, green and blue value.
+
+        """
+        # Share the objects only for integers, as floats of the same value differ
+        if isinstance(gray_value, int) and 0 <= gray_value < Pixel.GRAY_LEVELS:
+            return GRAY_PIXELS[gray_value]
+
+        return Pixel(gray_value, gray_value, gray_value)
+
+# Shared Pixel objects of the integer gray values 0 to 255
+GRAY_PIXELS: tuple[Pixel, ...] = tuple(
+    Pixel(gray_value, gray_value, gray_value)
+    for gray_value in range(Pixel.GRAY_LEVELS))
@@ -0,0 +1,232 @@
+"""File containing the RecursiveGaussianFilter class."""
+
+# Import for calculating the size of the sampled filter
+import math
+
+# Import for filtering the gray values as arrays
+import numpy as np
+
+# Import used classes
+from classes.matrix import Matrix
+
+class RecursiveGaussianFilter(Matrix):
+    """
+    A class representing a derivative-of-Gaussian filter applied recursively.
+
+    The gray values are smoothed by a recursive (IIR) approximation of a Gaussian
+    after Young and van Vliet in a forward and a backward pass along both
+    directions and differentiated by central differences. Therefore, the cost per
+    pixel is the same for every standard deviation.
+
+    Attributes
+    ----------
+    values: list[list[float]]
+        Values of the sampled Gaussian differentiated by central differences in
+        the x direction, which is approximated by the recursive filter. Its size
+        (6 times the standard deviation) determines the ignored border of the
+        image.
+    sigma: float
+        Standard deviation of the Gaussian.
+    coefficients: tuple[float, float, float, float]
+        Normalised coefficients (B, b1, b2, b3) of the recursion.
+
+    Methods
+    -------
+    get_sigma
+        Return the standard deviation of the Gaussian.
+    calculate_coefficients
+        Calculate the coefficients of the recursion for a standard deviation.
+    smooth
+        Smooth the gray values along one axis with the recursive Gaussian.
+    apply_recursive
+        Calculate the gradients of both directions at every position.
+    to_string
+        Format the filter into a short description.
+
+    """
+
+    def __init__(self, sigma: float) -> None:
+        """
+        Construct one RecursiveGaussianFilter object with the given argument.
+
+        Parameters
+        ----------
+        sigma: float
+            Standard deviation of the Gaussian, at least 0.5.
+
+        Raises
+        ------
+        ValueError
+            If the standard deviation is smaller than 0.5.
+
+        """
+        if sigma < 0.5:
+            raise ValueError("Standard deviation must be at least 0.5.")
+
+        # Sample the Gaussian one value beyond the radius on both sides
+        radius: int = math.ceil(3 * sigma)
+        gaussian: list[float] = [math.exp(-(x * x) / (2 * sigma * sigma))
+                                 for x in range(-radius - 1, radius + 2)]
+        total: float = sum(gaussian[1:-1])
+        gaussian = [value / total for value in gaussian]
+
+        # Central differences of the Gaussian in the x direction times the Gaussian
+        # in the y direction
+        super().__init__([
+            [gaussian[row + 1] * (gaussian[col] - gaussian[col + 2]) / 2
+             for col in range(2 * radius + 1)] for row in range(2 * radius + 1)])
+
+        self.sigma: float = sigma
+        self.coefficients: tuple[float, float, float, float] = (
+            RecursiveGaussianFilter.calculate_coefficients(sigma))
+
+    def get_sigma(self) -> float:
+        """
+        Return the standard deviation of the Gaussian.
+
+        Returns
+        -------
+        self.sigma: float
+            Standard deviation of the Gaussian.
+
+        """
+        return self.sigma
+
+    @staticmethod
+    def calculate_coefficients(sigma: float) -> tuple[float, float, float, float]:
+        """
+        Calculate the coefficients of the recursion for a standard deviation.
+
+        Parameters
+        ----------
+        sigma: float
+            Standard deviation of the Gaussian.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            Gain B of the input and the weights b1, b2 and b3 of the three previous
+            outputs, already divided by b0.
+
+        Notes
+        -----
+        The approximation becomes more exact for larger standard deviations; for
+        standard deviations below about 2, the largest deviation from the sampled
+        Gaussian exceeds 5 percent.
+        See I. T. Young and L. J. van Vliet, "Recursive implementation of the
+        Gaussian filter", Signal Processing 44 (1995), pp. 139-151.
+
+        """
+        # Keep the names q and b0 to b3 of the paper
+        # pylint: disable=invalid-name
+        if sigma >= 2.5:
+            q: float = 0.98711 * sigma - 0.96330
+        else:
+            q = 3.97156 - 4.14554 * math.sqrt(1 - 0.26891 * sigma)
+
+        b0: float = 1.57825 + 2.44413 * q + 1.4281 * q ** 2 + 0.422205 * q ** 3
+        b1: float = (2.44413 * q + 2.85619 * q ** 2 + 1.26661 * q ** 3) / b0
+        b2: float = -(1.4281 * q ** 2 + 1.26661 * q ** 3) / b0
+        b3: float = 0.422205 * q ** 3 / b0
+
+        return (1 - (b1 + b2 + b3), b1, b2, b3)
+
+    def smooth(self, gray_plane: np.ndarray, axis: int) -> np.ndarray:
+        """
+        Smooth the gray values along one axis with the recursive Gaussian.
+
+        Parameters
+        ----------
+        gray_plane: np.ndarray
+            Gray values of the image.
+        axis: int
+            Axis along which the gray values are smoothed.
+
+        Returns
+        -------
+        smoothed: np.ndarray
+            Smoothed gray values.
+
+        Notes
+        -----
+        The recursion runs along the axis, while all lines of the other axis are
+        calculated at once. Outside the image, the values of the border are
+        repeated.
+
+        """
+        # Keep the names b1 to b3 of the paper, see calculate_coefficients
+        # pylint: disable-next=invalid-name
+        gain, b1, b2, b3 = self.coefficients
+
+        # Move the axis to the front so that each step works on one contiguous line
+        lines: np.ndarray = np.ascontiguousarray(
+            np.moveaxis(np.asarray(gray_plane, dtype=np.float64), axis, 0))
+        smoothed: np.ndarray = np.empty_like(lines)
+
+        if lines.shape[0] == 0:
+            return np.moveaxis(smoothed, 0, axis)
+
+        # Forward pass, starting in the steady state of the first line
+        previous: list[np.ndarray] = [lines[0]] * 3
+
+        for index in range(lines.shape[0]):
+            smoothed[index] = (gain * lines[index] + b1 * previous[0]
+                               + b2 * previous[1] + b3 * previous[2])
+            previous = [smoothed[index], previous[0], previous[1]]
+
+        # Backward pass, starting in the steady state of the last line
+        previous = [smoothed[-1].copy()] * 3
+
+        for index in range(lines.shape[0] - 1, -1, -1):
+            smoothed[index] = (gain * smoothed[index] + b1 * previous[0]
+                               + b2 * previous[1] + b3 * previous[2])
+            previous = [smoothed[index], previous[0], previous[1]]
+
+        return np.moveaxis(smoothed, 0, axis)
+
+    def apply_recursive(self, gray_plane: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the gradients of both directions at every position.
+
+        Parameters
+        ----------
+        gray_plane: np.ndarray
+            Gray values of the image. Further leading dimensions, e.g. a stack of
+            images of the same size, are kept.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Gradients in the x and the y direction with the size of the image.
+
+        """
+        smoothed_x: np.ndarray = self.smooth(gray_plane, -1)
+        smoothed_y: np.ndarray = self.smooth(gray_plane, -2)
+
+        # Differentiate by central differences, repeating the values of the border
+        leading: tuple[tuple[int, int], ...] = ((0, 0),) * (np.ndim(gray_plane) - 2)
+        padded_x: np.ndarray = np.pad(smoothed_x, leading + ((0, 0), (1, 1)),
+                                      mode="edge")
+        padded_y: np.ndarray = np.pad(smoothed_y, leading + ((1, 1), (0, 0)),
+                                      mode="edge")
+
+        gradient_x: np.ndarray = self.smooth(
+            (padded_x[..., 2:] - padded_x[..., :-2]) / 2, -2)
+        gradient_y: np.ndarray = self.smooth(
+            (padded_y[..., 2:, :] - padded_y[..., :-2, :]) / 2, -1)
+
+        return gradient_x, gradient_y
+
+    def to_string(self) -> str:
+        """
+        Format the filter into a short description.
+
+        Returns
+        -------
+        str
+            Standard deviation of the filter, as the values of the sampled filter
+            do not fit onto the window.
+
+        """
+        return ("Derivative of Gaussian\n"
+                f"sigma = {self.get_sigma():.2f} (recursive)")
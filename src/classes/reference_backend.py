@@ -0,0 +1,171 @@
+"""File containing the ReferenceBackend class."""
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.compute_backend import ComputeBackend
+
+class ReferenceBackend(ComputeBackend):
+    """
+    A class representing the pure Python backend based on Matrix objects.
+
+    It creates a sub matrix for every position and applies the filter to it. It is
+    the slowest backend and serves as the reference all other backends are checked
+    against.
+
+    Methods
+    -------
+    create_plane
+        Use the Matrix of the gray values as the plane.
+    correlate
+        Apply a filter centred on all positions of a region.
+    magnitude
+        Calculate the absolute value of the gradients of both directions.
+    calculate_magnitude
+        Calculate the absolute value of the gradients at one position.
+    to_list
+        Return the nested lists of a result.
+
+    """
+
+    def __init__(self) -> None:
+        """Construct one ReferenceBackend object."""
+        super().__init__("reference")
+
+    def create_plane(self, gray_matrix: Matrix) -> Matrix:
+        """
+        Use the Matrix of the gray values as the plane.
+
+        Parameters
+        ----------
+        gray_matrix: Matrix
+            Gray values of the image.
+
+        Returns
+        -------
+        gray_matrix: Matrix
+            Gray values of the image.
+
+        """
+        return gray_matrix
+
+    def correlate(self, plane: object, differential_filter: Matrix,
+                  region: tuple[int, int, int, int]) -> list[list[float]]:
+        """
+        Apply a filter centred on all positions of a region.
+
+        Parameters
+        ----------
+        plane: object
+            Gray values as a Matrix object.
+        differential_filter: Matrix
+            Applied filter with an odd number of rows and columns.
+        region: tuple[int, int, int, int]
+            Region of positions in the format of (first row, row after the last,
+            first column, column after the last).
+
+        Returns
+        -------
+        results: list[list[float]]
+            Sum of the gray values multiplied with the filter at each position.
+
+        """
+        if not isinstance(plane, Matrix):
+            raise TypeError("Plane must be a Matrix object.")
+
+        # Get the size of the filter (Number of rows, Number of columns)
+        filter_size: tuple[int, int] = (differential_filter.get_number_of_rows(),
+                                        differential_filter.get_number_of_columns())
+
+        # Initialize the return value
+        results: list[list[float]] = []
+
+        for row_count in range(region[0], region[1]):
+            results.append([])
+
+            for col_count in range(region[2], region[3]):
+                # Get the sub matrix at the current position and apply the filter
+                sub_matrix: Matrix = plane.create_sub_matrix(
+                    (row_count, col_count), filter_size)
+                results[-1].append(sub_matrix.apply_filter(
+                    differential_filter).get_sum())
+
+        return results
+
+    def magnitude(self, gradient_x: object, gradient_y: object,
+                  mode: str = "l2") -> list[list[float]]:
+        """
+        Calculate the absolute value of the gradients of both directions.
+
+        Parameters
+        ----------
+        gradient_x: object
+            Gradients in the x direction as nested lists.
+        gradient_y: object
+            Gradients in the y direction as nested lists.
+        mode: str
+            Mode of the absolute value. The default value is 'l2'.
+
+        Returns
+        -------
+        list[list[float]]
+            Absolute value of the gradients of both directions.
+
+        """
+        if not (isinstance(gradient_x, list) and isinstance(gradient_y, list)):
+            raise TypeError("Gradients must be lists.")
+
+        ComputeBackend.check_mode(mode)
+
+        return [[ReferenceBackend.calculate_magnitude(value_x, value_y, mode)
+                 for value_x, value_y in zip(row_x, row_y)]
+                for row_x, row_y in zip(gradient_x, gradient_y)]
+
+    @staticmethod
+    def calculate_magnitude(value_x: float, value_y: float, mode: str) -> float:
+        """
+        Calculate the absolute value of the gradients at one position.
+
+        Parameters
+        ----------
+        value_x: float
+            Gradient in the x direction.
+        value_y: float
+            Gradient in the y direction.
+        mode: str
+            Mode of the absolute value.
+
+        Returns
+        -------
+        float
+            Absolute value of the gradients.
+
+        """
+        if mode == "l2":
+            return (abs(value_x) ** 2 + abs(value_y) ** 2) ** 0.5
+        if mode == "l1":
+            return abs(value_x) + abs(value_y)
+        if mode == "max":
+            return max(abs(value_x), abs(value_y))
+
+        return (ComputeBackend.ALPHA * max(abs(value_x), abs(value_y))
+                + ComputeBackend.BETA * min(abs(value_x), abs(value_y)))
+
+    def to_list(self, result: object) -> list[list[float]]:
+        """
+        Return the nested lists of a result.
+
+        Parameters
+        ----------
+        result: object
+            Result of correlate or magnitude.
+
+        Returns
+        -------
+        list[list[float]]
+            Values of the result.
+
+        """
+        if not isinstance(result, list):
+            raise TypeError("Result must be a list.")
+
+        return result
@@ -0,0 +1,195 @@
+"""File containing the RegionOfInterest class."""
+
+# Import for storing the results as compact arrays
+import numpy as np
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.image import Image
+
+class RegionOfInterest:
+    """
+    A class representing the incremental edge detection inside a region of interest.
+
+    The absolute values of the gradients are stitched into one cached buffer of the
+    full size per filter. When the region is moved or grown, only the part that has
+    not been calculated before is calculated.
+
+    Attributes
+    ----------
+    image: Image
+        Image on which the filters are applied.
+    filters: dict[str, Matrix]
+        Applied filters to differentiate.
+    outputs: dict[str, np.ndarray]
+        Cached absolute values of the gradients of each filter in the full size.
+    calculated: dict[str, np.ndarray]
+        Masks of the already calculated values of each filter.
+    pixels_calculated: int
+        Number of calculated values of all filters.
+
+    Methods
+    -------
+    get_outputs
+        Return the cached absolute values of the gradients of all filters.
+    get_pixels_calculated
+        Return the number of calculated values of all filters.
+    compute
+        Calculate all filters inside a region and return the region of the outputs.
+    get_missing_regions
+        Split the not yet calculated part of a region into rectangles.
+
+    Notes
+    -----
+    The region is given in the coordinates of the image. As the gradient at a
+    position is calculated from the window around the same position, the halo of
+    the filter is read from the image without being cropped by the region.
+
+    """
+
+    def __init__(self, image: Image, filters: dict[str, Matrix]) -> None:
+        """
+        Initialize one RegionOfInterest object with the given attributes.
+
+        Parameters
+        ----------
+        image: Image
+            Image on which the filters are applied.
+        filters: dict[str, Matrix]
+            Applied filters to differentiate.
+
+        """
+        self.image: Image = image
+        self.filters: dict[str, Matrix] = filters
+
+        # Initialize the cached outputs that are not calculated yet
+        self.outputs: dict[str, np.ndarray] = {
+            key: np.zeros(image.get_output_shape(differential_filter))
+            for key, differential_filter in filters.items()}
+        self.calculated: dict[str, np.ndarray] = {
+            key: np.zeros(output.shape, dtype=bool)
+            for key, output in self.outputs.items()}
+
+        self.pixels_calculated: int = 0
+
+    def get_outputs(self) -> dict[str, np.ndarray]:
+        """
+        Return the cached absolute values of the gradients of all filters.
+
+        Returns
+        -------
+        self.outputs: dict[str, np.ndarray]
+            Cached absolute values of the gradients of each filter in the full
+            size. Values that have not been calculated yet are zero.
+
+        """
+        return self.outputs
+
+    def get_pixels_calculated(self) -> int:
+        """
+        Return the number of calculated values of all filters.
+
+        Returns
+        -------
+        self.pixels_calculated: int
+            Number of calculated values of all filters.
+
+        """
+        return self.pixels_calculated
+
+    def compute(self, region: tuple[int, int, int, int],
+                keys: list[str] | None = None) -> dict[str, np.ndarray]:
+        """
+        Calculate all filters inside a region and return the region of the outputs.
+
+        Parameters
+        ----------
+        region: tuple[int, int, int, int]
+            Region of interest in the format of (first row, row after the last,
+            first column, column after the last). It is clipped to the size of the
+            outputs of each filter.
+        keys: list[str] | None
+            Names of the filters to calculate. The default value is None,
+            indicating that all filters are calculated.
+
+        Returns
+        -------
+        results: dict[str, np.ndarray]
+            Absolute values of the gradients inside the region for each filter, as
+            views into the cached outputs.
+
+        """
+        results: dict[str, np.ndarray] = {}
+
+        for key in self.filters if keys is None else keys:
+            differential_filter: Matrix = self.filters[key]
+            output: np.ndarray = self.outputs[key]
+            calculated: np.ndarray = self.calculated[key]
+
+            # Clip the region to the output of the filter
+            clipped: tuple[int, int, int, int] = (
+                max(region[0], 0), min(region[1], output.shape[0]),
+                max(region[2], 0), min(region[3], output.shape[1]))
+
+            # Calculate only the values that have not been calculated yet
+            for missing in self.get_missing_regions(calculated, clipped):
+                output[missing[0]:missing[1], missing[2]:missing[3]] = (
+                    self.image.compute_gradients(differential_filter, missing)
+                    .get_magnitude())
+                calculated[missing[0]:missing[1], missing[2]:missing[3]] = True
+                self.pixels_calculated += ((missing[1] - missing[0])
+                                           * (missing[3] - missing[2]))
+
+            results[key] = output[clipped[0]:clipped[1], clipped[2]:clipped[3]]
+
+        return results
+
+    @staticmethod
+    def get_missing_regions(calculated: np.ndarray, region: tuple[int, int, int, int]
+                            ) -> list[tuple[int, int, int, int]]:
+        """
+        Split the not yet calculated part of a region into rectangles.
+
+        Consecutive rows with the same missing column spans are merged into one
+        rectangle, so that moving or growing a region yields only few rectangles.
+
+        Parameters
+        ----------
+        calculated: np.ndarray
+            Mask of the already calculated values.
+        region: tuple[int, int, int, int]
+            Region in the format of (first row, row after the last, first column,
+            column after the last).
+
+        Returns
+        -------
+        missing_regions: list[tuple[int, int, int, int]]
+            Rectangles covering exactly the not yet calculated values of the region.
+
+        """
+        missing_regions: list[tuple[int, int, int, int]] = []
+
+        # Rectangles of the previous rows that may still be continued
+        open_regions: dict[tuple[int, int], int] = {}
+
+        for row in range(region[0], max(region[1], region[0])):
+            missing: np.ndarray = ~calculated[row, region[2]:region[3]]
+
+            # Find the column spans of the missing values of the row
+            border: np.ndarray = np.zeros(1, dtype=bool)
+            edges: np.ndarray = np.flatnonzero(np.diff(np.concatenate(
+                (border, missing, border)).astype(np.int8))) + region[2]
+            spans: set[tuple[int, int]] = set(zip(edges[0::2].tolist(),
+                                                  edges[1::2].tolist()))
+
+            # Close the rectangles that are not continued in this row
+            for span in set(open_regions) - spans:
+                missing_regions.append((open_regions.pop(span), row) + span)
+
+            for span in spans:
+                open_regions.setdefault(span, row)
+
+        for span, first_row in open_regions.items():
+            missing_regions.append((first_row, region[1]) + span)
+
+        return missing_regions
@@ -0,0 +1,39 @@
+"""File containing the ServiceSettings class."""
+
+# Import for generating the constructor of the settings
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class ServiceSettings:
+    """
+    A class representing the settings of an EdgeDetectionService.
+
+    Attributes
+    ----------
+    number_of_workers: int
+        Number of worker processes. The default value is 2.
+    batch_size: int
+        Maximum number of requests executed as one batch. The default value is 8.
+    batch_delay: float
+        Time in seconds the first request of a batch waits for further requests.
+        The default value is 0.005.
+    queue_size: int
+        Maximum number of waiting requests. Further requests are rejected. The
+        default value is 256.
+
+    Raises
+    ------
+    ValueError
+        If the number of workers, the batch size or the queue size is not positive.
+
+    """
+
+    number_of_workers: int = 2
+    batch_size: int = 8
+    batch_delay: float = 0.005
+    queue_size: int = 256
+
+    def __post_init__(self) -> None:
+        """Check the settings after they are set."""
+        if self.number_of_workers < 1 or self.batch_size < 1 or self.queue_size < 1:
+            raise ValueError("Workers, batch size and queue size must be positive.")
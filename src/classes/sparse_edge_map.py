@@ -0,0 +1,395 @@
+"""File containing the SparseEdgeMap class."""
+
+# Import for referencing SparseEdgeMap class before creation
+from __future__ import annotations
+
+# Import for storing the edges as compact arrays
+import numpy as np
+
+class SparseEdgeMap:
+    """
+    A class representing a thresholded edge map by the coordinates of its edges.
+
+    Attributes
+    ----------
+    shape: tuple[int, int]
+        Shape of the dense edge map (Number of rows, Number of columns).
+    rows: np.ndarray
+        Rows of the edges in row-major order.
+    columns: np.ndarray
+        Columns of the edges in row-major order.
+    magnitudes: np.ndarray
+        Magnitudes of the edges in row-major order.
+
+    Methods
+    -------
+    get_shape
+        Return the shape of the dense edge map.
+    get_rows
+        Return the rows of the edges.
+    get_columns
+        Return the columns of the edges.
+    get_magnitudes
+        Return the magnitudes of the edges.
+    get_number_of_edges
+        Return the number of edges.
+    get_number_of_bytes
+        Return the number of bytes occupied by the edges.
+    from_dense
+        Create a SparseEdgeMap object from the edges of a dense edge map.
+    to_dense
+        Convert the edges into a dense edge map.
+    from_runs
+        Create a SparseEdgeMap object from row-wise run-length spans.
+    to_runs
+        Encode the edges as row-wise run-length spans.
+    get_flat_indices
+        Return the row-major indices of the edges in the dense edge map.
+    union
+        Combine the edges of two edge maps.
+    intersection
+        Keep the edges contained in both edge maps.
+    save
+        Write the edges into a compressed .npz file.
+    load
+        Read the edges from a .npz file written by save.
+
+    Notes
+    -----
+    The memory of the object and the size of the written files only depend on the
+    number of edges and not on the number of pixels.
+
+    """
+
+    def __init__(self, shape: tuple[int, int], rows: np.ndarray, columns: np.ndarray,
+                 magnitudes: np.ndarray) -> None:
+        """
+        Initialize one SparseEdgeMap object with the given attributes.
+
+        Parameters
+        ----------
+        shape: tuple[int, int]
+            Shape of the dense edge map (Number of rows, Number of columns).
+        rows: np.ndarray
+            Rows of the edges in row-major order.
+        columns: np.ndarray
+            Columns of the edges in row-major order.
+        magnitudes: np.ndarray
+            Magnitudes of the edges in row-major order.
+
+        Raises
+        ------
+        ValueError
+            If rows, columns and magnitudes do not have the same length.
+
+        """
+        if not len(rows) == len(columns) == len(magnitudes):
+            raise ValueError("Rows, columns and magnitudes must have the same length.")
+
+        self.shape: tuple[int, int] = (int(shape[0]), int(shape[1]))
+        self.rows: np.ndarray = np.asarray(rows, dtype=np.int32)
+        self.columns: np.ndarray = np.asarray(columns, dtype=np.int32)
+        self.magnitudes: np.ndarray = np.asarray(magnitudes, dtype=np.float32)
+
+    def get_shape(self) -> tuple[int, int]:
+        """
+        Return the shape of the dense edge map.
+
+        Returns
+        -------
+        self.shape: tuple[int, int]
+            Shape of the dense edge map (Number of rows, Number of columns).
+
+        """
+        return self.shape
+
+    def get_rows(self) -> np.ndarray:
+        """
+        Return the rows of the edges.
+
+        Returns
+        -------
+        self.rows: np.ndarray
+            Rows of the edges in row-major order.
+
+        """
+        return self.rows
+
+    def get_columns(self) -> np.ndarray:
+        """
+        Return the columns of the edges.
+
+        Returns
+        -------
+        self.columns: np.ndarray
+            Columns of the edges in row-major order.
+
+        """
+        return self.columns
+
+    def get_magnitudes(self) -> np.ndarray:
+        """
+        Return the magnitudes of the edges.
+
+        Returns
+        -------
+        self.magnitudes: np.ndarray
+            Magnitudes of the edges in row-major order.
+
+        """
+        return self.magnitudes
+
+    def get_number_of_edges(self) -> int:
+        """
+        Return the number of edges.
+
+        Returns
+        -------
+        len(self.get_rows()): int
+            Number of edges.
+
+        """
+        return len(self.get_rows())
+
+    def get_number_of_bytes(self) -> int:
+        """
+        Return the number of bytes occupied by the edges.
+
+        Returns
+        -------
+        int
+            Number of bytes of the rows, columns and magnitudes.
+
+        """
+        return self.rows.nbytes + self.columns.nbytes + self.magnitudes.nbytes
+
+    @staticmethod
+    def from_dense(edge_map: np.ndarray, threshold: float) -> SparseEdgeMap:
+        """
+        Create a SparseEdgeMap object from the edges of a dense edge map.
+
+        Parameters
+        ----------
+        edge_map: np.ndarray
+            Dense two-dimensional edge map.
+        threshold: float
+            Values greater than or equal to the threshold are kept as edges.
+
+        Returns
+        -------
+        sparse_edge_map: SparseEdgeMap
+            Newly created SparseEdgeMap object.
+
+        """
+        edge_map = np.asarray(edge_map)
+        rows, columns = np.nonzero(edge_map >= threshold)
+
+        sparse_edge_map: SparseEdgeMap = SparseEdgeMap(
+            (edge_map.shape[0], edge_map.shape[1]), rows, columns,
+            edge_map[rows, columns])
+
+        return sparse_edge_map
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Convert the edges into a dense edge map.
+
+        Returns
+        -------
+        edge_map: np.ndarray
+            Dense float32 edge map with zeros at all positions without an edge.
+
+        """
+        edge_map: np.ndarray = np.zeros(self.get_shape(), dtype=np.float32)
+        edge_map[self.get_rows(), self.get_columns()] = self.get_magnitudes()
+
+        return edge_map
+
+    @staticmethod
+    def from_runs(shape: tuple[int, int], runs: np.ndarray) -> SparseEdgeMap:
+        """
+        Create a SparseEdgeMap object from row-wise run-length spans.
+
+        Parameters
+        ----------
+        shape: tuple[int, int]
+            Shape of the dense edge map (Number of rows, Number of columns).
+        runs: np.ndarray
+            Spans in the format of (row, first column, length), as returned by
+            to_runs.
+
+        Returns
+        -------
+        sparse_edge_map: SparseEdgeMap
+            Newly created SparseEdgeMap object. As the spans do not hold any
+            magnitudes, all edges get the magnitude 1.
+
+        """
+        runs = np.asarray(runs, dtype=np.int64).reshape(-1, 3)
+        lengths: np.ndarray = runs[:, 2]
+
+        # Offset of every edge within its span
+        offsets: np.ndarray = np.arange(lengths.sum()) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths)
+
+        sparse_edge_map: SparseEdgeMap = SparseEdgeMap(
+            shape, np.repeat(runs[:, 0], lengths),
+            np.repeat(runs[:, 1], lengths) + offsets,
+            np.ones(len(offsets), dtype=np.float32))
+
+        return sparse_edge_map
+
+    def to_runs(self) -> np.ndarray:
+        """
+        Encode the edges as row-wise run-length spans.
+
+        Returns
+        -------
+        runs: np.ndarray
+            Spans of consecutive edges within one row in the format of
+            (row, first column, length).
+
+        """
+        rows: np.ndarray = self.get_rows()
+        columns: np.ndarray = self.get_columns()
+
+        # A span starts at every edge that does not directly follow the previous one
+        starts: np.ndarray = np.ones(len(rows), dtype=bool)
+        starts[1:] = (rows[1:] != rows[:-1]) | (columns[1:] != columns[:-1] + 1)
+        start_indices: np.ndarray = np.flatnonzero(starts)
+
+        runs: np.ndarray = np.stack(
+            (rows[start_indices], columns[start_indices],
+             np.diff(np.append(start_indices, len(rows)))), axis=1).astype(np.int32)
+
+        return runs
+
+    def get_flat_indices(self, number_of_columns: int | None = None) -> np.ndarray:
+        """
+        Return the row-major indices of the edges in the dense edge map.
+
+        Parameters
+        ----------
+        number_of_columns: int | None
+            Number of columns of the dense edge map the indices refer to. The
+            default value is None, indicating the one of this edge map.
+
+        Returns
+        -------
+        np.ndarray
+            Row-major indices of the edges.
+
+        """
+        if number_of_columns is None:
+            number_of_columns = self.shape[1]
+
+        return self.get_rows().astype(np.int64) * number_of_columns + self.get_columns()
+
+    def union(self, other: SparseEdgeMap) -> SparseEdgeMap:
+        """
+        Combine the edges of two edge maps.
+
+        Parameters
+        ----------
+        other: SparseEdgeMap
+            Edge map of the same image, e.g. the result of a different filter. The
+            edge maps may have different shapes, as both start at the upper left
+            pixel of the image.
+
+        Returns
+        -------
+        sparse_edge_map: SparseEdgeMap
+            Edges contained in at least one of the edge maps with the larger of
+            their magnitudes, in the larger extent of both edge maps.
+
+        """
+        shape: tuple[int, int] = (max(self.shape[0], other.shape[0]),
+                                  max(self.shape[1], other.shape[1]))
+
+        indices: np.ndarray = np.concatenate(
+            (self.get_flat_indices(shape[1]), other.get_flat_indices(shape[1])))
+        magnitudes: np.ndarray = np.concatenate(
+            (self.get_magnitudes(), other.get_magnitudes()))
+
+        # Keep the larger magnitude of the edges contained in both edge maps
+        unique_indices, inverse = np.unique(indices, return_inverse=True)
+        unique_magnitudes: np.ndarray = np.full(
+            len(unique_indices), -np.inf, dtype=np.float32)
+        np.maximum.at(unique_magnitudes, inverse, magnitudes)
+
+        sparse_edge_map: SparseEdgeMap = SparseEdgeMap(
+            shape, unique_indices // shape[1], unique_indices % shape[1],
+            unique_magnitudes)
+
+        return sparse_edge_map
+
+    def intersection(self, other: SparseEdgeMap) -> SparseEdgeMap:
+        """
+        Keep the edges contained in both edge maps.
+
+        Parameters
+        ----------
+        other: SparseEdgeMap
+            Edge map of the same image, e.g. the result of a different filter. The
+            edge maps may have different shapes, as both start at the upper left
+            pixel of the image.
+
+        Returns
+        -------
+        sparse_edge_map: SparseEdgeMap
+            Edges contained in both edge maps with the smaller of their magnitudes,
+            in the smaller extent of both edge maps.
+
+        """
+        shape: tuple[int, int] = (min(self.shape[0], other.shape[0]),
+                                  min(self.shape[1], other.shape[1]))
+
+        # Indices of a common width; shared edges lie inside both extents
+        width: int = max(self.shape[1], other.shape[1])
+        common_indices, own_positions, other_positions = np.intersect1d(
+            self.get_flat_indices(width), other.get_flat_indices(width),
+            assume_unique=True, return_indices=True)
+
+        sparse_edge_map: SparseEdgeMap = SparseEdgeMap(
+            shape, common_indices // width, common_indices % width,
+            np.minimum(self.get_magnitudes()[own_positions],
+                       other.get_magnitudes()[other_positions]))
+
+        return sparse_edge_map
+
+    def save(self, path: str) -> None:
+        """
+        Write the edges into a compressed .npz file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the written file.
+
+        """
+        np.savez_compressed(path, shape=np.array(self.get_shape(), dtype=np.int64),
+                            rows=self.get_rows(), columns=self.get_columns(),
+                            magnitudes=self.get_magnitudes())
+
+    @staticmethod
+    def load(path: str) -> SparseEdgeMap:
+        """
+        Read the edges from a .npz file written by save.
+
+        Parameters
+        ----------
+        path: str
+            Path of the read file.
+
+        Returns
+        -------
+        sparse_edge_map: SparseEdgeMap
+            Newly created SparseEdgeMap object.
+
+        """
+        with np.load(path) as data:
+            sparse_edge_map: SparseEdgeMap = SparseEdgeMap(
+                (int(data['shape'][0]), int(data['shape'][1])), data['rows'],
+                data['columns'], data['magnitudes'])
+
+        return sparse_edge_map
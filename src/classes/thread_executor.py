@@ -0,0 +1,278 @@
+"""File containing the ThreadExecutor class."""
+
+# Import necessary for type hints of the image, which refers to this class
+from __future__ import annotations
+
+# Import for running the tasks in a pool of threads
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Import for creating the tasks applying a filter
+from functools import partial
+
+# Import for recognising the threads of the pool
+import threading
+
+# Import for the type hints of the tasks
+from typing import TYPE_CHECKING, Any, Callable
+
+# Import used classes
+from classes.pixel import Pixel
+from classes.matrix import Matrix
+from classes.box_filter import BoxFilter
+from classes.recursive_gaussian_filter import RecursiveGaussianFilter
+from classes.compute_backend import ComputeBackend
+from classes.backend_registry import BACKENDS
+from classes.filter_bank import FilterBank
+
+if TYPE_CHECKING:
+    from classes.image import Image
+
+class ThreadExecutor:
+    """
+    A class representing the concurrent execution of independent convolutions.
+
+    The gradients of both directions and the edge maps of different filters do not
+    depend on each other. They are calculated by a pool of threads, which share the
+    gray values of the image without copying them. The array operations of NumPy
+    release the global interpreter lock, so that the threads run in parallel.
+
+    Attributes
+    ----------
+    max_workers: int | None
+        Maximum number of threads.
+    pool: ThreadPoolExecutor | None
+        Pool of threads, created on first use.
+
+    Methods
+    -------
+    get_max_workers
+        Return the maximum number of threads.
+    is_worker
+        Check whether the current thread belongs to the pool.
+    run_all
+        Run independent tasks concurrently and return their results.
+    correlate
+        Apply a filter and its transpose to an image with a backend concurrently.
+    prepare
+        Create the representations of the gray values of an image used by filters.
+    traverse_filters
+        Differentiate an image with several filters concurrently.
+    shutdown
+        Wait for the running tasks and stop the threads.
+
+    Notes
+    -----
+    Unlike separate processes, the threads need neither start-up time nor shared
+    memory, which pays off for images of medium size. Backends calculating in pure
+    Python hold the lock and do not gain from the threads.
+
+    """
+
+    # Prefix of the names of the threads of all pools
+    THREAD_NAME_PREFIX: str = "edge-detection"
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        Construct one ThreadExecutor object with the given attribute.
+
+        Parameters
+        ----------
+        max_workers: int | None
+            Maximum number of threads. The default value is None, indicating the
+            default of ThreadPoolExecutor.
+
+        Raises
+        ------
+        ValueError
+            If the maximum number of threads is not positive.
+
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("Maximum number of threads must be positive.")
+
+        self.max_workers: int | None = max_workers
+        self.pool: ThreadPoolExecutor | None = None
+
+    def get_max_workers(self) -> int | None:
+        """
+        Return the maximum number of threads.
+
+        Returns
+        -------
+        self.max_workers: int | None
+            Maximum number of threads.
+
+        """
+        return self.max_workers
+
+    @staticmethod
+    def is_worker() -> bool:
+        """
+        Check whether the current thread belongs to the pool.
+
+        Returns
+        -------
+        bool
+            True if the current thread is one of the pool, otherwise False.
+
+        """
+        return threading.current_thread().name.startswith(
+            ThreadExecutor.THREAD_NAME_PREFIX)
+
+    def run_all(self, tasks: list[Callable[[], Any]]) -> list[Any]:
+        """
+        Run independent tasks concurrently and return their results.
+
+        Parameters
+        ----------
+        tasks: list[Callable[[], Any]]
+            Tasks without arguments.
+
+        Returns
+        -------
+        list[Any]
+            Results of the tasks in their order.
+
+        Notes
+        -----
+        Tasks started by a thread of the pool run in that thread, as waiting for
+        further tasks of the pool could block all of its threads.
+
+        """
+        if len(tasks) < 2 or self.max_workers == 1 or ThreadExecutor.is_worker():
+            return [task() for task in tasks]
+
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=ThreadExecutor.THREAD_NAME_PREFIX)
+
+        futures: list[Future] = [self.pool.submit(task) for task in tasks]
+
+        return [future.result() for future in futures]
+
+    def correlate(self, image: Image, differential_filter: Matrix,
+                  region: tuple[int, int, int, int] | None = None,
+                  backend: ComputeBackend | None = None
+                  ) -> tuple[object, object, tuple[int, int]]:
+        """
+        Apply a filter and its transpose to an image with a backend concurrently.
+
+        Parameters
+        ----------
+        image: Image
+            Image whose gray values in the representation of the backend are only
+            read by both directions.
+        differential_filter: Matrix
+            Applied filter to differentiate.
+        region: tuple[int, int, int, int] | None
+            Region of the gradients to calculate in the format of (first row,
+            row after the last, first column, column after the last). The default
+            value is None, indicating that all gradients inside the border are
+            calculated.
+        backend: ComputeBackend | None
+            Backend calculating the gradients. The default value is None,
+            indicating that the backend selected by the registry is used.
+
+        Returns
+        -------
+        tuple[object, object, tuple[int, int]]
+            Gradients of both directions in the representation of the backend and
+            the shape of the region, kept even if it is empty.
+
+        """
+        if backend is None:
+            backend = BACKENDS.select()
+
+        # Ignore the border of the image if no region is given
+        if region is None:
+            output_shape: tuple[int, int] = image.get_output_shape(differential_filter)
+            region = (0, output_shape[0], 0, output_shape[1])
+
+        plane: object = image.get_plane(backend)
+        gradient_x, gradient_y = self.run_all([
+            partial(backend.correlate, plane, differential_filter, region),
+            partial(backend.correlate, plane, differential_filter.transpose(),
+                    region)])
+
+        return (gradient_x, gradient_y,
+                (max(region[1] - region[0], 0), max(region[3] - region[2], 0)))
+
+    @staticmethod
+    def prepare(image: Image, filters: list[Matrix],
+                backend: ComputeBackend | None = None) -> None:
+        """
+        Create the representations of the gray values of an image used by filters.
+
+        Threads applying the filters afterwards only read them, so that they are
+        neither created twice nor copied.
+
+        Parameters
+        ----------
+        image: Image
+            Image the filters are applied to.
+        filters: list[Matrix]
+            Filters applied afterwards.
+        backend: ComputeBackend | None
+            Backend calculating the gradients. The default value is None,
+            indicating that the backend selected by the registry is used.
+
+        """
+        box_filters: list[Matrix] = [differential_filter
+                                     for differential_filter in filters
+                                     if isinstance(differential_filter, BoxFilter)]
+
+        if box_filters:
+            image.get_integral_image(max(FilterBank.get_half(box_filter)
+                                         for box_filter in box_filters))
+
+        if any(not isinstance(differential_filter,
+                              (BoxFilter, RecursiveGaussianFilter))
+               for differential_filter in filters):
+            image.get_plane(BACKENDS.select() if backend is None else backend)
+
+    def traverse_filters(self, image: Image, filters: dict[str, Matrix],
+                         mode: str = "l2", normalise: bool = False
+                         ) -> dict[str, list[list[Pixel]]]:
+        """
+        Differentiate an image with several filters concurrently.
+
+        Parameters
+        ----------
+        image: Image
+            Image to differentiate.
+        filters: dict[str, Matrix]
+            Applied filters by their names. A single filter calculates the
+            gradients of both directions concurrently instead.
+        mode: str
+            Mode of the absolute value, see ComputeBackend. The default value is
+            'l2'.
+        normalise: bool
+            Whether the absolute values are quantised, see Image.traverse. The
+            default value is False.
+
+        Returns
+        -------
+        dict[str, list[list[Pixel]]]
+            Differentiated pixels of each filter, see Image.traverse.
+
+        """
+        if len(filters) < 2:
+            return {name: image.traverse(differential_filter, mode, normalise,
+                                         executor=self)
+                    for name, differential_filter in filters.items()}
+
+        # Create the shared gray values before the threads read them
+        ThreadExecutor.prepare(image, list(filters.values()))
+
+        pixels_differentiated: list[list[list[Pixel]]] = self.run_all([
+            partial(image.traverse, differential_filter, mode, normalise)
+            for differential_filter in filters.values()])
+
+        return dict(zip(filters, pixels_differentiated))
+
+    def shutdown(self) -> None:
+        """Wait for the running tasks and stop the threads."""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
@@ -4,7 +4,8 @@
 import os
 
 # Import used components in the user interface
-from tkinter import Tk, Label, IntVar, Radiobutton, BooleanVar, Checkbutton, Button
+from tkinter import (Tk, Toplevel, Canvas, Event, Label, IntVar, Radiobutton,
+                     BooleanVar, Checkbutton, Button)
 
 # Imports for reading images
 from PIL import ImageTk, Image as ImageOpener
@@ -12,9 +13,19 @@ from PIL import ImageTk, Image as ImageOpener
 # Import to show the images
 import matplotlib.pyplot as plt
 
+# Import for the results inside a region of interest
+import numpy as np
+
 # Import used classes
 from classes.matrix import Matrix
 from classes.image import Image
+from classes.region_of_interest import RegionOfInterest
+from classes.thread_executor import ThreadExecutor
+from classes.pipeline import Pipeline
+from classes.pipeline_options import PipelineOptions
+
+# Maximum height and width of the preview to select the region of interest
+PREVIEW_SIZE: int = 400
 
 class UserInterface:
     """
@@ -47,6 +58,12 @@ class UserInterface:
         All displayed images on the window.
     buttons: list[Button]
         All regular buttons displayed on the window.
+    regions_of_interest: dict[str, RegionOfInterest]
+        Cached calculations inside regions of interest of each image.
+    cross_threads: BooleanVar
+        Boolean indicating whether the filters are applied concurrently.
+    executor: ThreadExecutor
+        Executor applying the filters concurrently.
 
     Methods
     -------
@@ -55,11 +72,15 @@ class UserInterface:
     add_filters
         Add the filters to the window.
     add_buttons
-        Add the two buttons to the window.
+        Add the three buttons to the window.
     show_window
         Add the images and filter and show the window afterwards.
     execute_detection
         Execute the selected filters.
+    select_region
+        Open a preview of the selected image to select a region of interest.
+    execute_region
+        Execute the selected filters inside a region of interest.
     close
         Close the window and therefore end the program.
     switch_buttons
@@ -119,6 +140,11 @@ class UserInterface:
 
         self.buttons: list[Button] = []
 
+        self.regions_of_interest: dict[str, RegionOfInterest] = {}
+
+        self.cross_threads: BooleanVar = BooleanVar(value=False)
+        self.executor: ThreadExecutor = ThreadExecutor()
+
     def add_images(self, path_to_images: str, row: int, col: int) -> None:
         """
         Add the images to the window.
@@ -140,8 +166,11 @@ class UserInterface:
         self.labels.append(label_images)
 
         for count, image in enumerate(images):
-            photo_image: ImageTk.PhotoImage = ImageTk.PhotoImage(
-                ImageOpener.open(path_to_images + image).resize((75, 75)))
+            with ImageOpener.open(path_to_images + image) as thumbnail:
+                # Let the decoder reduce the image before scaling it down
+                thumbnail.draft("RGB", (75, 75))
+                photo_image: ImageTk.PhotoImage = ImageTk.PhotoImage(
+                    thumbnail.resize((75, 75)))
             self.images.append(photo_image)
 
             radio_button: Radiobutton = Radiobutton(
@@ -204,20 +233,26 @@ class UserInterface:
         checkbox_grayscale.grid(row=(current_row + 1), column=col, sticky="W")
         self.checkboxes.append(checkbox_grayscale)
 
+        # Add the checkbox to apply the filters concurrently, which is no filter
+        Checkbutton(self.window, text="Multithreading",
+                    variable=self.cross_threads).grid(row=(current_row + 2),
+                                                      column=col, sticky="W")
+
     def add_buttons(self, filters: dict[str, Matrix], path_to_images: str,
                     position: tuple[int, int]) -> None:
         """
-        Add the two buttons to the window.
+        Add the three buttons to the window.
 
         One button is used to execute the selected filters on the selected image,
-        whereas the other is used to the close the window and thereby exit the
+        one is used to execute them only inside a selected region of interest,
+        whereas the last is used to the close the window and thereby exit the
         entire program.
 
         Parameters
         ----------
         position: tuple[int, int]
-            Position of the first placed button. The position of the second button
-            is also based on it.
+            Position of the button to execute the filters. The positions of the
+            other buttons are also based on it.
         filters: dict[str, Matrix]
             The filters from which the user can choose.
         path_to_images: str
@@ -231,6 +266,13 @@ class UserInterface:
         execution_button.place(x=position[0], y=position[1])
         self.buttons.append(execution_button)
 
+        # Add the button to select a region of interest
+        region_button: Button = Button(
+            self.window, text="Select ROI", width=8,
+            command=lambda: self.select_region(filters, path_to_images))
+        region_button.place(x=(position[0] - 70), y=position[1])
+        self.buttons.append(region_button)
+
         # Add the button to exit the program
         exit_button: Button = Button(
             self.window, text="Exit", command=self.close, width=8)
@@ -284,59 +326,40 @@ class UserInterface:
             # Disable all buttons
             self.switch_buttons()
 
-            # Create an Image object
-            self.update_status("Create Image Object.")
             path_to_image: str = os.path.join(
                 path_to_images + os.listdir(path_to_images)[self.crossed_image.get()])
-            image: Image = Image.read_image(path_to_image)
 
-            # Get the number of images to be shown
-            number_of_images: int = [cross.get() for cross in self.crosses].count(True)
-
-            # Get the number columns on the plot (By default there are two rows)
-            cols: int = int(number_of_images / 2 if number_of_images % 2 == 0
-                            else (number_of_images + 1) / 2)
-
-            # Initialize the count of the image on the plot
-            image_index: int = 1
-
-            # Initialize the plot to show the images
-            figure = plt.figure(figsize=(2, 2))
             # Check whether the original and/or the grayscale image shall be shown
             show_original: bool = self.crosses[-2].get()
             show_grayscale: bool = self.crosses[-1].get()
 
-            if show_original:
-                # Add the image to the plot
-                self.update_status("Adding original image to the plot.")
-                figure.add_subplot(2, cols, image_index)
-                image.add_image_to_plot("Original Image")
-
-                # Increment the image count
-                image_index += 1
-            if show_grayscale:
-                # Add the image to the plot
-                self.update_status("Adding grayscale image to the plot.")
-                figure.add_subplot(2, cols, image_index)
-                image.add_image_to_plot("Grayscale Image", grayscale=True)
+            # Build the pipeline of the selected outputs, concurrently if chosen
+            selected_filters: dict[str, Matrix] = {
+                key: filters[key] for count, key in enumerate(list(filters.keys()))
+                if self.crosses[count].get()}
+            pipeline: Pipeline = Pipeline.create_from_selections(
+                path_to_image, selected_filters,
+                PipelineOptions(show_original=show_original,
+                                show_grayscale=show_grayscale),
+                self.executor if self.cross_threads.get() else None)
 
-                # Increment the image count
-                image_index += 1
+            # Only the stages the selected outputs depend on are calculated
+            self.update_status("Executing the pipeline.")
+            outputs: dict[str, Image] = pipeline.evaluate()
 
-            # Apply the selected filters
-            for count, key in enumerate(list(filters.keys())):
-                if self.crosses[count].get():
-                    # Apply the filter to the image
-                    self.update_status("Applying " + key + " filter")
-                    image_traversed = Image(image.traverse(filters[key]))
+            # Get the number columns on the plot (By default there are two rows)
+            cols: int = int(len(outputs) / 2 if len(outputs) % 2 == 0
+                            else (len(outputs) + 1) / 2)
 
-                    # Add the filtered image to the plot
-                    self.update_status("Adding " + key + " filter to the plot.")
-                    figure.add_subplot(2, cols, image_index)
-                    image_traversed.add_image_to_plot(key + " filter")
+            # Initialize the plot to show the images
+            figure = plt.figure(figsize=(2, 2))
 
-                    # Increment the image count
-                    image_index += 1
+            for image_index, (title, image) in enumerate(outputs.items()):
+                # Add the image to the plot
+                self.update_status("Adding " + title + " to the plot.")
+                figure.add_subplot(2, cols, image_index + 1)
+                image.add_image_to_plot(title,
+                                        grayscale=title == "Grayscale Image")
 
             # Show all images
             plt.show()
@@ -347,8 +370,130 @@ class UserInterface:
             # Enable all buttons
             self.switch_buttons()
 
+    def select_region(self, filters: dict[str, Matrix], path_to_images: str) -> None:
+        """
+        Open a preview of the selected image to select a region of interest.
+
+        The region is selected by dragging a rectangle with the left mouse button.
+        After releasing the button, the selected filters are executed inside it.
+
+        Parameters
+        ----------
+        filters: dict[str, Matrix]
+            The filters from which the user can choose.
+        path_to_images: str
+            Path to the image folder.
+
+        """
+        path_to_image: str = os.path.join(
+            path_to_images + os.listdir(path_to_images)[self.crossed_image.get()])
+
+        # Scale the image down to fit into the preview
+        with ImageOpener.open(path_to_image) as original:
+            scale: float = min(PREVIEW_SIZE / max(original.size), 1.0)
+            size: tuple[int, int] = (max(int(original.size[0] * scale), 1),
+                                     max(int(original.size[1] * scale), 1))
+            original.draft("RGB", size)
+            preview: ImageOpener.Image = original.resize(size)
+
+        window: Toplevel = Toplevel(self.window)
+        window.title("Select the Region of Interest")
+
+        # Keep the preview, as Tkinter does not hold a reference to it
+        self.images.append(ImageTk.PhotoImage(preview))
+
+        canvas: Canvas = Canvas(window, width=preview.size[0], height=preview.size[1])
+        canvas.create_image(0, 0, image=self.images[-1], anchor="nw")
+        canvas.pack()
+
+        # Corner where the dragging started and the drawn rectangle
+        start: list[int] = [0, 0]
+        rectangle: int = canvas.create_rectangle(0, 0, 0, 0, outline="red", width=2)
+
+        def on_press(event: Event) -> None:
+            start[0], start[1] = event.x, event.y
+            canvas.coords(rectangle, event.x, event.y, event.x, event.y)
+
+        def on_drag(event: Event) -> None:
+            canvas.coords(rectangle, start[0], start[1], event.x, event.y)
+
+        def on_release(event: Event) -> None:
+            # Convert the corners of the preview to the coordinates of the image
+            self.execute_region(filters, path_to_image, (
+                int(min(start[1], event.y) / scale),
+                int(max(start[1], event.y) / scale) + 1,
+                int(min(start[0], event.x) / scale),
+                int(max(start[0], event.x) / scale) + 1))
+
+        canvas.bind("<ButtonPress-1>", on_press)
+        canvas.bind("<B1-Motion>", on_drag)
+        canvas.bind("<ButtonRelease-1>", on_release)
+
+    def execute_region(self, filters: dict[str, Matrix], path_to_image: str,
+                       region: tuple[int, int, int, int]) -> None:
+        """
+        Execute the selected filters inside a region of interest.
+
+        Parameters
+        ----------
+        filters: dict[str, Matrix]
+            The filters from which the user can choose.
+        path_to_image: str
+            Path to the selected image.
+        region: tuple[int, int, int, int]
+            Region of interest in the format of (first row, row after the last,
+            first column, column after the last).
+
+        Notes
+        -----
+        The calculations are cached for each image, so that moving or growing the
+        region only calculates the newly covered part.
+
+        """
+        keys: list[str] = [key for count, key in enumerate(list(filters.keys()))
+                           if self.crosses[count].get()]
+
+        if not keys:
+            self.update_status("ERROR!\tNo filter selected!")
+            return
+
+        # Disable all buttons
+        self.switch_buttons()
+
+        if path_to_image not in self.regions_of_interest:
+            self.update_status("Create Image Object.")
+            self.regions_of_interest[path_to_image] = RegionOfInterest(
+                Image.read_image(path_to_image, mode="L"), filters)
+
+        self.update_status("Applying the filters inside the region.")
+        results: dict[str, np.ndarray] = self.regions_of_interest[
+            path_to_image].compute(region, keys)
+
+        if any(result.size == 0 for result in results.values()):
+            self.update_status("ERROR!\tRegion outside of the filtered image!")
+            self.switch_buttons()
+            return
+
+        # Show the region of all filters next to each other
+        figure = plt.figure(figsize=(2, 2))
+
+        for count, key in enumerate(keys):
+            figure.add_subplot(1, len(keys), count + 1)
+            plt.imshow(results[key], cmap="gray")
+            plt.axis('off')
+            plt.title(key + " filter")
+
+        plt.show()
+
+        # Reset the status message
+        self.update_status("")
+
+        # Enable all buttons
+        self.switch_buttons()
+
     def close(self):
         """Close the window and therefore end the program."""
+        self.executor.shutdown()
         self.window.destroy()
 
     def switch_buttons(self) -> None:
@@ -0,0 +1,232 @@
+"""File containing the WorkspaceArena class."""
+
+# Import necessary for type hints of the options, which refer to this class
+from __future__ import annotations
+
+# Import for importing the options only for type checking
+from typing import TYPE_CHECKING
+
+# Import for storing the buffers as arrays
+import numpy as np
+
+if TYPE_CHECKING:
+    from classes.border_options import BorderOptions
+
+class WorkspaceArena:
+    """
+    A class representing reusable buffers of the edge detection.
+
+    Padded gray values, gradients and edge maps are requested by name. A buffer is
+    only allocated if there is none with that name that is large enough, so that
+    repeated runs on images of the same size allocate nothing.
+
+    Attributes
+    ----------
+    buffers: dict[str, np.ndarray]
+        Allocated buffers by their names.
+    indices: dict[tuple[int, int, str], np.ndarray]
+        Indices of the padded rows or columns by length, padding and border mode.
+    number_of_allocations: int
+        Number of buffers allocated so far.
+
+    Methods
+    -------
+    get_buffer
+        Return a buffer of a shape, allocating it only if necessary.
+    get_number_of_allocations
+        Return the number of buffers allocated so far.
+    get_number_of_bytes
+        Return the number of bytes of all buffers.
+    clear
+        Release all buffers.
+    check_border_mode
+        Check whether a border mode is supported.
+    get_indices
+        Return the indices of the gray values of each padded row or column.
+    pad
+        Pad gray values into a buffer according to a border mode.
+
+    Notes
+    -----
+    The border modes are 'wrap' (the windows at the upper and left border continue
+    at the opposite border, as in Image.traverse), 'crop' (only positions whose
+    windows lie inside the image), 'reflect' (mirrored at the border pixel without
+    repeating it), 'replicate' (the border pixel is repeated) and 'constant' (a
+    constant value outside the image).
+
+    The buffers returned by the arena are overwritten when they are requested
+    again, so that results that are kept must be copied.
+
+    """
+
+    # Supported border modes
+    BORDER_MODES: tuple[str, ...] = ("wrap", "crop", "reflect", "replicate",
+                                     "constant")
+
+    def __init__(self) -> None:
+        """Construct one WorkspaceArena object without buffers."""
+        self.buffers: dict[str, np.ndarray] = {}
+        self.indices: dict[tuple[int, int, str], np.ndarray] = {}
+        self.number_of_allocations: int = 0
+
+    def get_buffer(self, name: str, shape: tuple[int, ...],
+                   dtype: type = np.float64) -> np.ndarray:
+        """
+        Return a buffer of a shape, allocating it only if necessary.
+
+        Parameters
+        ----------
+        name: str
+            Name of the buffer.
+        shape: tuple[int, ...]
+            Shape of the buffer.
+        dtype: type
+            Data type of the buffer. The default value is np.float64.
+
+        Returns
+        -------
+        np.ndarray
+            Uninitialized buffer, possibly a view on the beginning of a larger one.
+
+        """
+        buffer: np.ndarray | None = self.buffers.get(name)
+
+        if (buffer is None or buffer.dtype != np.dtype(dtype)
+                or buffer.ndim != len(shape)
+                or any(available < needed
+                       for available, needed in zip(buffer.shape, shape))):
+            buffer = np.empty(shape, dtype=dtype)
+            self.buffers[name] = buffer
+            self.number_of_allocations += 1
+
+        return buffer[tuple(slice(0, size) for size in shape)]
+
+    def get_number_of_allocations(self) -> int:
+        """
+        Return the number of buffers allocated so far.
+
+        Returns
+        -------
+        self.number_of_allocations: int
+            Number of buffers allocated so far.
+
+        """
+        return self.number_of_allocations
+
+    def get_number_of_bytes(self) -> int:
+        """
+        Return the number of bytes of all buffers.
+
+        Returns
+        -------
+        int
+            Number of bytes of all buffers.
+
+        """
+        return sum(buffer.nbytes for buffer in self.buffers.values())
+
+    def clear(self) -> None:
+        """Release all buffers."""
+        self.buffers.clear()
+        self.indices.clear()
+
+    @staticmethod
+    def check_border_mode(border_mode: str) -> None:
+        """
+        Check whether a border mode is supported.
+
+        Parameters
+        ----------
+        border_mode: str
+            Border mode.
+
+        Raises
+        ------
+        ValueError
+            If the border mode is not supported.
+
+        """
+        if border_mode not in WorkspaceArena.BORDER_MODES:
+            raise ValueError(f"Unknown border mode '{border_mode}', expected one of "
+                             f"{', '.join(WorkspaceArena.BORDER_MODES)}.")
+
+    def get_indices(self, length: int, padding: int, border_mode: str) -> np.ndarray:
+        """
+        Return the indices of the gray values of each padded row or column.
+
+        Parameters
+        ----------
+        length: int
+            Number of rows or columns of the image.
+        padding: int
+            Number of rows or columns added on each side.
+        border_mode: str
+            Border mode. Outside the image, the modes 'crop' and 'constant' use the
+            indices of the border, which are overwritten afterwards.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the length plus twice the padding.
+
+        """
+        key: tuple[int, int, str] = (length, padding, border_mode)
+
+        if key not in self.indices:
+            if border_mode == "wrap":
+                self.indices[key] = np.pad(np.arange(length), padding, mode="wrap")
+            elif border_mode == "reflect":
+                self.indices[key] = np.pad(np.arange(length), padding, mode="reflect")
+            else:
+                self.indices[key] = np.pad(np.arange(length), padding, mode="edge")
+
+        return self.indices[key]
+
+    def pad(self, gray_plane: np.ndarray, padding: int, options: BorderOptions,
+            name: str = "padded") -> np.ndarray:
+        """
+        Pad gray values into a buffer according to a border mode.
+
+        Parameters
+        ----------
+        gray_plane: np.ndarray
+            Gray values with the rows and columns as the last two dimensions.
+        padding: int
+            Number of rows and columns added on each side.
+        options: BorderOptions
+            Border mode and value outside the image in the mode 'constant'. In the
+            mode 'crop', the padding is filled with zeros, as it is not used. The
+            arena of the options is not used, the buffer is one of this arena.
+        name: str
+            Name of the buffer. The default value is 'padded'.
+
+        Returns
+        -------
+        padded: np.ndarray
+            Padded gray values as float64.
+
+        """
+        border_mode: str = options.border_mode
+
+        size: tuple[int, int] = (gray_plane.shape[-2], gray_plane.shape[-1])
+        leading: tuple[int, ...] = gray_plane.shape[:-2]
+
+        # Pad the rows into an intermediate buffer and the columns into the result
+        rows: np.ndarray = self.get_buffer(
+            name + ":rows", leading + (size[0] + 2 * padding, size[1]))
+        padded: np.ndarray = self.get_buffer(
+            name, leading + (size[0] + 2 * padding, size[1] + 2 * padding))
+
+        np.take(gray_plane, self.get_indices(size[0], padding, border_mode), axis=-2,
+                out=rows, mode="clip")
+        np.take(rows, self.get_indices(size[1], padding, border_mode), axis=-1,
+                out=padded, mode="clip")
+
+        if border_mode in ("crop", "constant") and padding > 0:
+            value: float = options.constant_value if border_mode == "constant" else 0.0
+            padded[..., :padding, :] = value
+            padded[..., size[0] + padding:, :] = value
+            padded[..., :, :padding] = value
+            padded[..., :, size[1] + padding:] = value
+
+        return padded
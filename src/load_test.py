@@ -0,0 +1,130 @@
+"""Load test of the local edge detection service."""
+
+import sys
+
+# Import for parsing the arguments
+import argparse
+
+# Imports for sending the requests concurrently
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Import for evaluating the latencies
+import statistics
+
+# Import used classes
+from classes.edge_detection_client import EdgeDetectionClient
+
+def send_requests(client: EdgeDetectionClient, images: list[bytes], filters: list[str],
+                  number_of_requests: int) -> list[tuple[float, float]]:
+    """
+    Send requests one after another and measure their latencies.
+
+    Parameters
+    ----------
+    client: EdgeDetectionClient
+        Client used to send the requests.
+    images: list[bytes]
+        Encoded images that are sent in turn.
+    filters: list[str]
+        Names of the requested filters.
+    number_of_requests: int
+        Number of sent requests.
+
+    Returns
+    -------
+    latencies: list[tuple[float, float]]
+        Latency of each request measured by the client and by the service in
+        milliseconds.
+
+    """
+    latencies: list[tuple[float, float]] = []
+
+    for count in range(number_of_requests):
+        start: float = time.perf_counter()
+        _, service_latency = client.detect(images[count % len(images)], filters)
+        latencies.append(((time.perf_counter() - start) * 1000, service_latency))
+
+    return latencies
+
+def print_summary(latencies: list[tuple[float, float]], seconds: float) -> None:
+    """
+    Print the throughput and the percentiles of the latencies.
+
+    Parameters
+    ----------
+    latencies: list[tuple[float, float]]
+        Latency of each request measured by the client and by the service in
+        milliseconds.
+    seconds: float
+        Time in seconds needed for all requests.
+
+    """
+    # Print the throughput and the latencies
+    client_latencies: list[float] = sorted(latency[0] for latency in latencies)
+    service_latencies: list[float] = sorted(latency[1] for latency in latencies)
+
+    print(f"Requests: {len(latencies)} in {seconds:.2f} s "
+          f"({len(latencies) / seconds:.2f} requests/s)")
+
+    for name, values in (("Client", client_latencies), ("Service", service_latencies)):
+        percentiles: list[float] = [
+            values[min(int(len(values) * percent / 100), len(values) - 1)]
+            for percent in (50, 95, 99)]
+        print(f"{name} latency [ms]: mean {statistics.mean(values):.1f}, "
+              f"p50 {percentiles[0]:.1f}, p95 {percentiles[1]:.1f}, "
+              f"p99 {percentiles[2]:.1f}")
+
+def main() -> int:
+    """Execute the load test and print the throughput and latencies."""
+    parser = argparse.ArgumentParser(description="Load test of the edge detection "
+                                                 "service.")
+    parser.add_argument("images", nargs="*", default=None,
+                        help="images to send (default: all images in ../images/)")
+    parser.add_argument("--host", default="127.0.0.1", help="host of the service")
+    parser.add_argument("--port", type=int, default=8080, help="port of the service")
+    parser.add_argument("--socket", default=None,
+                        help="Unix socket of the service instead of host and port")
+    parser.add_argument("--filters", default="differential",
+                        help="comma separated names of the requested filters")
+    parser.add_argument("--clients", type=int, default=4,
+                        help="number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=8,
+                        help="number of requests per client")
+    arguments = parser.parse_args()
+
+    paths: list[str] = arguments.images or [
+        os.path.join("./../images/", name) for name in os.listdir("./../images/")]
+    images: list[bytes] = []
+
+    for path in paths:
+        with open(path, "rb") as file:
+            images.append(file.read())
+
+    client = EdgeDetectionClient(arguments.host, arguments.port, arguments.socket)
+
+    if not client.is_healthy():
+        print("Service is not reachable.")
+        return 1
+
+    # Send the requests of all clients concurrently
+    start: float = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=arguments.clients) as executor:
+        results = list(executor.map(
+            lambda _: send_requests(client, images, arguments.filters.split(","),
+                                    arguments.requests),
+            range(arguments.clients)))
+
+    seconds: float = time.perf_counter() - start
+    latencies: list[tuple[float, float]] = [latency for result in results
+                                            for latency in result]
+
+    print_summary(latencies, seconds)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""Configuration of the tests, making the modules of src importable."""
+
+# Imports for adding src to the module search path
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir, "src"))
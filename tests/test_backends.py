@@ -0,0 +1,34 @@
+"""Tests comparing every available backend with the reference backend."""
+
+# Imports for loading the filters of the application
+import importlib.util
+import os
+
+# Import for parametrizing the tests
+import pytest
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.compute_backend import ComputeBackend
+from classes.backend_registry import BACKENDS, BackendRegistry
+
+# Load the filters of the application without running it
+SPEC = importlib.util.spec_from_file_location(
+    "edge_detection", os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   os.pardir, "src", "__main__.py"))
+APPLICATION = importlib.util.module_from_spec(SPEC)
+SPEC.loader.exec_module(APPLICATION)
+DIFFERENTIAL_FILTERS: dict[str, Matrix] = APPLICATION.DIFFERENTIAL_FILTERS
+
+@pytest.mark.parametrize("name", list(DIFFERENTIAL_FILTERS))
+@pytest.mark.parametrize("backend", BACKENDS.get_available(),
+                         ids=lambda backend: backend.get_name())
+def test_backend_matches_reference(backend: ComputeBackend, name: str) -> None:
+    """Check the gradients and absolute values of a backend and filter."""
+    assert (BACKENDS.check_conformance(backend, [DIFFERENTIAL_FILTERS[name]])
+            <= BackendRegistry.TOLERANCE)
+
+def test_deviation_rejects_different_shapes() -> None:
+    """Check that results of different shapes are not compared partially."""
+    with pytest.raises(ValueError):
+        BackendRegistry.get_deviation([[1.0, 2.0], [3.0, 4.0]], [[1.0, 2.0]])